@@ -0,0 +1,26 @@
+"""solr doc content hash
+
+Revision ID: 5e3b1c7d9a24
+Revises: 0ba810e98e41
+Create Date: 2026-10-18 10:15:12.482913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e3b1c7d9a24'
+down_revision = '0ba810e98e41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('solr_docs', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('solr_docs', schema=None) as batch_op:
+        batch_op.drop_column('content_hash')
@@ -0,0 +1,98 @@
+"""solr history composite indexes and solr_doc_events partitions
+
+DOWNTIME: solr_doc_events is copied into the new partitioned table in a single transaction that holds an ACCESS
+EXCLUSIVE lock on it until the copy is done, so the update endpoint and the sync jobs / workers block (and may time
+out) for the duration. Stop them (and run compact-solr-history first to shrink the copy) before upgrading.
+
+Revision ID: 8c2f4a6e1b37
+Revises: 5e3b1c7d9a24
+Create Date: 2026-10-18 14:22:36.105247
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '8c2f4a6e1b37'
+down_revision = '5e3b1c7d9a24'
+branch_labels = None
+depends_on = None
+
+EVENT_COLUMNS = 'id, event_date, event_last_update, event_status, event_type, solr_doc_id'
+
+
+def upgrade():
+    # built concurrently so solr_docs stays writable while the index is created
+    with op.get_context().autocommit_block():
+        op.create_index('ix_solr_docs_identifier_submission_date', 'solr_docs', ['identifier', 'submission_date'],
+                        unique=False, postgresql_concurrently=True)
+
+    # recreate solr_doc_events partitioned by month on event_date (the partition key must be part of the pkey)
+    # NOTE: blocks all reads / writes of solr_doc_events until the copy below is committed (see DOWNTIME above)
+    op.execute('UPDATE solr_doc_events SET event_date = COALESCE(event_last_update, now()) WHERE event_date IS NULL')
+    op.execute('ALTER TABLE solr_doc_events RENAME TO solr_doc_events_old')
+    op.execute('ALTER TABLE solr_doc_events_old RENAME CONSTRAINT solr_doc_events_pkey TO solr_doc_events_old_pkey')
+    op.execute('ALTER INDEX ix_solr_doc_events_solr_doc_id RENAME TO ix_solr_doc_events_old_solr_doc_id')
+    op.execute("""
+        CREATE TABLE solr_doc_events (
+            id INTEGER NOT NULL DEFAULT nextval('solr_doc_events_id_seq'),
+            event_date TIMESTAMP WITH TIME ZONE NOT NULL,
+            event_last_update TIMESTAMP WITH TIME ZONE,
+            event_status solrdoceventstatus,
+            event_type solrdoceventtype NOT NULL,
+            solr_doc_id INTEGER REFERENCES solr_docs (id),
+            CONSTRAINT solr_doc_events_pkey PRIMARY KEY (id, event_date)
+        ) PARTITION BY RANGE (event_date)
+    """)
+    op.execute('ALTER SEQUENCE solr_doc_events_id_seq OWNED BY solr_doc_events.id')
+    op.execute('CREATE TABLE solr_doc_events_default PARTITION OF solr_doc_events DEFAULT')
+    # monthly partitions from the first event until a few months ahead (the compaction job adds the next ones)
+    op.execute("""
+        DO $$
+        DECLARE
+            month_start DATE := date_trunc('month', COALESCE((SELECT min(event_date) FROM solr_doc_events_old), now()));
+        BEGIN
+            WHILE month_start <= date_trunc('month', now()) + INTERVAL '3 months' LOOP
+                EXECUTE format('CREATE TABLE solr_doc_events_y%sm%s PARTITION OF solr_doc_events '
+                               'FOR VALUES FROM (%L) TO (%L)',
+                               to_char(month_start, 'YYYY'), to_char(month_start, 'MM'),
+                               month_start, month_start + INTERVAL '1 month');
+                month_start := month_start + INTERVAL '1 month';
+            END LOOP;
+        END $$;
+    """)
+    op.execute(f'INSERT INTO solr_doc_events ({EVENT_COLUMNS}) SELECT {EVENT_COLUMNS} FROM solr_doc_events_old')
+    op.execute('DROP TABLE solr_doc_events_old')
+    op.create_index('ix_solr_doc_events_solr_doc_id', 'solr_doc_events', ['solr_doc_id'], unique=False)
+    op.create_index('ix_solr_doc_events_status_type_date', 'solr_doc_events',
+                    ['event_status', 'event_type', 'event_date'], unique=False)
+
+
+def downgrade():
+    # recreate the unpartitioned solr_doc_events
+    op.execute('ALTER TABLE solr_doc_events RENAME TO solr_doc_events_old')
+    op.execute('ALTER TABLE solr_doc_events_old RENAME CONSTRAINT solr_doc_events_pkey TO solr_doc_events_old_pkey')
+    op.execute('ALTER INDEX ix_solr_doc_events_solr_doc_id RENAME TO ix_solr_doc_events_old_solr_doc_id')
+    op.execute('ALTER INDEX ix_solr_doc_events_status_type_date RENAME TO ix_solr_doc_events_old_status_type_date')
+    op.create_table('solr_doc_events',
+    sa.Column('id', sa.Integer(), server_default=sa.text("nextval('solr_doc_events_id_seq')"), nullable=False),
+    sa.Column('event_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('event_last_update', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('event_status',
+              postgresql.ENUM('COMPLETE', 'ERROR', 'PENDING', name='solrdoceventstatus', create_type=False),
+              nullable=True),
+    sa.Column('event_type',
+              postgresql.ENUM('RESYNC', 'UPDATE', name='solrdoceventtype', create_type=False),
+              nullable=False),
+    sa.Column('solr_doc_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['solr_doc_id'], ['solr_docs.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute('ALTER SEQUENCE solr_doc_events_id_seq OWNED BY solr_doc_events.id')
+    op.execute(f'INSERT INTO solr_doc_events ({EVENT_COLUMNS}) SELECT {EVENT_COLUMNS} FROM solr_doc_events_old')
+    op.execute('DROP TABLE solr_doc_events_old')
+    op.create_index('ix_solr_doc_events_solr_doc_id', 'solr_doc_events', ['solr_doc_id'], unique=False)
+
+    op.drop_index('ix_solr_docs_identifier_submission_date', table_name='solr_docs')
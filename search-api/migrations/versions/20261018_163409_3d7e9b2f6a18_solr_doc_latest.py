@@ -0,0 +1,45 @@
+"""solr doc latest
+
+Revision ID: 3d7e9b2f6a18
+Revises: 8c2f4a6e1b37
+Create Date: 2026-10-18 16:34:09.215774
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3d7e9b2f6a18'
+down_revision = '8c2f4a6e1b37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('solr_doc_latest',
+    sa.Column('identifier', sa.String(length=10), nullable=False),
+    sa.Column('solr_doc_id', sa.Integer(), nullable=False),
+    sa.Column('submission_date', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['solr_doc_id'], ['solr_docs.id'], ),
+    sa.PrimaryKeyConstraint('identifier')
+    )
+    # backfill with the most recently submitted doc of each identifier
+    op.execute("""
+        INSERT INTO solr_doc_latest (identifier, solr_doc_id, submission_date)
+        SELECT DISTINCT ON (identifier) identifier, id, submission_date
+        FROM solr_docs
+        WHERE submission_date IS NOT NULL
+        ORDER BY identifier, submission_date DESC, id DESC
+    """)
+    with op.batch_alter_table('solr_doc_latest', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_solr_doc_latest_solr_doc_id'), ['solr_doc_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_solr_doc_latest_submission_date'), ['submission_date'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('solr_doc_latest', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_solr_doc_latest_submission_date'))
+        batch_op.drop_index(batch_op.f('ix_solr_doc_latest_solr_doc_id'))
+
+    op.drop_table('solr_doc_latest')
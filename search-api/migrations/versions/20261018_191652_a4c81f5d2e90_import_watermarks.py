@@ -0,0 +1,29 @@
+"""import watermarks
+
+Revision ID: a4c81f5d2e90
+Revises: 3d7e9b2f6a18
+Create Date: 2026-10-18 19:16:52.604117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4c81f5d2e90'
+down_revision = '3d7e9b2f6a18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('import_watermarks',
+    sa.Column('source', sa.String(length=20), nullable=False),
+    sa.Column('watermark', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('last_update', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('source')
+    )
+
+
+def downgrade():
+    op.drop_table('import_watermarks')
@@ -22,7 +22,7 @@ from cloud_sql_connector import setup_pg8000_close_event_listener
 from flask import Flask, Response, current_app, request
 from flask_migrate import Migrate
 
-from search_api import errorhandlers, models
+from search_api import cli, errorhandlers, models
 from search_api.config import DevelopmentConfig, MigrationConfig, ProductionConfig, UnitTestingConfig
 from search_api.models import db
 from search_api.resources import internal_bp, meta_bp, ops_bp, v1_endpoint, v2_endpoint
@@ -64,6 +64,7 @@ def create_app(environment: str = os.getenv("DEPLOYMENT_ENV", "production"), **k
         Flags().init_app(app, td)
 
         errorhandlers.init_app(app)
+        cli.init_app(app)
         queue.init_app(app)
         business_solr.init_app(app)
         babel.init_app(app)
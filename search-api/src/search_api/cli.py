@@ -0,0 +1,61 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Flask cli commands for the search api (i.e. `flask sync-worker`)."""
+import click
+from flask import Flask, current_app
+from flask.cli import with_appcontext
+
+from search_api.request_handlers import AdaptiveBatchSize, compact_solr_history, run_sync_listener, run_sync_worker
+
+
+@click.command("sync-worker")
+@click.option("--batch-size", type=int, default=None, help="Initial batch size (default MAX_BATCH_UPDATE_NUM).")
+@click.option("--target-latency", type=float, default=None, help="Target seconds per batch.")
+@click.option("--listen", is_flag=True, help="Keep running and sync as soon as new events are notified.")
+@with_appcontext
+def sync_worker_command(batch_size: int | None, target_latency: float | None, listen: bool):
+    """Sync the pending solr doc events to solr until there are none left (or continuously with --listen)."""
+    config = current_app.config
+    adaptive_batch_size = AdaptiveBatchSize(initial=batch_size or config.get("MAX_BATCH_UPDATE_NUM"),
+                                            minimum=config.get("SYNC_WORKER_MIN_BATCH"),
+                                            maximum=config.get("SYNC_WORKER_MAX_BATCH"),
+                                            target_latency=target_latency or config.get("SYNC_WORKER_TARGET_LATENCY"))
+    if listen:
+        run_sync_listener(adaptive_batch_size,
+                          config.get("SYNC_WORKER_MAX_FAILURES"),
+                          channel=config.get("SYNC_NOTIFY_CHANNEL"),
+                          batch_window=config.get("SYNC_LISTEN_BATCH_WINDOW"),
+                          poll_interval=config.get("SYNC_LISTEN_POLL_INTERVAL"))
+        return
+    totals = run_sync_worker(adaptive_batch_size, config.get("SYNC_WORKER_MAX_FAILURES"))
+    click.echo(f"Synced {totals['events']} events ({totals['docsSynced']} docs) in {totals['batches']} batches.")
+
+
+@click.command("compact-solr-history")
+@click.option("--retention-days", type=int, default=None,
+              help="Days of history to keep (default SOLR_HISTORY_RETENTION_DAYS).")
+@with_appcontext
+def compact_solr_history_command(retention_days: int | None):
+    """Delete the solr doc history outside the retention period (keeps the latest doc of each identifier)."""
+    config = current_app.config
+    stats = compact_solr_history(retention_days or config.get("SOLR_HISTORY_RETENTION_DAYS"),
+                                 config.get("SOLR_DOC_EVENT_CHUNK_SIZE"),
+                                 config.get("SOLR_DOC_EVENTS_PARTITIONS_AHEAD"))
+    click.echo(f"Deleted {stats['docsDeleted']} docs and {stats['eventsDeleted']} events.")
+
+
+def init_app(app: Flask):
+    """Register the cli commands with the app."""
+    app.cli.add_command(sync_worker_command)
+    app.cli.add_command(compact_solr_history_command)
@@ -39,10 +39,29 @@ class Config:
 
     # Used by /sync endpoint
     MAX_BATCH_UPDATE_NUM = int(os.getenv("MAX_BATCH_UPDATE_NUM", "1000"))
+    # Used by /sync and /resync for bulk solr doc event inserts / status updates
+    SOLR_DOC_EVENT_CHUNK_SIZE = int(os.getenv("SOLR_DOC_EVENT_CHUNK_SIZE", "1000"))
+    # Used by the sync-worker cli command
+    SYNC_WORKER_MIN_BATCH = int(os.getenv("SYNC_WORKER_MIN_BATCH", "10"))
+    SYNC_WORKER_MAX_BATCH = int(os.getenv("SYNC_WORKER_MAX_BATCH", "5000"))
+    SYNC_WORKER_TARGET_LATENCY = float(os.getenv("SYNC_WORKER_TARGET_LATENCY", "2"))  # seconds per batch
+    SYNC_WORKER_MAX_FAILURES = int(os.getenv("SYNC_WORKER_MAX_FAILURES", "3"))  # consecutive failed batches
+    # Used by /sync and the sync-worker cli command (ERROR events are retried after this delay)
+    SYNC_ERROR_RETRY_DELAY = int(os.getenv("SYNC_ERROR_RETRY_DELAY", "300"))  # seconds
+    # Used by the compact-solr-history cli command
+    SOLR_HISTORY_RETENTION_DAYS = int(os.getenv("SOLR_HISTORY_RETENTION_DAYS", "90"))
+    SOLR_DOC_EVENTS_PARTITIONS_AHEAD = int(os.getenv("SOLR_DOC_EVENTS_PARTITIONS_AHEAD", "3"))  # months
+    # Used by the update endpoint / sync-worker --listen (postgres LISTEN/NOTIFY)
+    SYNC_NOTIFY_ENABLED = os.getenv("SYNC_NOTIFY_ENABLED", "False") == "True"
+    SYNC_NOTIFY_CHANNEL = os.getenv("SYNC_NOTIFY_CHANNEL", "solr_doc_events")
+    SYNC_LISTEN_BATCH_WINDOW = float(os.getenv("SYNC_LISTEN_BATCH_WINDOW", "0.2"))  # seconds
+    SYNC_LISTEN_POLL_INTERVAL = float(os.getenv("SYNC_LISTEN_POLL_INTERVAL", "30"))  # seconds
     # Used by /sync heartbeat
     LAST_REPLICATION_THRESHOLD = int(os.getenv("LAST_REPLICATION_THRESHOLD", "24"))  # hours
-    # Used by /businesses/bulk endpoint (NOTE: this value must be less than the solr instance max boolean clauses - default: 1024)
+    # Used by /businesses/bulk endpoint
     MAX_BULK_SEARCH_VALUES = int(os.getenv("MAX_BULK_SEARCH_VALUES", "1000"))
+    BULK_SEARCH_CHUNK_SIZE = int(os.getenv("BULK_SEARCH_CHUNK_SIZE", "100"))  # names + identifiers per solr call
+    BULK_SEARCH_WORKERS = int(os.getenv("BULK_SEARCH_WORKERS", "4"))  # concurrent solr calls per request
 
     SOLR_SVC_BUS_LEADER_CORE = os.getenv("SOLR_SVC_BUS_LEADER_CORE", "business")
     SOLR_SVC_BUS_FOLLOWER_CORE = os.getenv("SOLR_SVC_BUS_FOLLOWER_CORE", "business_follower")
@@ -52,6 +71,20 @@ class Config:
     # Retry settings
     SOLR_RETRY_TOTAL = int(os.getenv("SOLR_RETRY_TOTAL", "2"))
     SOLR_RETRY_BACKOFF_FACTOR = int(os.getenv("SOLR_RETRY_BACKOFF_FACTOR", "5"))
+    # Connection pool settings (per solr node, per worker process)
+    SOLR_POOL_MAXSIZE = int(os.getenv("SOLR_POOL_MAXSIZE", "10"))
+    SOLR_POOL_BLOCK = os.getenv("SOLR_POOL_BLOCK", "False") == "True"
+    SOLR_KEEP_ALIVE_IDLE = int(os.getenv("SOLR_KEEP_ALIVE_IDLE", "60"))  # seconds (0 disables tcp keep-alive)
+    # Search query cache settings (per worker process, 0 disables the cache)
+    SOLR_QUERY_CACHE_SIZE = int(os.getenv("SOLR_QUERY_CACHE_SIZE", "1000"))  # entries
+    SOLR_QUERY_CACHE_TTL = int(os.getenv("SOLR_QUERY_CACHE_TTL", "300"))  # seconds
+    SOLR_QUERY_CACHE_GENERATION_INTERVAL = int(os.getenv("SOLR_QUERY_CACHE_GENERATION_INTERVAL", "10"))  # seconds
+
+    # Should match maxBooleanClauses in solrconfig.xml (queries estimated over this are simplified)
+    SOLR_MAX_CLAUSE_COUNT = int(os.getenv("SOLR_MAX_CLAUSE_COUNT", "1024"))
+    # Commit settings (hard, soft, within or explicit)
+    SOLR_COMMIT_WITHIN = int(os.getenv("SOLR_COMMIT_WITHIN", "1000"))  # ms
+    SYNC_COMMIT_POLICY = os.getenv("SYNC_COMMIT_POLICY", "within")  # /sync, /resync and the sync worker
 
     PAYMENT_SVC_URL = os.getenv("PAY_API_URL", "http://") + os.getenv("PAY_API_VERSION", "/api/v1")
     AUTH_SVC_URL = os.getenv("AUTH_API_URL", "http://") + os.getenv("AUTH_API_VERSION", "/api/v1")
@@ -214,6 +247,7 @@ class UnitTestingConfig(Config):  # pylint: disable=too-few-public-methods
     SOLR_SVC_BUS_LEADER_URL = os.getenv("SOLR_SVC_BUS_LEADER_TEST_URL", "http://localhost:8980/solr")
     SOLR_SVC_BUS_FOLLOWER_URL = os.getenv("SOLR_SVC_BUS_FOLLOWER_TEST_URL", "http://localhost:8980/solr")
     SOLR_RETRY_TOTAL = 0
+    SOLR_QUERY_CACHE_SIZE = 0
     # POSTGRESQL
     DB_USER = os.getenv("DATABASE_TEST_USERNAME", "")
     DB_PASSWORD = os.getenv("DATABASE_TEST_PASSWORD", "")
@@ -16,8 +16,11 @@
 from .db import db
 from .document import Document
 from .document_access_request import DocumentAccessRequest
+from .import_watermark import ImportWatermark
 from .solr_doc import SolrDoc
 from .solr_doc_event import SolrDocEvent
+from .solr_doc_latest import SolrDocLatest
 from .user import User, UserRoles
 
-__all__ = ("Document", "DocumentAccessRequest", "SolrDoc", "SolrDocEvent", "User", "db")
+__all__ = ("Document", "DocumentAccessRequest", "ImportWatermark", "SolrDoc", "SolrDocEvent", "SolrDocLatest", "User",
+           "db")
@@ -0,0 +1,51 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tracks the high-water mark of each importer data source (used for the delta imports)."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from search_api.utils.util import utcnow
+
+from .db import db
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+class ImportWatermark(db.Model):
+    """Used to hold the point up to which the data of an import source has been imported."""
+
+    __tablename__ = "import_watermarks"
+
+    source = db.Column(db.String(20), primary_key=True)
+    watermark = db.Column(db.DateTime(timezone=True), nullable=False)
+    last_update = db.Column(db.DateTime(timezone=True), default=utcnow, onupdate=utcnow)
+
+    @property
+    def json(self) -> dict:
+        """Return a dict of this object, with keys in JSON format."""
+        return {"source": self.source, "watermark": self.watermark.isoformat()}
+
+    @classmethod
+    def get_all(cls) -> list[ImportWatermark]:
+        """Return the watermarks of all the sources."""
+        return cls.query.order_by(cls.source).all()
+
+    @classmethod
+    def set_watermarks(cls, watermarks: dict[str, datetime]) -> list[ImportWatermark]:
+        """Create or update the watermark of each given source (in a single transaction)."""
+        updated = [db.session.merge(cls(source=source, watermark=watermark)) for source, watermark in watermarks.items()]
+        db.session.commit()
+        return updated
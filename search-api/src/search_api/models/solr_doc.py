@@ -14,14 +14,20 @@
 """Manages solr doc updates made to the Search Core (tracks updates made via the api)."""
 from __future__ import annotations
 
+import hashlib
+import json
 from typing import TYPE_CHECKING
 
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import backref
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.orm import aliased, backref
 
+from search_api.enums import SolrDocEventStatus, SolrDocEventType
 from search_api.utils.util import utcnow
 
 from .db import db
+from .solr_doc_event import SolrDocEvent
+from .solr_doc_latest import SolrDocLatest
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -30,11 +36,13 @@ class SolrDoc(db.Model):
     """Used to hold the solr doc information."""
 
     __tablename__ = "solr_docs"
+    __table_args__ = (db.Index("ix_solr_docs_identifier_submission_date", "identifier", "submission_date"),)
 
     id = db.Column(db.Integer, primary_key=True)
     doc = db.Column(JSONB)
     identifier = db.Column(db.String(10), nullable=False, index=True)
     submission_date = db.Column(db.DateTime(timezone=True), default=utcnow, index=True)
+    content_hash = db.Column(db.String(64))
     _submitter_id = db.Column("submitter_id", db.Integer, db.ForeignKey("users.id"))
 
     submitter = db.relationship("User", backref=backref("submitter", uselist=False), foreign_keys=[_submitter_id])
@@ -44,22 +52,117 @@ class SolrDoc(db.Model):
     @classmethod
     def find_most_recent_by_identifier(cls, identifier: str) -> SolrDoc:
         """Return most recently submitted SolrDoc by identifier."""
-        return cls.query.filter_by(identifier=identifier).order_by(cls.submission_date.desc()).first()
+        return (cls.query.join(SolrDocLatest, SolrDocLatest.solr_doc_id == cls.id)
+                .filter(SolrDocLatest.identifier == identifier)
+                .one_or_none())
+
+    @classmethod
+    def find_most_recent_by_identifiers(cls, identifiers: list[str]) -> dict[str, SolrDoc]:
+        """Return the most recently submitted SolrDoc for each identifier (in a single query)."""
+        if not identifiers:
+            return {}
+        docs = (cls.query.join(SolrDocLatest, SolrDocLatest.solr_doc_id == cls.id)
+                .filter(SolrDocLatest.identifier.in_(set(identifiers)))
+                .all())
+        return {doc.identifier: doc for doc in docs}
+
+    @classmethod
+    def find_last_applied_by_identifiers(cls, identifiers: list[str]) -> dict[str, SolrDoc]:
+        """Return the most recently submitted SolrDoc with a COMPLETE event for each identifier."""
+        if not identifiers:
+            return {}
+        docs = (cls.query.filter(cls.identifier.in_(set(identifiers)))
+                .filter(cls.solr_doc_events.any(SolrDocEvent.event_status == SolrDocEventStatus.COMPLETE))
+                .distinct(cls.identifier)
+                .order_by(cls.identifier, cls.submission_date.desc(), cls.id.desc())
+                .all())
+        return {doc.identifier: doc for doc in docs}
 
     @classmethod
     def get_by_id(cls, doc_id: int) -> SolrDoc:
         """Return the solr doc by its ID."""
         return cls.query.filter_by(id=doc_id).one_or_none()
 
+    @staticmethod
+    def get_canonical_content(doc: dict) -> dict:
+        """Return the doc content with its parties in a canonical order."""
+        content = {**doc}
+        if isinstance(parties := content.get("parties"), list):
+            content["parties"] = sorted(parties, key=lambda party: json.dumps(party, sort_keys=True, default=str))
+        return content
+
+    @staticmethod
+    def get_content_hash(doc: dict) -> str:
+        """Return the canonical hash of the doc content (key and party order do not matter)."""
+        canonical = json.dumps(SolrDoc.get_canonical_content(doc), sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    @staticmethod
+    def get_identifiers_by_ids(doc_ids: list[int]) -> dict[int, str]:
+        """Return the identifier of each given SolrDoc id (in a single query)."""
+        if not doc_ids:
+            return {}
+        return dict(db.session.query(SolrDoc.id, SolrDoc.identifier).filter(SolrDoc.id.in_(set(doc_ids))).all())
+
     @staticmethod
     def get_updated_identifiers_after_date(date: datetime) -> list[str]:
         """Return all identifiers with a submitted SolrDoc after the date."""
-        return [x[0] for x in db.session.query(SolrDoc.identifier)
-                .filter(SolrDoc.submission_date > date)
-                .group_by(SolrDoc.identifier).all()]
+        # the latest doc is after the date whenever any doc of the identifier is
+        return [x[0] for x in db.session.query(SolrDocLatest.identifier)
+                .filter(SolrDocLatest.submission_date > date).all()]
+
+    @classmethod
+    def delete_history(cls, before: datetime, chunk_size: int) -> int:
+        """Delete the docs (and their events) submitted before the date (one transaction per chunk).
+
+        The latest doc of each identifier and docs with PENDING / ERROR events are always kept.
+        """
+        newer = aliased(cls)
+        stale_docs = (db.session.query(cls.id)
+                      .filter(cls.submission_date < before)
+                      # superseded by a newer doc for the same identifier
+                      .filter(db.session.query(newer.id)
+                              .filter(newer.identifier == cls.identifier,
+                                      tuple_(newer.submission_date, newer.id) > tuple_(cls.submission_date, cls.id))
+                              .exists())
+                      .filter(~cls.solr_doc_events.any(SolrDocEvent.event_status != SolrDocEventStatus.COMPLETE))
+                      .filter(~db.session.query(SolrDocLatest.identifier)
+                              .filter(SolrDocLatest.solr_doc_id == cls.id)
+                              .exists())
+                      .limit(chunk_size))
+        deleted = 0
+        while doc_ids := [doc_id for (doc_id,) in stale_docs.all()]:
+            SolrDocEvent.query.filter(SolrDocEvent.solr_doc_id.in_(doc_ids)).delete(synchronize_session=False)
+            deleted += cls.query.filter(cls.id.in_(doc_ids)).delete(synchronize_session=False)
+            db.session.commit()
+        return deleted
+
+    @classmethod
+    def rebuild_latest(cls):
+        """Rebuild the latest doc of each identifier (i.e. after loading solr_docs outside of save)."""
+        # DISTINCT ON (identifier) keeps the first row per identifier in the order by
+        latest = (select(cls.identifier, cls.id, cls.submission_date)
+                  .distinct(cls.identifier)
+                  .order_by(cls.identifier, cls.submission_date.desc(), cls.id.desc()))
+        stmt = insert(SolrDocLatest).from_select(["identifier", "solr_doc_id", "submission_date"], latest)
+        db.session.execute(stmt.on_conflict_do_update(
+            index_elements=[SolrDocLatest.identifier],
+            set_={"solr_doc_id": stmt.excluded.solr_doc_id, "submission_date": stmt.excluded.submission_date}))
+        db.session.commit()
+
+    def is_pending(self) -> bool:
+        """Return True if the doc has an UPDATE event that is not applied to solr yet (PENDING / ERROR)."""
+        unapplied = self.solr_doc_events.filter(SolrDocEvent.event_type == SolrDocEventType.UPDATE,
+                                                SolrDocEvent.event_status.in_([SolrDocEventStatus.PENDING,
+                                                                               SolrDocEventStatus.ERROR]))
+        return db.session.query(unapplied.exists()).scalar()
 
     def save(self) -> SolrDoc:
-        """Store the update into the db."""
+        """Store the update into the db (and track it as the latest doc of the identifier in the same transaction)."""
+        if self.doc is not None:
+            self.content_hash = self.get_content_hash(self.doc)
         db.session.add(self)
+        db.session.flush()
+        SolrDocLatest.upsert(self.identifier, self.id, self.submission_date)
         db.session.commit()
         return self
@@ -16,7 +16,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import event
+from sqlalchemy import event, insert, or_, text, tuple_
+from sqlalchemy.orm import aliased
 
 from search_api.enums import SolrDocEventStatus, SolrDocEventType
 from search_api.utils.util import utcnow
@@ -31,29 +32,53 @@ class SolrDocEvent(db.Model):  # pylint: disable=too-few-public-methods
     """Used to hold event information for a solr doc."""
 
     __tablename__ = "solr_doc_events"
+    # NOTE: the table is partitioned by month on event_date in the db (see the migration / create_partitions)
+    __table_args__ = (db.Index("ix_solr_doc_events_status_type_date", "event_status", "event_type", "event_date"),)
 
-    id = db.Column(db.Integer, primary_key=True)
-    event_date = db.Column(db.DateTime(timezone=True), default=utcnow)
+    BULK_CHUNK_SIZE = 1000  # rows per statement / transaction for the bulk operations
+
+    # the partition key (event_date) is part of the primary key in the db
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    event_date = db.Column(db.DateTime(timezone=True), default=utcnow, primary_key=True)
     event_last_update = db.Column(db.DateTime(timezone=True), default=utcnow)
     event_status = db.Column(db.Enum(SolrDocEventStatus), default=SolrDocEventStatus.PENDING)
     event_type = db.Column(db.Enum(SolrDocEventType), nullable=False)
 
     solr_doc_id = db.Column(db.Integer, db.ForeignKey("solr_docs.id"), index=True)
 
-    def save(self) -> SolrDocEvent:
-        """Store the update into the db."""
+    def save(self, notify_channel: str | None = None) -> SolrDocEvent:
+        """Store the update into the db.
+
+        With a notify_channel a NOTIFY (payload is the event id) is sent in the same transaction so listening sync
+        workers pick up the event as soon as it is committed.
+        """
         db.session.add(self)
+        if notify_channel:
+            db.session.flush()
+            db.session.execute(text("SELECT pg_notify(:channel, :payload)"),
+                               {"channel": notify_channel, "payload": str(self.id)})
         db.session.commit()
         return self
 
     @classmethod
-    def get_events_by_status(cls,
+    def get_events_by_status(cls,  # noqa: PLR0913
                              statuses: list[SolrDocEventStatus],
                              event_type: SolrDocEventType | None = None,
                              start_date: datetime | None = None,
-                             limit: int | None = None) -> list[SolrDocEvent]:
-        """Update the status of the given events."""
+                             limit: int | None = None,
+                             *,
+                             skip_locked: bool = False,
+                             error_retry_before: datetime | None = None) -> list[SolrDocEvent]:
+        """Return the events with the given statuses.
+
+        With skip_locked the events are claimed (SELECT ... FOR UPDATE SKIP LOCKED) until the transaction ends so
+        that concurrent sync workers never pick up the same events. With error_retry_before, ERROR events are only
+        returned once their last failure is older than it (so a failing event is retried with a backoff).
+        """
         query = cls.query.filter(cls.event_status.in_(statuses))
+        if error_retry_before:
+            query = query.filter(or_(cls.event_status != SolrDocEventStatus.ERROR,
+                                     cls.event_last_update < error_retry_before))
         if event_type:
             query = query.filter(cls.event_type == event_type)
         if start_date:
@@ -62,16 +87,103 @@ class SolrDocEvent(db.Model):  # pylint: disable=too-few-public-methods
         query = query.order_by(cls.event_date)
         if limit:
             query = query.limit(limit)
+        if skip_locked:
+            query = query.with_for_update(skip_locked=True)
 
         return query.all()
 
     @classmethod
-    def update_events_status(cls, status: SolrDocEventStatus, events: list[SolrDocEvent]):
+    def bulk_create(cls,
+                    event_type: SolrDocEventType,
+                    solr_doc_ids: list[int],
+                    chunk_size: int | None = None) -> list[int]:
+        """Insert a PENDING event for each solr doc (one transaction per chunk) and return the new event ids."""
+        chunk_size = chunk_size or cls.BULK_CHUNK_SIZE
+        event_ids: list[int] = []
+        for i in range(0, len(solr_doc_ids), chunk_size):
+            now = utcnow()
+            rows = [{"event_type": event_type,
+                     "event_status": SolrDocEventStatus.PENDING,
+                     "event_date": now,
+                     "event_last_update": now,
+                     "solr_doc_id": solr_doc_id} for solr_doc_id in solr_doc_ids[i:i + chunk_size]]
+            event_ids.extend(db.session.execute(insert(cls).values(rows).returning(cls.id)).scalars())
+            db.session.commit()
+        return event_ids
+
+    @classmethod
+    def update_status_by_ids(cls, status: SolrDocEventStatus, event_ids: list[int], chunk_size: int | None = None):
+        """Update the status of the given event ids (one UPDATE and transaction per chunk)."""
+        chunk_size = chunk_size or cls.BULK_CHUNK_SIZE
+        for i in range(0, len(event_ids), chunk_size):
+            # bulk updates skip the before_update listener so event_last_update is set here
+            cls.query.filter(cls.id.in_(event_ids[i:i + chunk_size])).update(
+                {cls.event_status: status, cls.event_last_update: utcnow()}, synchronize_session="evaluate")
+            db.session.commit()
+
+    @classmethod
+    def update_events_status(cls,
+                             status: SolrDocEventStatus,
+                             events: list[SolrDocEvent],
+                             chunk_size: int | None = None):
         """Update the status of the given events."""
-        for doc_event in events:
-            doc_event.event_status = status
-            db.session.add(doc_event)
+        cls.update_status_by_ids(status, [doc_event.id for doc_event in events], chunk_size)
+
+    @classmethod
+    def delete_superseded(cls, before: datetime, chunk_size: int) -> int:
+        """Delete the COMPLETE events before the date that have a newer COMPLETE event for the same doc.
+
+        The latest COMPLETE event of each doc is kept so the last applied doc can still be found.
+        """
+        newer = aliased(cls)
+        superseded_events = (db.session.query(cls.id)
+                             .filter(cls.event_status == SolrDocEventStatus.COMPLETE, cls.event_date < before)
+                             .filter(db.session.query(newer.id)
+                                     .filter(newer.solr_doc_id == cls.solr_doc_id,
+                                             newer.event_status == SolrDocEventStatus.COMPLETE,
+                                             tuple_(newer.event_date, newer.id) > tuple_(cls.event_date, cls.id))
+                                     .exists())
+                             .limit(chunk_size))
+        deleted = 0
+        while event_ids := [event_id for (event_id,) in superseded_events.all()]:
+            deleted += cls.query.filter(cls.id.in_(event_ids)).delete(synchronize_session=False)
+            db.session.commit()
+        return deleted
+
+    @classmethod
+    def create_partitions(cls, start: datetime, months: int) -> list[str]:
+        """Create the missing monthly partitions from the start month and return the partition names.
+
+        Rows already written to the default partition for a new month are moved into it (postgres won't create a
+        partition while the default partition holds rows in its range). No-op if the table is not partitioned
+        (i.e. tables created with create_all).
+        """
+        is_partitioned = db.session.execute(
+            text("SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table)"),
+            {"table": cls.__tablename__}).first()
+        if not is_partitioned:
+            return []
+
+        partitions = []
+        year, month = start.year, start.month
+        for _ in range(months):
+            next_year, next_month = year + month // 12, month % 12 + 1
+            partition = f"{cls.__tablename__}_y{year}m{month:02}"
+            exists = db.session.execute(text("SELECT to_regclass(:partition)"), {"partition": partition}).scalar()
+            if not exists:
+                month_start, month_end = f"'{year}-{month:02}-01'", f"'{next_year}-{next_month:02}-01'"
+                db.session.execute(text(
+                    f"CREATE TABLE {partition} (LIKE {cls.__tablename__} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+                db.session.execute(text(
+                    f"WITH moved AS (DELETE FROM {cls.__tablename__}_default "
+                    f"WHERE event_date >= {month_start} AND event_date < {month_end} RETURNING *) "
+                    f"INSERT INTO {partition} SELECT * FROM moved"))
+                db.session.execute(text(f"ALTER TABLE {cls.__tablename__} ATTACH PARTITION {partition} "
+                                        f"FOR VALUES FROM ({month_start}) TO ({month_end})"))
+            partitions.append(partition)
+            year, month = next_year, next_month
         db.session.commit()
+        return partitions
 
 
 @event.listens_for(SolrDocEvent, "before_update")
@@ -0,0 +1,46 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tracks the most recently submitted solr doc of each identifier (the current state of the Search Core)."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import tuple_
+from sqlalchemy.dialects.postgresql import insert
+
+from .db import db
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+
+class SolrDocLatest(db.Model):  # pylint: disable=too-few-public-methods
+    """Used to hold the latest solr doc of each identifier (maintained by SolrDoc.save)."""
+
+    __tablename__ = "solr_doc_latest"
+
+    identifier = db.Column(db.String(10), primary_key=True)
+    solr_doc_id = db.Column(db.Integer, db.ForeignKey("solr_docs.id"), nullable=False, index=True)
+    submission_date = db.Column(db.DateTime(timezone=True), nullable=False, index=True)
+
+    @classmethod
+    def upsert(cls, identifier: str, solr_doc_id: int, submission_date: datetime):
+        """Point the identifier at the solr doc unless it already points at a newer one (does not commit)."""
+        stmt = insert(cls).values(identifier=identifier, solr_doc_id=solr_doc_id, submission_date=submission_date)
+        db.session.execute(stmt.on_conflict_do_update(
+            index_elements=[cls.identifier],
+            set_={"solr_doc_id": stmt.excluded.solr_doc_id, "submission_date": stmt.excluded.submission_date},
+            where=(tuple_(cls.submission_date, cls.solr_doc_id)
+                   <= tuple_(stmt.excluded.submission_date, stmt.excluded.solr_doc_id))))
+
@@ -12,4 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Exports request handler functions."""
-from .update_solr_handler import resync_business_solr, update_business_solr
+from .compaction import compact_solr_history
+from .sync_listener import listen, run_sync_listener, wait_for_notifications
+from .sync_worker import AdaptiveBatchSize, run_sync_worker
+from .update_solr_handler import resync_business_solr, sync_business_solr, update_business_solr
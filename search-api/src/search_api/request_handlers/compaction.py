@@ -0,0 +1,37 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Retention / compaction of the solr doc history."""
+from datetime import timedelta
+
+from flask import current_app
+
+from search_api.models import SolrDoc, SolrDocEvent
+from search_api.utils.util import utcnow
+
+
+def compact_solr_history(retention_days: int, chunk_size: int, partitions_ahead: int) -> dict:
+    """Delete the solr doc history older than the retention and create the upcoming event partitions.
+
+    Keeps the latest doc of each identifier, docs with PENDING / ERROR events and the latest COMPLETE event of each
+    remaining doc.
+    """
+    now = utcnow()
+    before = now - timedelta(days=retention_days)
+    current_app.logger.debug(f"Compacting solr doc history before {before.isoformat()}...")
+    docs_deleted = SolrDoc.delete_history(before, chunk_size)
+    events_deleted = SolrDocEvent.delete_superseded(before, chunk_size)
+    partitions = SolrDocEvent.create_partitions(now, partitions_ahead + 1)
+    stats = {"docsDeleted": docs_deleted, "eventsDeleted": events_deleted, "partitions": partitions}
+    current_app.logger.info(f"Solr doc history compacted: {stats}")
+    return stats
@@ -0,0 +1,82 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Near real time solr sync driven by postgres LISTEN/NOTIFY (with polling as the fallback)."""
+import time
+
+from flask import current_app
+
+from search_api.models import db
+
+from .sync_worker import AdaptiveBatchSize, run_sync_worker
+
+
+def listen(channel: str):
+    """Return a dedicated (autocommit) db connection listening on the channel.
+
+    The connection must be invalidated when done so it is not returned to the pool in listening mode.
+    """
+    pool_connection = db.engine.raw_connection()
+    connection = pool_connection.driver_connection
+    connection.autocommit = True
+    cursor = connection.cursor()
+    cursor.execute(f'LISTEN "{channel}"')
+    cursor.close()
+    return pool_connection
+
+
+def wait_for_notifications(pool_connection, timeout: float, interval: float = 0.1) -> int:
+    """Wait up to timeout seconds for notifications on the listening connection and return how many arrived.
+
+    The driver only reads the notification messages while handling a statement, so a cheap round trip is made
+    every interval seconds until there are notifications or the timeout is reached.
+    """
+    connection = pool_connection.driver_connection
+    deadline = time.monotonic() + timeout
+    while True:
+        cursor = connection.cursor()
+        cursor.execute("SELECT 1")
+        cursor.close()
+        if connection.notifications or (remaining := deadline - time.monotonic()) <= 0:
+            break
+        time.sleep(min(interval, remaining))
+    count = len(connection.notifications)
+    connection.notifications.clear()
+    return count
+
+
+def run_sync_listener(batch_size: AdaptiveBatchSize,  # noqa: PLR0913
+                      max_failures: int,
+                      *,
+                      channel: str,
+                      batch_window: float,
+                      poll_interval: float,
+                      max_runs: int | None = None):
+    """Sync pending events as soon as they are notified (micro batched over the window) or every poll interval.
+
+    The notifications are checked every batch window so they add no latency beyond the micro batching.
+    """
+    connection = listen(channel)
+    runs = 0
+    try:
+        while max_runs is None or runs < max_runs:
+            if notifications := wait_for_notifications(connection, poll_interval, batch_window):
+                # micro batch: let the events committed within the window join the same sync run
+                time.sleep(batch_window)
+                notifications += wait_for_notifications(connection, 0)
+                current_app.logger.debug(f"Received {notifications} solr doc event notifications.")
+            # no notifications within the poll interval still syncs (catches events written without a NOTIFY)
+            run_sync_worker(batch_size, max_failures)
+            runs += 1
+    finally:
+        connection.invalidate()
@@ -0,0 +1,80 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Long running solr sync worker that drains the pending solr doc events."""
+import time
+
+from flask import current_app
+
+from search_api.models import db
+
+from .update_solr_handler import sync_business_solr
+
+
+class AdaptiveBatchSize:
+    """Sizes the sync batches so each one takes roughly the target latency."""
+
+    def __init__(self, initial: int, minimum: int, maximum: int, target_latency: float):
+        """Initialize the batch size within the given bounds."""
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.size = self._clamp(initial)
+
+    def _clamp(self, size: float) -> int:
+        """Return the size within the min / max bounds."""
+        return max(self.minimum, min(self.maximum, int(size)))
+
+    def record(self, batch_size: int, latency: float):
+        """Adjust the size from the latency of a batch (grows / shrinks by at most 2x per batch)."""
+        if batch_size < self.size:
+            # partial batch (queue nearly drained) says nothing about the capacity
+            return
+        scale = self.target_latency / latency if latency > 0 else 2
+        self.size = self._clamp(batch_size * max(0.5, min(2, scale)))
+
+    def failed(self):
+        """Halve the size after a failed batch."""
+        self.size = self._clamp(self.size / 2)
+
+
+def run_sync_worker(batch_size: AdaptiveBatchSize, max_failures: int) -> dict:
+    """Sync batches of pending events to solr until there are none left and return the totals."""
+    totals = {"batches": 0, "events": 0, "docsSynced": 0, "atomicUpdates": 0, "eventsCoalesced": 0}
+    failures = 0
+    while True:
+        start = time.perf_counter()
+        try:
+            stats = sync_business_solr(batch_size.size)
+        except Exception as err:
+            # release the claimed events / any failed transaction before the next batch
+            db.session.rollback()
+            failures += 1
+            current_app.logger.error(f"Sync batch of {batch_size.size} failed ({failures}/{max_failures}): {err}")
+            if failures >= max_failures:
+                raise err
+            batch_size.failed()
+            continue
+
+        if not stats["events"]:
+            break
+        failures = 0
+        latency = time.perf_counter() - start
+        current_app.logger.debug(f"Synced {stats['events']} events ({stats['docsSynced']} docs) in {latency:.3f}s")
+        batch_size.record(stats["events"], latency)
+        totals["batches"] += 1
+        for key in ["events", "docsSynced", "atomicUpdates", "eventsCoalesced"]:
+            totals[key] += stats[key]
+
+    current_app.logger.info(f"Sync worker drained the pending events: {totals}")
+    return totals
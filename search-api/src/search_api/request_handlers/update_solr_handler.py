@@ -12,49 +12,130 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """API request handlers for solr updates / resyncs."""
+from datetime import timedelta
+
 from flask import current_app
 
 from search_api.enums import SolrDocEventStatus, SolrDocEventType
 from search_api.models import SolrDoc, SolrDocEvent
 from search_api.services import business_solr
+from search_api.services.base_solr import CommitPolicy
+from search_api.services.business_solr.doc_fields import BusinessField
 from search_api.services.business_solr.doc_models import BusinessDoc
+from search_api.utils.util import utcnow
+
+
+def sync_business_solr(limit: int) -> dict:
+    """Sync a batch of PENDING / ERROR update events to solr and return the sync stats.
+
+    The events are claimed with SKIP LOCKED so several sync jobs / workers can run at the same time. ERROR events
+    are only retried after the SYNC_ERROR_RETRY_DELAY so a failing event can't block the pending ones.
+    """
+    error_retry_before = utcnow() - timedelta(seconds=current_app.config.get("SYNC_ERROR_RETRY_DELAY"))
+    pending_update_events = SolrDocEvent.get_events_by_status(statuses=[SolrDocEventStatus.PENDING,
+                                                                        SolrDocEventStatus.ERROR],
+                                                              event_type=SolrDocEventType.UPDATE,
+                                                              limit=limit,
+                                                              skip_locked=True,
+                                                              error_retry_before=error_retry_before)
 
+    doc_identifiers = SolrDoc.get_identifiers_by_ids([event.solr_doc_id for event in pending_update_events])
+    identifiers_to_sync = [doc_identifiers[event.solr_doc_id] for event in pending_update_events]
+    current_app.logger.debug(f"Syncing: {identifiers_to_sync}")
+    sync_stats = {"events": len(pending_update_events), "docsSynced": 0, "atomicUpdates": 0}
+    if identifiers_to_sync:
+        # update the statuses in a single transaction so the claimed events stay locked until they are updated
+        sync_stats.update(update_business_solr(identifiers_to_sync, pending_update_events, len(pending_update_events)))
+    events_coalesced = len(pending_update_events) - sync_stats["docsSynced"]
+    return {
+        **sync_stats,
+        "eventsCoalesced": events_coalesced,
+        "coalescingRatio": round(events_coalesced / len(pending_update_events), 4) if pending_update_events else 0
+    }
 
-def update_business_solr(identifiers: list[str], doc_events: list[SolrDocEvent]):
-    """Update the docs for the entity_ids in the solr instance."""
-    businesses: list[BusinessDoc] = []
-    for identifier in identifiers:
-        doc_update = SolrDoc.find_most_recent_by_identifier(identifier)
-        businesses.append(BusinessDoc(**doc_update.doc))
+
+def update_business_solr(identifiers: list[str], doc_events: list[SolrDocEvent], chunk_size: int | None = None) -> dict:
+    """Update the docs for the entity_ids in the solr instance.
+
+    Repeated identifiers are coalesced so only the most recent doc of each business is sent. Docs where only parent
+    fields changed since the last applied doc are sent as atomic updates (leaving the child party docs untouched).
+    Every given event is still marked COMPLETE (or ERROR). Returns the number of docs sent to solr (and how many were
+    atomic).
+    """
+    chunk_size = chunk_size or _get_event_chunk_size()
+    unique_identifiers = list(dict.fromkeys(identifiers))
     try:
+        latest_docs = SolrDoc.find_most_recent_by_identifiers(unique_identifiers)
+        applied_docs = SolrDoc.find_last_applied_by_identifiers(unique_identifiers)
+        businesses: list[BusinessDoc] = []
+        atomic_updates: list[dict] = []
+        for identifier in unique_identifiers:
+            latest_doc, applied_doc = latest_docs[identifier], applied_docs.get(identifier)
+            if atomic_update := _get_atomic_update(latest_doc, applied_doc):
+                atomic_updates.append(atomic_update)
+            else:
+                businesses.append(BusinessDoc(**latest_doc.doc))
         # update people
-        business_solr.create_or_replace_docs(businesses, additive=False)
-        SolrDocEvent.update_events_status(SolrDocEventStatus.COMPLETE, doc_events)
+        if businesses:
+            business_solr.create_or_replace_docs(businesses, additive=False, commit_policy=_get_commit_policy())
+        if atomic_updates:
+            business_solr.create_or_replace_docs(raw_docs=atomic_updates, commit_policy=_get_commit_policy())
+        SolrDocEvent.update_events_status(SolrDocEventStatus.COMPLETE, doc_events, chunk_size)
+        return {"docsSynced": len(businesses) + len(atomic_updates), "atomicUpdates": len(atomic_updates)}
 
     except Exception as err:
         # log / update event / pass err
         current_app.logger.debug("Failed to UPDATE solr for %s", identifiers)
-        SolrDocEvent.update_events_status(SolrDocEventStatus.ERROR, doc_events)
+        SolrDocEvent.update_events_status(SolrDocEventStatus.ERROR, doc_events, chunk_size)
         raise err
 
 
 def resync_business_solr(identifiers: list[str]):
     """Re-apply the docs for the given identifiers."""
-    businesses: list[BusinessDoc] = []
-    doc_events: list[SolrDocEvent] = []
-    for identifier in identifiers:
-        doc_update = SolrDoc.find_most_recent_by_identifier(identifier)
-        businesses.append(BusinessDoc(**doc_update.doc))
-        # add separate event for resync
-        doc_event = SolrDocEvent(event_type=SolrDocEventType.RESYNC, solr_doc_id=doc_update.id).save()
-        doc_events.append(doc_event)
+    chunk_size = _get_event_chunk_size()
+    latest_docs = SolrDoc.find_most_recent_by_identifiers(identifiers)
+    doc_updates = [latest_docs[identifier] for identifier in identifiers]
+    businesses = [BusinessDoc(**doc_update.doc) for doc_update in doc_updates]
+    # add separate events for resync
+    event_ids = SolrDocEvent.bulk_create(SolrDocEventType.RESYNC, [doc_update.id for doc_update in doc_updates],
+                                         chunk_size)
     try:
         if len(businesses) > 0:
-            business_solr.create_or_replace_docs(businesses, additive=False)
-            SolrDocEvent.update_events_status(SolrDocEventStatus.COMPLETE, doc_events)
+            business_solr.create_or_replace_docs(businesses, additive=False, commit_policy=_get_commit_policy())
+            SolrDocEvent.update_status_by_ids(SolrDocEventStatus.COMPLETE, event_ids, chunk_size)
 
     except Exception as err:
         # log / update event / pass err
         current_app.logger.debug("Failed to RESYNC solr for %s", identifiers)
-        SolrDocEvent.update_events_status(SolrDocEventStatus.ERROR, doc_events)
+        SolrDocEvent.update_status_by_ids(SolrDocEventStatus.ERROR, event_ids, chunk_size)
         raise err
+
+
+def _get_atomic_update(latest_doc: SolrDoc, applied_doc: SolrDoc | None) -> dict | None:
+    """Return the atomic 'set' update of the parent fields (None if the children changed as well).
+
+    Every parent field is set (not only the ones that differ from the applied doc) since solr may have been written
+    to by others (i.e. the importer) since the applied doc. Only the party docs are left as is.
+    NOTE: the parent fields copied onto the party docs (i.e. parentStatus) show up as party changes.
+    """
+    if not applied_doc:
+        return None
+    latest, applied = SolrDoc.get_canonical_content(latest_doc.doc), SolrDoc.get_canonical_content(applied_doc.doc)
+    if latest.get(BusinessField.PARTIES.value) != applied.get(BusinessField.PARTIES.value):
+        return None
+    if latest == applied:
+        # nothing to compare the parent changes against (i.e. a resend of the applied doc) so replace it all
+        return None
+    parent_fields = {field: {"set": value} for field, value in latest.items()
+                     if field not in [BusinessField.UNIQUE_KEY.value, BusinessField.PARTIES.value]}
+    return {BusinessField.UNIQUE_KEY.value: latest[BusinessField.UNIQUE_KEY.value], **parent_fields}
+
+
+def _get_event_chunk_size() -> int:
+    """Return the number of solr doc events to insert / update per transaction."""
+    return current_app.config.get("SOLR_DOC_EVENT_CHUNK_SIZE")
+
+
+def _get_commit_policy() -> CommitPolicy:
+    """Return the commit policy for the sync / resync updates."""
+    return CommitPolicy(current_app.config.get("SYNC_COMMIT_POLICY"))
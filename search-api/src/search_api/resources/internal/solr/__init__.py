@@ -16,9 +16,11 @@ from flask import Blueprint
 
 from .command import bp as command_bp
 from .imports import bp as import_bp
+from .stats import bp as stats_bp
 from .update import bp as update_bp
 
 bp = Blueprint("SOLR", __name__, url_prefix="/solr")
 bp.register_blueprint(command_bp)
 bp.register_blueprint(import_bp)
+bp.register_blueprint(stats_bp)
 bp.register_blueprint(update_bp)
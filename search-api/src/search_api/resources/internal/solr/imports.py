@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """API endpoint for bulk importing entity records into solr."""
+from datetime import datetime
 from http import HTTPStatus
 
 from flask import Blueprint, current_app, jsonify, request
@@ -19,7 +20,9 @@ from flask_cors import cross_origin
 
 import search_api.resources.utils as resource_utils
 from search_api.exceptions import SolrException
+from search_api.models import ImportWatermark
 from search_api.services import SYSTEM_ROLE, business_solr
+from search_api.services.base_solr import CommitPolicy
 from search_api.services.business_solr.doc_models import BusinessDoc
 from search_api.utils.auth import jwt
 
@@ -40,15 +43,25 @@ def import_businesses():
             return resource_utils.bad_request_response("Invalid payload.",
                                                        ['Expecting desired "timeout" to be under 200.'])
 
+        commit_policy = None
+        if commit_policy_value := request_json.get("commitPolicy"):
+            if commit_policy_value not in CommitPolicy:
+                return resource_utils.bad_request_response(
+                    "Invalid payload.", [f'Expecting "commitPolicy" to be one of {[p.value for p in CommitPolicy]}.'])
+            commit_policy = CommitPolicy(commit_policy_value)
+
         if request_json.get("type") == "partial":
             # NOTE: raw_docs may be partial data and/or child documents
             current_app.logger.debug("Sending partials list to SOLR...")
-            business_solr.create_or_replace_docs(raw_docs=doc_list, timeout=timeout)
+            business_solr.create_or_replace_docs(raw_docs=doc_list, timeout=timeout, commit_policy=commit_policy)
         else:
             current_app.logger.debug("Translating import payload to entity docs...")
             businesses = [BusinessDoc(**e) for e in doc_list]
             current_app.logger.debug("Sending business docs to SOLR...")
-            business_solr.create_or_replace_docs(docs=businesses, timeout=timeout, additive=False)
+            business_solr.create_or_replace_docs(docs=businesses,
+                                                 timeout=timeout,
+                                                 additive=False,
+                                                 commit_policy=commit_policy)
 
         current_app.logger.debug("Import completed.")
         return jsonify({"message": "Import finished."}), HTTPStatus.CREATED
@@ -57,3 +70,54 @@ def import_businesses():
         return resource_utils.exception_response(solr_exception)
     except Exception as exception:
         return resource_utils.default_exception_response(exception)
+
+
+@bp.post("/commit")
+@cross_origin(origins="*")
+@jwt.requires_roles([SYSTEM_ROLE])
+def commit_import():
+    """Commit the imported businesses (i.e. after importing with the explicit commit policy)."""
+    try:
+        soft = bool((request.get_json(silent=True) or {}).get("soft", False))
+        current_app.logger.debug("Committing SOLR updates...")
+        business_solr.commit(soft=soft)
+        return jsonify({"message": "Commit finished."}), HTTPStatus.OK
+
+    except SolrException as solr_exception:
+        return resource_utils.exception_response(solr_exception)
+    except Exception as exception:
+        return resource_utils.default_exception_response(exception)
+
+
+@bp.get("/watermarks")
+@cross_origin(origins="*")
+@jwt.requires_roles([SYSTEM_ROLE])
+def get_watermarks():
+    """Return the import watermark of each source (used by the importer for delta imports)."""
+    try:
+        return jsonify({"watermarks": [watermark.json for watermark in ImportWatermark.get_all()]}), HTTPStatus.OK
+
+    except Exception as exception:
+        return resource_utils.default_exception_response(exception)
+
+
+@bp.put("/watermarks")
+@cross_origin(origins="*")
+@jwt.requires_roles([SYSTEM_ROLE])
+def update_watermarks():
+    """Set the import watermarks of the given sources."""
+    try:
+        watermarks: dict = (request.get_json(silent=True) or {}).get("watermarks")
+        if not watermarks or not isinstance(watermarks, dict):
+            return resource_utils.bad_request_response("Invalid payload.", ['Expecting required field: "watermarks"'])
+        try:
+            watermarks = {source: datetime.fromisoformat(value) for source, value in watermarks.items()}
+        except (TypeError, ValueError):
+            return resource_utils.bad_request_response("Invalid payload.",
+                                                       ['Expecting the "watermarks" values to be ISO datetimes.'])
+
+        updated = ImportWatermark.set_watermarks(watermarks)
+        return jsonify({"watermarks": [watermark.json for watermark in updated]}), HTTPStatus.OK
+
+    except Exception as exception:
+        return resource_utils.default_exception_response(exception)
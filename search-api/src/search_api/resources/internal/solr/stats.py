@@ -0,0 +1,42 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""API endpoint for reporting solr client usage statistics."""
+from http import HTTPStatus
+
+from flask import Blueprint, jsonify
+from flask_cors import cross_origin
+
+import search_api.resources.utils as resource_utils
+from search_api.services import SYSTEM_ROLE, business_solr
+from search_api.utils.auth import jwt
+
+from .update import update_stats
+
+bp = Blueprint("STATS", __name__, url_prefix="/stats")
+
+
+@bp.get("")
+@cross_origin(origins="*")
+@jwt.requires_roles([SYSTEM_ROLE])
+def solr_stats():
+    """Return the solr connection pool, query cache and update endpoint usage for this worker process."""
+    try:
+        return jsonify({
+            "pools": business_solr.pool_stats(),
+            "queryCache": business_solr.query_cache.stats(),
+            "updates": update_stats()
+        }), HTTPStatus.OK
+
+    except Exception as exception:
+        return resource_utils.default_exception_response(exception)
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Exposes all of the update endpoints in Flask-Blueprint style."""
 import re
+import threading
 from dataclasses import asdict
 from http import HTTPStatus
 
@@ -35,6 +36,24 @@ bp = Blueprint("UPDATE", __name__, url_prefix="/update")
 bp.register_blueprint(resync_bp)
 bp.register_blueprint(sync_bp)
 
+# update endpoint usage for this worker process (see the stats endpoint)
+_stats_lock = threading.Lock()
+_stats = {"updates": 0, "updatesSkipped": 0}
+
+
+def update_stats() -> dict[str, int]:
+    """Return the update endpoint usage metrics for this worker process."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def _count_update(skipped: bool):
+    """Count an accepted update (and whether its solr write was skipped)."""
+    with _stats_lock:
+        _stats["updates"] += 1
+        if skipped:
+            _stats["updatesSkipped"] += 1
+
 
 @bp.put("")
 @cross_origin(origins="*")
@@ -50,10 +69,24 @@ def update_business():
         user = User.get_or_create_user_by_jwt(g.jwt_oidc_token_info)
 
         business = _parse_business(request_json)
+        business_dict = asdict(business)
+        last_doc = SolrDoc.find_most_recent_by_identifier(business.identifier)
+        if last_doc and last_doc.content_hash == SolrDoc.get_content_hash(business_dict) and last_doc.is_pending():
+            # the same content is already waiting to be synced so skip the solr write (once applied, solr may have
+            # been changed by other writers i.e. the importer so the update is always recorded)
+            current_app.logger.debug(f"No changes for {business.identifier} since the pending update. Skipping.")
+            _count_update(skipped=True)
+            return jsonify({"message": "Update accepted. No changes since the last update."}), HTTPStatus.ACCEPTED
+
         # commit business. Ensures other flows (i.e. resync) will use the current data
-        solr_doc = SolrDoc(doc=asdict(business), identifier=business.identifier, _submitter_id=user.id).save()
-        SolrDocEvent(event_type=SolrDocEventType.UPDATE, solr_doc_id=solr_doc.id).save()
-        # SOLR update will be triggered by job (does a frequent bulk update to solr)
+        solr_doc = SolrDoc(doc=business_dict, identifier=business.identifier, _submitter_id=user.id).save()
+        notify_channel = None
+        if current_app.config.get("SYNC_NOTIFY_ENABLED"):
+            # lets a listening sync worker pick up the update as soon as it is committed
+            notify_channel = current_app.config.get("SYNC_NOTIFY_CHANNEL")
+        SolrDocEvent(event_type=SolrDocEventType.UPDATE, solr_doc_id=solr_doc.id).save(notify_channel)
+        # SOLR update will be triggered by job (does a frequent bulk update to solr) or a listening sync worker
+        _count_update(skipped=False)
 
         return jsonify({"message": "Update accepted."}), HTTPStatus.ACCEPTED
 
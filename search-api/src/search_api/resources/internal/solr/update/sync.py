@@ -22,7 +22,7 @@ import search_api.resources.utils as resource_utils
 from search_api.enums import SolrDocEventStatus, SolrDocEventType
 from search_api.exceptions import SolrException
 from search_api.models import SolrDoc, SolrDocEvent
-from search_api.request_handlers import update_business_solr
+from search_api.request_handlers import sync_business_solr
 from search_api.services import business_solr
 from search_api.services.business_solr.doc_fields import BusinessField
 
@@ -71,16 +71,8 @@ def _is_synced(actual_doc: dict, expected_doc: dict):
 def sync_solr():
     """Sync docs in the DB that haven't been applied to SOLR yet."""
     try:
-        pending_update_events = SolrDocEvent.get_events_by_status(statuses=[SolrDocEventStatus.PENDING,
-                                                                            SolrDocEventStatus.ERROR],
-                                                                  event_type=SolrDocEventType.UPDATE,
-                                                                  limit=current_app.config.get("MAX_BATCH_UPDATE_NUM"))
-
-        identifiers_to_sync = [(SolrDoc.get_by_id(event.solr_doc_id)).identifier for event in pending_update_events]
-        current_app.logger.debug(f"Syncing: {identifiers_to_sync}")
-        if identifiers_to_sync:
-            update_business_solr(identifiers_to_sync, pending_update_events)
-        return jsonify({"message": "Sync successful."}), HTTPStatus.OK
+        sync_stats = sync_business_solr(current_app.config.get("MAX_BATCH_UPDATE_NUM"))
+        return jsonify({"message": "Sync successful.", **sync_stats}), HTTPStatus.OK
 
     except SolrException as solr_exception:
         return resource_utils.exception_response(solr_exception)
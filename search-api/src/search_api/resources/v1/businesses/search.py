@@ -23,6 +23,7 @@ import search_api.resources.utils as resource_utils
 from search_api.exceptions import SolrException
 from search_api.services import business_solr
 from search_api.services.base_solr.utils import QueryParams, parse_facets, prep_query_str
+from search_api.services.business_solr import BUSINESS_V1_PROFILE, PARTY_DEFAULT_PROFILE
 from search_api.services.business_solr.doc_fields import BusinessField, PartyField
 from search_api.services.business_solr.utils import business_search, parties_search
 
@@ -126,21 +127,7 @@ def facets():  # noqa: PLR0912
                              rows=rows,
                              categories=search_categories,
                              fields=fields,
-                             query_fields={
-                                 BusinessField.NAME_Q: "parent",
-                                 BusinessField.NAME_STEM_AGRO: "parent",
-                                 BusinessField.NAME_SINGLE: "parent",
-                                 BusinessField.NAME_XTRA_Q: "parent",
-                                 BusinessField.BN_Q: "parent",
-                                 BusinessField.IDENTIFIER_Q: "parent"},
-                             query_boost_fields={
-                                 BusinessField.NAME_Q: 2,
-                                 BusinessField.NAME_STEM_AGRO: 2,
-                                 BusinessField.NAME_SINGLE: 2},
-                             query_fuzzy_fields={
-                                 BusinessField.NAME_Q: {"short": 1, "long": 2},
-                                 BusinessField.NAME_STEM_AGRO: {"short": 1, "long": 2},
-                                 BusinessField.NAME_SINGLE: {"short": 1, "long": 2}},
+                             search_profile=business_solr.search_profiles[BUSINESS_V1_PROFILE],
                              child_query=child_query,
                              child_categories={},
                              child_date_ranges={},
@@ -253,19 +240,7 @@ def parties():  # noqa: PLR0912, PLR0911
                              rows=rows,
                              categories=search_categories,
                              fields=business_solr.party_fields,
-                             query_fields={
-                                 PartyField.PARTY_NAME_Q: "parent",
-                                 PartyField.PARTY_NAME_STEM_AGRO: "parent",
-                                 PartyField.PARTY_NAME_SINGLE: "parent",
-                                 PartyField.PARTY_NAME_XTRA_Q: "parent"},
-                             query_boost_fields={
-                                 PartyField.PARTY_NAME_Q: 2,
-                                 PartyField.PARTY_NAME_STEM_AGRO: 2,
-                                 PartyField.PARTY_NAME_SINGLE: 2},
-                             query_fuzzy_fields={
-                                 PartyField.PARTY_NAME_Q: {"short": 1, "long": 2},
-                                 PartyField.PARTY_NAME_STEM_AGRO: {"short": 1, "long": 2},
-                                 PartyField.PARTY_NAME_SINGLE: {"short": 1, "long": 2}},
+                             search_profile=business_solr.search_profiles[PARTY_DEFAULT_PROFILE],
                              child_query={},
                              child_categories={},
                              child_date_ranges={},
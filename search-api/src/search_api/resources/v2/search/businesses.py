@@ -21,8 +21,9 @@ import search_api.resources.utils as resource_utils
 from search_api.exceptions import SolrException
 from search_api.services import business_solr
 from search_api.services.base_solr.utils import QueryParams, parse_facets, prep_query_str
+from search_api.services.business_solr import BUSINESS_DEFAULT_PROFILE
 from search_api.services.business_solr.doc_fields import BusinessField, PartyField
-from search_api.services.business_solr.utils import business_search
+from search_api.services.business_solr.utils import bulk_search, business_search
 from search_api.utils.validators import validate_search_request
 
 bp = Blueprint("BUSINESSES", __name__, url_prefix="/businesses")
@@ -65,25 +66,12 @@ def businesses():
                              rows=request_json.get("rows", business_solr.default_rows),
                              categories=categories,
                              fields=fields,
-                             query_fields={
-                                 BusinessField.NAME_Q: "parent",
-                                 BusinessField.NAME_STEM_AGRO: "parent",
-                                 BusinessField.NAME_SINGLE: "parent",
-                                 BusinessField.NAME_XTRA_Q: "parent",
-                                 BusinessField.NAME_Q_EXACT: "parent",
-                                 BusinessField.BN_Q: "parent",
-                                 BusinessField.IDENTIFIER_Q: "parent"},
-                             query_boost_fields={
-                                 BusinessField.NAME_Q: 2,
-                                 BusinessField.NAME_STEM_AGRO: 2,
-                                 BusinessField.NAME_SINGLE: 2},
-                             query_fuzzy_fields={
-                                 BusinessField.NAME_Q: {"short": 1, "long": 2},
-                                 BusinessField.NAME_STEM_AGRO: {"short": 1, "long": 2},
-                                 BusinessField.NAME_SINGLE: {"short": 1, "long": 2}},
+                             search_profile=business_solr.search_profiles[BUSINESS_DEFAULT_PROFILE],
                              child_query=child_query,
                              child_categories={},
-                             child_date_ranges={})
+                             child_date_ranges={},
+                             cursor_mark=request_json.get("cursorMark"),
+                             include_facets=request_json.get("includeFacets"))
         # execute search
         results = business_search(params, business_solr)
         response = {
@@ -99,12 +87,16 @@ def businesses():
                     "categories": {
                         BusinessField.TYPE.value: categories.get(BusinessField.TYPE, ""),
                         BusinessField.STATE.value: categories.get(BusinessField.STATE, "")},
+                    "queryProfile": results.get("queryProfile"),
                     "rows": params.rows,
                     "start": params.start
                 },
                 "totalResults": results.get("response", {}).get("numFound"),
                 "results": results.get("response", {}).get("docs")},
             }
+        if params.cursor_mark:
+            response["searchResults"]["queryInfo"]["cursorMark"] = params.cursor_mark
+            response["searchResults"]["nextCursorMark"] = results.get("nextCursorMark")
 
         return jsonify(response), HTTPStatus.OK
 
@@ -140,22 +132,8 @@ def businesses_bulk():
             errors.append({"Invalid payload": f"Expected 'rows' to be <= {max_rows}."})
         if len(errors) > 0:
             return resource_utils.bad_request_response("Errors processing request.", errors)
-        # build bulk query
-        queries = [f'{BusinessField.NAME_Q_EXACT.value}:"{prep_query_str(x, None, False)}"' for x in names] + \
-            [f"{BusinessField.IDENTIFIER_Q_EDGE.value}: {x}" for x in identifiers]
-        query = " OR ".join(queries)
-        if state:
-            query = f"({BusinessField.STATE.value}:{state.upper()}) AND ({query})"
-
-        solr_payload = {
-            "query": query,
-            "queries": {
-                "parents": f"{BusinessField.IDENTIFIER.value}:*",
-            },
-            "fields": business_solr.business_fields
-        }
         # execute search
-        results = business_solr.query(solr_payload, 0, rows)
+        results = bulk_search(names, identifiers, state, rows, business_solr)
         response = {
             "totalResults": results.get("response", {}).get("numFound"),
             "results": results.get("response", {}).get("docs"),
@@ -21,6 +21,7 @@ import search_api.resources.utils as resource_utils
 from search_api.exceptions import SolrException
 from search_api.services import business_solr
 from search_api.services.base_solr.utils import QueryParams, parse_facets, prep_query_str
+from search_api.services.business_solr import PARTY_DEFAULT_PROFILE
 from search_api.services.business_solr.doc_fields import PartyField
 from search_api.services.business_solr.utils import parties_search
 from search_api.utils.validators import validate_search_request
@@ -74,23 +75,13 @@ def parties():
                              rows=int(request_json.get("rows", business_solr.default_rows)),
                              categories=categories,
                              fields=business_solr.party_fields,
-                             query_fields={
-                                 PartyField.PARTY_NAME_Q: "parent",
-                                 PartyField.PARTY_NAME_STEM_AGRO: "parent",
-                                 PartyField.PARTY_NAME_SINGLE: "parent",
-                                 PartyField.PARTY_NAME_XTRA_Q: "parent"},
-                             query_boost_fields={
-                                 PartyField.PARTY_NAME_Q: 2,
-                                 PartyField.PARTY_NAME_STEM_AGRO: 2,
-                                 PartyField.PARTY_NAME_SINGLE: 2},
-                             query_fuzzy_fields={
-                                 PartyField.PARTY_NAME_Q: {"short": 1, "long": 2},
-                                 PartyField.PARTY_NAME_STEM_AGRO: {"short": 1, "long": 2},
-                                 PartyField.PARTY_NAME_SINGLE: {"short": 1, "long": 2}},
+                             search_profile=business_solr.search_profiles[PARTY_DEFAULT_PROFILE],
                              child_query={},
                              child_categories={},
                              child_date_ranges={},
-                             full_query_boosts=[])
+                             full_query_boosts=[],
+                             cursor_mark=request_json.get("cursorMark"),
+                             include_facets=request_json.get("includeFacets"))
         results = parties_search(params, business_solr)
         response = {
             "facets": parse_facets(results),
@@ -113,6 +104,9 @@ def parties():
                 "results": results.get("response", {}).get("docs")
             }
         }
+        if params.cursor_mark:
+            response["searchResults"]["queryInfo"]["cursorMark"] = params.cursor_mark
+            response["searchResults"]["nextCursorMark"] = results.get("nextCursorMark")
 
         return jsonify(response), HTTPStatus.OK
 
@@ -28,6 +28,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import socket
+import threading
+import time
 from contextlib import suppress
 from http import HTTPStatus
 
@@ -35,10 +39,44 @@ from flask import Flask, current_app
 from requests import Response, Session
 from requests.adapters import HTTPAdapter, Retry
 from requests.exceptions import ConnectionError as SolrConnectionError
+from urllib3.connection import HTTPConnection
 
 from search_api.exceptions import SolrException
 from search_api.utils.base import BaseEnum
 
+from .query_cache import QueryCache
+from .utils import SearchProfile
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that enables tcp keep-alive probes on its pooled sockets."""
+
+    def __init__(self, keep_alive_idle: int | None = None, **kwargs):
+        """Initialize the adapter."""
+        self.keep_alive_idle = keep_alive_idle
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Initialize the pool manager with keep-alive socket options."""
+        if self.keep_alive_idle:
+            socket_options = [*HTTPConnection.default_socket_options, (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+            # NOTE: TCP_KEEPIDLE / TCP_KEEPINTVL are not available on every platform
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.keep_alive_idle))
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.keep_alive_idle))
+            kwargs["socket_options"] = socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+class CommitPolicy(BaseEnum):
+    """How an update makes its changes visible to search."""
+
+    HARD = "hard"  # commit=true (flushes the index and opens a new searcher)
+    SOFT = "soft"  # softCommit=true (opens a new searcher without flushing the index)
+    WITHIN = "within"  # commitWithin=N ms (solr groups the commits of the updates within the window)
+    EXPLICIT = "explicit"  # no commit (the caller calls Solr.commit when it is done updating)
+
 
 class Solr:
     """Wrapper class around the solr instance."""
@@ -57,6 +95,31 @@ class Solr:
 
         self.default_start = 0
         self.default_rows = 10
+        # cursor paging requires a sort ending on the unique key to be stable
+        self.unique_key = "id"
+        self.cursor_sort = f"score desc, {self.unique_key} asc"
+        # max boolean clauses solr allows in a query after expansion
+        self.max_clause_count = 1024
+        # ms for the CommitPolicy.WITHIN updates
+        self.commit_within = 1000
+
+        # connection pools (one session per solr node, created lazily per process)
+        self.pool_maxsize = 10
+        self.pool_block = False
+        self.keep_alive_idle = None
+        self._adapters: dict[str, HTTPAdapter] = {}
+        self._sessions: dict[str, Session] = {}
+        self._sessions_lock = threading.Lock()
+        self._sessions_pid = None
+
+        # query response cache (invalidated when the follower index generation changes)
+        self.query_cache = QueryCache()
+        self.query_cache_generation_interval = 10
+        self._generation_checked_at = None
+        self._generation_lock = threading.Lock()
+
+        # compiled search profiles (registered once at startup by name)
+        self.search_profiles: dict[str, SearchProfile] = {}
 
         # base urls
         self.reload_url = "{url}/admin/cores?action=RELOAD&core={core}"
@@ -64,7 +127,9 @@ class Solr:
         self.search_url = "{url}/{core}/query"
         self.synonyms_url = "{url}/{core}/schema/analysis/synonyms"
         self.update_url = "{url}/{core}/update?commit=true&overwrite=true&wt=json"
+        self.soft_update_url = "{url}/{core}/update?softCommit=true&overwrite=true&wt=json"
         self.bulk_update_url = "{url}/{core}/update?overwrite=true&wt=json"
+        self.commit_url = "{url}/{core}/update?wt=json"
 
         if app:
             self.init_app(app)
@@ -79,6 +144,96 @@ class Solr:
         # NOTE: for a single node implementation set the leader/follower urls the same
         self.leader_url = app.config.get(f"{self.config_prefix}_LEADER_URL")
         self.follower_url = app.config.get(f"{self.config_prefix}_FOLLOWER_URL")
+        # connection pool settings
+        self.pool_maxsize = app.config.get("SOLR_POOL_MAXSIZE", 10)
+        self.pool_block = app.config.get("SOLR_POOL_BLOCK", False)
+        self.keep_alive_idle = app.config.get("SOLR_KEEP_ALIVE_IDLE", 60)
+        self.close_sessions()
+        # query cache settings
+        self.query_cache = QueryCache(max_size=app.config.get("SOLR_QUERY_CACHE_SIZE", 0),
+                                      ttl=app.config.get("SOLR_QUERY_CACHE_TTL", 0))
+        self.query_cache_generation_interval = app.config.get("SOLR_QUERY_CACHE_GENERATION_INTERVAL", 10)
+        self._generation_checked_at = None
+        self.max_clause_count = app.config.get("SOLR_MAX_CLAUSE_COUNT", 1024)
+        self.commit_within = app.config.get("SOLR_COMMIT_WITHIN", 1000)
+
+    def _get_session(self, base_url: str) -> Session:
+        """Return the pooled session for the solr node (recreated after a fork)."""
+        with self._sessions_lock:
+            if self._sessions_pid != os.getpid():
+                # NOTE: sockets inherited from the parent process must not be reused or closed by the child
+                self._adapters = {}
+                self._sessions = {}
+                self._sessions_pid = os.getpid()
+
+            if not (session := self._sessions.get(base_url)):
+                retries = Retry(total=self.app.config["SOLR_RETRY_TOTAL"],
+                                backoff_factor=self.app.config["SOLR_RETRY_BACKOFF_FACTOR"],
+                                status_forcelist=[413, 429, 502, 503, 504],
+                                allowed_methods=["GET", "POST"])
+                adapter = _KeepAliveAdapter(keep_alive_idle=self.keep_alive_idle,
+                                            pool_connections=1,
+                                            pool_maxsize=self.pool_maxsize,
+                                            pool_block=self.pool_block,
+                                            max_retries=retries)
+                session = Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._adapters[base_url] = adapter
+                self._sessions[base_url] = session
+
+            return session
+
+    def close_sessions(self):
+        """Close the pooled sessions for all solr nodes."""
+        with self._sessions_lock:
+            if self._sessions_pid == os.getpid():
+                for session in self._sessions.values():
+                    session.close()
+            self._adapters = {}
+            self._sessions = {}
+            self._sessions_pid = os.getpid()
+
+    def pool_stats(self) -> dict[str, dict[str, int]]:
+        """Return the connection pool usage for each solr node."""
+        stats = {}
+        with self._sessions_lock:
+            for base_url, adapter in self._adapters.items():
+                # NOTE: the urllib3 pool container does not support iteration
+                pool_keys = adapter.poolmanager.pools.keys()
+                pools = [adapter.poolmanager.pools[key] for key in pool_keys]
+                stats[base_url] = {
+                    "maxSize": self.pool_maxsize,
+                    "connectionsOpened": sum(pool.num_connections for pool in pools),
+                    "idleConnections": sum(len([conn for conn in pool.pool.queue if conn])
+                                           for pool in pools if pool.pool),
+                    "requests": sum(pool.num_requests for pool in pools),
+                }
+        return stats
+
+    def _refresh_query_cache_generation(self) -> bool:
+        """Sync the query cache with the follower index generation. Return True if the cache is usable."""
+        if not self.query_cache.enabled:
+            return False
+        with self._generation_lock:
+            now = time.monotonic()
+            if self._generation_checked_at and now - self._generation_checked_at < self.query_cache_generation_interval:
+                return True
+            try:
+                resp = self.call_solr(method="GET",
+                                      query=self.replication_url,
+                                      params={"command": "details"},
+                                      leader=False,
+                                      timeout=5)
+                self.query_cache.set_generation(resp.json()["details"]["generation"])
+                self._generation_checked_at = now
+                return True
+            except Exception as err:
+                # NOTE: never serve cached results when the index generation is unknown
+                current_app.logger.debug("Unable to verify the follower index generation: %s", repr(err))
+                self.query_cache.set_generation(None)
+                self._generation_checked_at = None
+                return False
 
     def call_solr(self,  # noqa: PLR0913
                   method: str,
@@ -92,12 +247,7 @@ class Solr:
         base_url = self.leader_url if leader else self.follower_url
         core = self.leader_core if leader else self.follower_core
         url = query.format(url=base_url, core=core)
-        retries = Retry(total=self.app.config["SOLR_RETRY_TOTAL"],
-                        backoff_factor=self.app.config["SOLR_RETRY_BACKOFF_FACTOR"],
-                        status_forcelist=[413, 429, 502, 503, 504],
-                        allowed_methods=["GET", "POST"])
-        session = Session()
-        session.mount(url, HTTPAdapter(max_retries=retries))
+        session = self._get_session(base_url)
 
         response = None
         try:
@@ -138,17 +288,38 @@ class Solr:
             current_app.logger.debug(msg)
             raise SolrException(error=msg, status_code=status_code) from err
 
+    def register_search_profile(self, search_profile: SearchProfile):
+        """Register the compiled search profile by its name."""
+        if search_profile.name in self.search_profiles:
+            raise ValueError(f"Search profile '{search_profile.name}' is already registered.")
+        self.search_profiles[search_profile.name] = search_profile
+
     def create_or_update_synonyms(self, synonym_type: BaseEnum, synonyms: dict[str: list[str]]):
         """Create or update solr docs in the core."""
         return self.call_solr("PUT", f"{self.synonyms_url}/{synonym_type.value}", json_data=synonyms, timeout=180)
 
-    def delete_all_docs(self):
+    def get_update_url(self, commit_policy: CommitPolicy) -> str:
+        """Return the update url for the commit policy."""
+        if commit_policy == CommitPolicy.HARD:
+            return self.update_url
+        if commit_policy == CommitPolicy.SOFT:
+            return self.soft_update_url
+        if commit_policy == CommitPolicy.WITHIN:
+            return f"{self.bulk_update_url}&commitWithin={self.commit_within}"
+        return self.bulk_update_url
+
+    def commit(self, soft: bool = False, timeout=180):
+        """Commit the pending updates in the core (i.e. after updates made with CommitPolicy.EXPLICIT)."""
+        payload = '<commit softCommit="true"/>' if soft else "<commit/>"
+        return self.call_solr("POST", self.commit_url, xml_data=payload, timeout=timeout)
+
+    def delete_all_docs(self, commit_policy: CommitPolicy = CommitPolicy.HARD):
         """Delete all solr docs from the core."""
         payload = "<delete><query>*:*</query></delete>"
-        response = self.call_solr("POST", self.update_url, xml_data=payload, timeout=60)
+        response = self.call_solr("POST", self.get_update_url(commit_policy), xml_data=payload, timeout=60)
         return response
 
-    def delete_docs(self, unique_keys: list[str]):
+    def delete_docs(self, unique_keys: list[str], commit_policy: CommitPolicy = CommitPolicy.WITHIN):
         """Delete solr docs from the core."""
         payload = "<delete><query>"
         if unique_keys:
@@ -158,15 +329,68 @@ class Solr:
             payload += f" OR id:{key.upper()}"
         payload += "</query></delete>"
 
-        response = self.call_solr("POST", self.update_url, xml_data=payload, timeout=60)
+        response = self.call_solr("POST", self.get_update_url(commit_policy), xml_data=payload, timeout=60)
         return response
 
-    def query(self, payload: dict[str, str], start: int | None = None, rows: int | None = None) -> dict:
-        """Return a list of solr docs from the solr query handler for the given params."""
+    def query(self,  # noqa: PLR0913
+              payload: dict[str, str],
+              start: int | None = None,
+              rows: int | None = None,
+              use_cache: bool = False,
+              cursor_mark: str | None = None,
+              *,
+              include_facets: bool | None = None) -> dict:
+        """Return a list of solr docs from the solr query handler for the given params.
+
+        When a cursor_mark is given ('*' for the first page) solr pages with a cursor instead of the offset
+        and the response includes the 'nextCursorMark' to pass in on the next call.
+
+        Facets in the payload are computed unless include_facets is False. When caching, they are stored by the
+        query without paging so later pages reuse them instead (unless include_facets is True).
+        """
         payload["offset"] = start if start else self.default_start
         payload["limit"] = rows if rows else self.default_rows
-        response = self.call_solr("POST", self.search_url, json_data=payload, leader=False)
-        return response.json()
+        if cursor_mark:
+            payload["offset"] = 0
+            payload["sort"] = self.cursor_sort
+            payload["params"] = {**payload.get("params", {}), "cursorMark": cursor_mark}
+
+        use_cache = use_cache and self._refresh_query_cache_generation()
+        facet_key = None
+        cached_facets = None
+        if payload.get("facet"):
+            if use_cache and include_facets is not False:
+                facet_key = self.query_cache.get_key(self._get_facet_payload(payload), None, None)
+                if not include_facets:
+                    cached_facets = self.query_cache.get(facet_key)
+            if cached_facets is not None or include_facets is False:
+                payload = {key: val for key, val in payload.items() if key != "facet"}
+
+        results = None
+        cache_key = None
+        if use_cache:
+            cache_key = self.query_cache.get_key(payload, payload["offset"], payload["limit"])
+            results = self.query_cache.get(cache_key)
+
+        if results is None:
+            response = self.call_solr("POST", self.search_url, json_data=payload, leader=False)
+            results = response.json()
+            if cache_key:
+                self.query_cache.set(cache_key, results)
+
+        if cached_facets is not None:
+            results["facets"] = cached_facets
+        elif facet_key and "facets" in results:
+            self.query_cache.set(facet_key, results["facets"])
+        return results
+
+    @staticmethod
+    def _get_facet_payload(payload: dict) -> dict:
+        """Return the parts of the query payload that determine the facet results (i.e. without paging)."""
+        facet_payload = {key: val for key, val in payload.items() if key not in ["offset", "limit", "sort", "fields"]}
+        if params := payload.get("params"):
+            facet_payload["params"] = {key: val for key, val in params.items() if key != "cursorMark"}
+        return facet_payload
 
     def reload_core(self):
         """Reload the solr core."""
@@ -0,0 +1,107 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""In-process LRU / TTL cache for solr query responses."""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from copy import deepcopy
+
+
+class QueryCache:
+    """Thread safe LRU cache of solr query responses with a per entry time to live.
+
+    Entries are tied to the index generation they were fetched from, so the whole cache is
+    dropped whenever the generation of the index being queried changes.
+    """
+
+    def __init__(self, max_size: int = 0, ttl: float = 0):
+        """Initialize the cache (a max_size or ttl of 0 disables it)."""
+        self.max_size = max_size
+        self.ttl = ttl
+        self.generation = None
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+        # metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if the cache is configured to store entries."""
+        return self.max_size > 0 and self.ttl > 0
+
+    @staticmethod
+    def get_key(payload: dict, start: int, rows: int) -> str:
+        """Return the cache key for the fully built solr payload and paging values."""
+        key_str = json.dumps({"payload": payload, "start": start, "rows": rows}, sort_keys=True, default=str)
+        return hashlib.sha256(key_str.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        """Return a copy of the cached response for the key or None."""
+        with self._lock:
+            if not (entry := self._entries.get(key)):
+                self.misses += 1
+                return None
+            expires_at, response = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return deepcopy(response)
+
+    def set(self, key: str, response: dict):
+        """Store a copy of the response under the key."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, deepcopy(response))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def set_generation(self, generation: str | int | None):
+        """Set the index generation the cache entries belong to (clears the cache if it changed)."""
+        with self._lock:
+            if generation != self.generation:
+                if self._entries:
+                    self.invalidations += 1
+                self._entries.clear()
+                self.generation = generation
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int | str | None]:
+        """Return the cache usage metrics."""
+        with self._lock:
+            return {
+                "maxSize": self.max_size,
+                "ttl": self.ttl,
+                "size": len(self._entries),
+                "generation": self.generation,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """This module manages helpful util functions for using the solr service."""
-from .formatting_helpers import parse_facets, prep_query_str
-from .query_builder import QueryBuilder
+from .formatting_helpers import DASH_OPTIONS, parse_facets, prep_query_str, prep_query_str_variants, to_keyword
+from .query_builder import QueryBuilder, QueryProfile
 from .query_params import QueryParams
+from .search_profile import ClauseTemplate, SearchProfile
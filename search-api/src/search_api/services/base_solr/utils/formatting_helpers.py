@@ -32,6 +32,61 @@ def parse_facets(facet_data: dict) -> dict:
     return {"fields": facets}
 
 
+# NOTE: compiled once at import, applied in the same order as the rules documented in prep_query_str
+_RMV_DOUBLES = re.compile(r"([&+]){2,}")
+_RMV_ALL = str.maketrans("", "", "()^{}|\\")
+_SPECIAL_AND = re.compile(r"([&+])")
+_PAD_DASH = re.compile(r"(\S)(-)(\S)")
+_TIGHTEN_DASH = re.compile(r"(\s+)(-)(\s+)")
+# escape beginning (+,-,/,!) and escape everywhere (",:,[,],~,<,>,?) combined into one pass
+_ESCAPE = re.compile(r'(^|\s)([+\-/!])|([:~<>?"\[\]])')
+
+# english possessive removed by the wordDelimiterGraph filter in solr
+_POSSESSIVE = re.compile(r"'s\b")
+
+# TODO: set enum for this (#28850)
+_DASH_RULES = {
+    "replace": lambda query: query.replace("-", " "),
+    "remove": lambda query: query.replace("-", ""),
+    "pad": lambda query: _PAD_DASH.sub(r"\1 \2 \3", query),
+    "tighten": lambda query: _TIGHTEN_DASH.sub(r"\2", query),
+    "tighten-remove": lambda query: _TIGHTEN_DASH.sub("", query),
+}
+DASH_OPTIONS = tuple(_DASH_RULES)
+
+
+def _escape(match: re.Match) -> str:
+    """Return the escaped match for the _ESCAPE pattern."""
+    if char := match.group(3):
+        return "\\" + char
+    return match.group(1) + "\\" + match.group(2)
+
+
+def prep_query_str_variants(query: str,
+                            dashes: tuple[str | None, ...] = (None, *DASH_OPTIONS),
+                            replace_and=True) -> dict[str | None, str]:
+    """Return the prepped query string for each dash option (see prep_query_str).
+
+    The dash independent cleanup is only done once for all the returned variants.
+    """
+    if not query:
+        return dict.fromkeys(dashes, "")
+
+    query = query.lower()
+    if "&" in query or "+" in query:
+        query = _RMV_DOUBLES.sub(r"\1", query)
+    query = query.translate(_RMV_ALL)
+    if replace_and and ("&" in query or "+" in query):
+        query = _SPECIAL_AND.sub(" and ", query)
+
+    variants = {}
+    for dash in dashes:
+        variant = _DASH_RULES[dash](query) if dash in _DASH_RULES and "-" in query else query
+        variant = _ESCAPE.sub(_escape, variant)
+        variants[dash] = variant.replace("  ", " ").strip()
+    return variants
+
+
 def prep_query_str(query: str, dash: str | None = None, replace_and = True) -> str:
     r"""Return the query string prepped for solr call.
 
@@ -45,35 +100,15 @@ def prep_query_str(query: str, dash: str | None = None, replace_and = True) -> s
         - (optional) replace - with '', ' ', or ' - '
         - (optional) replace ' - ' with '-'
     """
-    if not query:
-        return ""
+    return prep_query_str_variants(query, (dash,), replace_and)[dash]
 
-    rmv_doubles = r"([&+]){2,}"
-    rmv_all = r"([()^{}|\\])"
-    esc_begin = r"(^|\s)([+\-/!])"
-    esc_all = r'([:~<>?\"\[\]])'
-    special_and = r"([&+])"
-    rmv_dash = r"(-)"
-    pad_dash = r"(\S)(-)(\S)"
-    tighten_dash = r"(\s+)(-)(\s+)"
-
-    query = re.sub(rmv_doubles, r"\1", query.lower())
-    query = re.sub(rmv_all, "", query)
-    if replace_and:
-        query = re.sub(special_and, r" and ", query)
-    if dash:
-        # TODO: set enum for this (#28850)
-        if dash == "replace":
-            query = re.sub(rmv_dash, r" ", query)
-        if dash == "remove":
-            query = re.sub(rmv_dash, r"", query)
-        if dash == "pad":
-            query = re.sub(pad_dash, r"\1 \2 \3", query)
-        if dash == "tighten":
-            query = re.sub(tighten_dash, r"\2", query)
-        if dash == "tighten-remove":
-            query = re.sub(tighten_dash, r"", query)
-
-    query = re.sub(esc_begin, r"\1\\\2", query)
-    query = re.sub(esc_all, r"\\\1", query)
-    return query.lower().replace("  ", " ").strip()
+
+def to_keyword(value: str | None) -> str:
+    """Return the value normalized for exact keyword matching (i.e. "Bob's Bar-B-Q Ltd." -> 'bobbarbqltd').
+
+    Mirrors the name_q_exact analysis (lowercase, drop possessives, catenate the alphanumerics) without
+    the edge ngrams so the result can be used in a {!terms} query.
+    """
+    if not value:
+        return ""
+    return "".join(char for char in _POSSESSIVE.sub("", value.lower()) if char.isalnum())
@@ -13,37 +13,142 @@
 # limitations under the License.
 """Manages common solr query building methods."""
 import re
+from types import MappingProxyType
 
 from search_api.utils.base import BaseEnum
 
+from .search_profile import ClauseTemplate, SearchProfile
+
+_CORP_PREFIX_REGEX = re.compile(r"(^[aA-zZ]+)[0-9]+$")
+
+
+class QueryProfile(BaseEnum):
+    """Enum of the query profiles (full text profiles ordered from most to least expensive)."""
+
+    FULL = "full"  # boosts, fuzzy matching and full query boosts
+    NO_FUZZY = "no-fuzzy"  # boosts and full query boosts
+    SIMPLE = "simple"  # plain term matching only
+    LOOKUP = "lookup"  # exact identifier / bn match (not full text)
+
+    @property
+    def use_boosts(self) -> bool:
+        """Return True if the profile adds the field boosts and full query boosts."""
+        return self != QueryProfile.SIMPLE
+
+    @property
+    def use_fuzzy(self) -> bool:
+        """Return True if the profile adds the fuzzy clauses."""
+        return self == QueryProfile.FULL
+
 
 class QueryBuilder:
     """Manages shared query building code."""
 
     identifier_field_values = None
     pre_child_filter_clause = None
+    # max terms a fuzzy clause rewrites to in solr (lucene FuzzyQuery default)
+    fuzzy_max_expansions = 50
+    # typical number of indexed terms within each allowed edit of a name term (most never reach the max)
+    fuzzy_expansions_per_edit = 10
 
     def __init__(self, identifier_field_values: list[str], unique_parent_field: BaseEnum):
         """Initialize the solr class."""
         self.identifier_field_values = identifier_field_values
         self.pre_child_filter_clause = "{!parent which = '-_nest_path_:* " + unique_parent_field.value + ":*'}"
 
+    def get_identifier_prefix(self, field_value: str, term: str) -> str | None:
+        """Return the corp prefix of the term if it is an identifier being searched in an identifier field."""
+        if field_value in self.identifier_field_values and (identifier := _CORP_PREFIX_REGEX.search(term)):
+            return identifier.group(1)
+        return None
+
     def create_clause(self, field_value: str, term: str, is_child=False) -> str:
         """Return the query clause for the field and term."""
-        corp_prefix_regex = r"(^[aA-zZ]+)[0-9]+$"
-
         search_field = field_value
         if is_child:
             search_field = self.pre_child_filter_clause + search_field
 
-        if field_value in self.identifier_field_values and (identifier := re.search(corp_prefix_regex, term)):
-            prefix = identifier.group(1)
-            no_prefix_term = term.replace(prefix, "", 1)
-
-            return f'({search_field}:"{no_prefix_term}" AND {search_field}:"{prefix.upper()}")'
+        if prefix := self.get_identifier_prefix(field_value, term):
+            return self._create_identifier_clause(search_field, term, prefix)
 
         return f"{search_field}:{term}"
 
+    def bind_clause(self, template: ClauseTemplate, term: str) -> str:
+        """Return the query clause for the compiled clause template and term."""
+        if template.is_identifier and (identifier := _CORP_PREFIX_REGEX.search(term)):
+            return self._create_identifier_clause(template.search_field, term, identifier.group(1))
+
+        return f"{template.search_field}:{term}"
+
+    @staticmethod
+    def _create_identifier_clause(search_field: str, term: str, prefix: str) -> str:
+        """Return the query clause matching the identifier number and corp prefix separately."""
+        no_prefix_term = term.replace(prefix, "", 1)
+        return f'({search_field}:"{no_prefix_term}" AND {search_field}:"{prefix.upper()}")'
+
+    def compile_profile(self,
+                        name: str,
+                        query_fields: dict[BaseEnum, str],
+                        boost_fields: dict[BaseEnum, int],
+                        fuzzy_fields: dict[BaseEnum, dict[str, int]]) -> SearchProfile:
+        """Return the immutable search profile with a clause template compiled for each query field."""
+        clauses = []
+        for field, level in query_fields.items():
+            search_field = field.value
+            if level == "child":
+                search_field = self.pre_child_filter_clause + search_field
+            fuzzy = None
+            if field in fuzzy_fields:
+                fuzzy = (fuzzy_fields[field]["short"], fuzzy_fields[field]["long"])
+            clauses.append(ClauseTemplate(field=field,
+                                          search_field=search_field,
+                                          is_identifier=field.value in self.identifier_field_values,
+                                          boost=f"^{boost_fields[field]}" if field in boost_fields else "",
+                                          fuzzy=fuzzy))
+
+        return SearchProfile(
+            name=name,
+            query_fields=MappingProxyType(dict(query_fields)),
+            boost_fields=MappingProxyType(dict(boost_fields)),
+            fuzzy_fields=MappingProxyType({key: MappingProxyType(dict(val)) for key, val in fuzzy_fields.items()}),
+            clauses=tuple(clauses))
+
+    def estimate_clause_count(self,
+                              query: dict[str, str],
+                              search_profile: SearchProfile,
+                              full_query_boosts: list[dict[str, BaseEnum | str]],
+                              use_fuzzy: bool = True) -> int:
+        """Return the estimated number of clauses solr will expand the query to.
+
+        Boosts only change scoring, but each fuzzy clause can be rewritten into several term clauses
+        (estimated by its edit distance, capped at the max expansions solr will rewrite it to).
+        """
+        count = 0
+        for term in query["value"].split():
+            for template in search_profile.clauses:
+                count += 2 if template.is_identifier and _CORP_PREFIX_REGEX.search(term) else 1
+                if use_fuzzy and template.fuzzy and (distance := self.get_fuzzy_distance(term, *template.fuzzy)):
+                    count += min(distance * self.fuzzy_expansions_per_edit, self.fuzzy_max_expansions)
+        for info in full_query_boosts:
+            count += max(len(info["value"].split()), 1)
+        return count
+
+    def get_query_profile(self,
+                          query: dict[str, str],
+                          search_profile: SearchProfile,
+                          full_query_boosts: list[dict[str, BaseEnum | str]],
+                          *,
+                          max_clause_count: int) -> QueryProfile:
+        """Return the most complete query profile that is not expected to exceed the max clause count."""
+        for profile in [QueryProfile.FULL, QueryProfile.NO_FUZZY, QueryProfile.SIMPLE]:
+            estimate = self.estimate_clause_count(query,
+                                                  search_profile,
+                                                  full_query_boosts if profile.use_boosts else [],
+                                                  profile.use_fuzzy)
+            if estimate <= max_clause_count:
+                return profile
+        return QueryProfile.SIMPLE
+
     def build_filter_clause(self, query: dict[str, str]) -> list[str]:
         """Return the filters for the query."""
         filters = []
@@ -98,28 +203,31 @@ class QueryBuilder:
                          fields: dict[BaseEnum, str],
                          boost_fields: dict[BaseEnum, int],
                          fuzzy_fields: dict[BaseEnum, dict[str, int]]) -> dict[str, list[str]]:
-        """Return a solr query with filters for each subsequent term."""
+        """Return a solr query with filters for each subsequent term (prefer a registered search profile)."""
+        return self.build_profile_query(query, self.compile_profile("", fields, boost_fields, fuzzy_fields))
+
+    def build_profile_query(self,
+                            query: dict[str, str],
+                            search_profile: SearchProfile,
+                            use_boosts: bool = True,
+                            use_fuzzy: bool = True) -> dict[str, list[str]]:
+        """Return a solr query with filters for each subsequent term bound to the search profile's clauses."""
         terms = query["value"].split()
 
         query_clause = ""
         for term in terms:
             # each term only needs to match one of the given fields, but all terms must match at least 1
             term_clause = ""
-            for field, level in fields.items():
-                field_clause = self.create_clause(field.value, term, level == "child")
-                pre_boost_clause = field_clause
+            for template in search_profile.clauses:
+                field_clause = self.bind_clause(template, term)
                 # add boost
-                if field in boost_fields:
-                    field_clause += f"^{boost_fields[field]}"
-
-                term_clause = self.join_clause(term_clause, field_clause, "OR")
+                term_clause = self.join_clause(term_clause,
+                                               field_clause + template.boost if use_boosts else field_clause,
+                                               "OR")
                 # add fuzzy matching
-                if field in fuzzy_fields \
-                    and (fuzzy_str := self.get_fuzzy_str(term,
-                                                         fuzzy_fields[field]["short"],
-                                                         fuzzy_fields[field]["long"])):
+                if use_fuzzy and template.fuzzy and (fuzzy_str := self.get_fuzzy_str(term, *template.fuzzy)):
                     # add another with fuzzy (this one will give a lower score on a hit if the original has a boost)
-                    term_clause = self.join_clause(term_clause, f"{pre_boost_clause}{fuzzy_str}", "OR")
+                    term_clause = self.join_clause(term_clause, f"{field_clause}{fuzzy_str}", "OR")
 
             query_clause = self.join_clause(query_clause, f"({term_clause})", "AND")
 
@@ -143,13 +251,20 @@ class QueryBuilder:
         return facet
 
     @staticmethod
-    def get_fuzzy_str(term: str, short: int, long: int) -> str:
-        """Return the fuzzy string for the term."""
+    def get_fuzzy_distance(term: str, short: int, long: int) -> int:
+        """Return the fuzzy edit distance for the term (0 for no fuzzy matching)."""
         if len(term) < 4:  # noqa: PLR2004
-            return ""
+            return 0
         if len(term) < 7:  # noqa: PLR2004
-            return f"~{short}"
-        return f"~{long}"
+            return short
+        return long
+
+    @staticmethod
+    def get_fuzzy_str(term: str, short: int, long: int) -> str:
+        """Return the fuzzy string for the term."""
+        if distance := QueryBuilder.get_fuzzy_distance(term, short, long):
+            return f"~{distance}"
+        return ""
 
     @staticmethod
     def join_clause(current_clause: str, new_clause: str, join_str: str):
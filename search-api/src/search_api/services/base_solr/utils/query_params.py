@@ -16,6 +16,8 @@ from dataclasses import dataclass
 
 from search_api.utils.base import BaseEnum
 
+from .search_profile import SearchProfile
+
 
 @dataclass
 class QueryParams:  # pylint: disable=too-few-public-methods
@@ -29,7 +31,7 @@ class QueryParams:  # pylint: disable=too-few-public-methods
     child_categories: dict[BaseEnum, list[str]]
     child_date_ranges: dict[BaseEnum, str]
     fields: list[str]
-    query_fields: dict[BaseEnum, str]
-    query_boost_fields: dict[BaseEnum, int]
-    query_fuzzy_fields: dict[BaseEnum, dict[str, int]]
+    search_profile: SearchProfile
     full_query_boosts: list[dict[str, BaseEnum | str]]
+    cursor_mark: str | None = None
+    include_facets: bool | None = None  # None: reuse the cached facets if there are any
@@ -0,0 +1,43 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compiled search profiles."""
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from search_api.utils.base import BaseEnum
+
+
+@dataclass(frozen=True)
+class ClauseTemplate:
+    """Class definition of the precompiled query clause for a single search profile field."""
+
+    field: BaseEnum
+    search_field: str  # field value (with the child filter prefix for child fields)
+    is_identifier: bool
+    boost: str  # i.e. '^2' or '' for no boost
+    fuzzy: tuple[int, int] | None  # (short, long) edit distances
+
+
+@dataclass(frozen=True)
+class SearchProfile:
+    """Class definition of a named, immutable search profile.
+
+    Profiles are compiled once (see QueryBuilder.compile_profile) so requests only need to bind their terms.
+    """
+
+    name: str
+    query_fields: Mapping[BaseEnum, str]
+    boost_fields: Mapping[BaseEnum, int]
+    fuzzy_fields: Mapping[BaseEnum, Mapping[str, int]]
+    clauses: tuple[ClauseTemplate, ...]
@@ -16,12 +16,17 @@ from dataclasses import asdict
 
 from flask import Flask
 
-from search_api.services.base_solr import Solr
-from search_api.services.base_solr.utils import QueryBuilder, prep_query_str
+from search_api.services.base_solr import CommitPolicy, Solr
+from search_api.services.base_solr.utils import QueryBuilder, prep_query_str_variants
 
 from .doc_fields import BusinessField, PartyField
 from .doc_models import BusinessDoc
 
+# search profile names
+BUSINESS_DEFAULT_PROFILE = "business-default"
+BUSINESS_V1_PROFILE = "business-v1"
+PARTY_DEFAULT_PROFILE = "party-default"
+
 
 class BusinessSolr(Solr):
     """Wrapper around the solr instance."""
@@ -50,12 +55,65 @@ class BusinessSolr(Solr):
             PartyField.PARTY_NAME.value, PartyField.PARTY_ROLE.value, PartyField.PARTY_TYPE.value
         ]
 
+        # search profiles
+        name_boost_fields = {
+            BusinessField.NAME_Q: 2,
+            BusinessField.NAME_STEM_AGRO: 2,
+            BusinessField.NAME_SINGLE: 2}
+        name_fuzzy_fields = {
+            BusinessField.NAME_Q: {"short": 1, "long": 2},
+            BusinessField.NAME_STEM_AGRO: {"short": 1, "long": 2},
+            BusinessField.NAME_SINGLE: {"short": 1, "long": 2}}
+        self.register_search_profile(self.query_builder.compile_profile(
+            name=BUSINESS_DEFAULT_PROFILE,
+            query_fields={
+                BusinessField.NAME_Q: "parent",
+                BusinessField.NAME_STEM_AGRO: "parent",
+                BusinessField.NAME_SINGLE: "parent",
+                BusinessField.NAME_XTRA_Q: "parent",
+                BusinessField.NAME_Q_EXACT: "parent",
+                BusinessField.BN_Q: "parent",
+                BusinessField.IDENTIFIER_Q: "parent"},
+            boost_fields=name_boost_fields,
+            fuzzy_fields=name_fuzzy_fields))
+        # deprecated v1 facets search (does not search name_q_exact)
+        self.register_search_profile(self.query_builder.compile_profile(
+            name=BUSINESS_V1_PROFILE,
+            query_fields={
+                BusinessField.NAME_Q: "parent",
+                BusinessField.NAME_STEM_AGRO: "parent",
+                BusinessField.NAME_SINGLE: "parent",
+                BusinessField.NAME_XTRA_Q: "parent",
+                BusinessField.BN_Q: "parent",
+                BusinessField.IDENTIFIER_Q: "parent"},
+            boost_fields=name_boost_fields,
+            fuzzy_fields=name_fuzzy_fields))
+        self.register_search_profile(self.query_builder.compile_profile(
+            name=PARTY_DEFAULT_PROFILE,
+            query_fields={
+                PartyField.PARTY_NAME_Q: "parent",
+                PartyField.PARTY_NAME_STEM_AGRO: "parent",
+                PartyField.PARTY_NAME_SINGLE: "parent",
+                PartyField.PARTY_NAME_XTRA_Q: "parent"},
+            boost_fields={
+                PartyField.PARTY_NAME_Q: 2,
+                PartyField.PARTY_NAME_STEM_AGRO: 2,
+                PartyField.PARTY_NAME_SINGLE: 2},
+            fuzzy_fields={
+                PartyField.PARTY_NAME_Q: {"short": 1, "long": 2},
+                PartyField.PARTY_NAME_STEM_AGRO: {"short": 1, "long": 2},
+                PartyField.PARTY_NAME_SINGLE: {"short": 1, "long": 2}}))
+
     def create_or_replace_docs(self,
                                docs: list[BusinessDoc] | None = None,
                                raw_docs: list[dict] | None = None,
                                timeout=25,
-                               additive=True):
-        """Create or replace solr docs in the core."""
+                               additive=True,
+                               commit_policy: CommitPolicy | None = None):
+        """Create or replace solr docs in the core.
+
+        Without a commit_policy small batches are hard committed and large (bulk) batches are not committed.
+        """
         update_list = raw_docs if raw_docs else [asdict(doc) for doc in docs]
 
         if not additive and not raw_docs:
@@ -64,65 +122,69 @@ class BusinessSolr(Solr):
                 if parties := business_dict.get(BusinessField.PARTIES.value, None):
                     business_dict[BusinessField.PARTIES.value] = {"set": parties}
 
-        url = self.update_url if len(update_list) < 1000 else self.bulk_update_url  # noqa: PLR2004
-        return self.call_solr("POST", url, json_data=update_list, timeout=timeout)
+        if not commit_policy:
+            commit_policy = CommitPolicy.HARD if len(update_list) < 1000 else CommitPolicy.EXPLICIT  # noqa: PLR2004
+        return self.call_solr("POST", self.get_update_url(commit_policy), json_data=update_list, timeout=timeout)
 
     @staticmethod
     def get_business_search_full_query_boost(query_value: str):
         """Return the list of full query boost information intended for business search."""
+        has_dash = "-" in query_value
+        dashes = (None, "remove", "pad", "tighten", "tighten-remove") if has_dash else (None,)
+        prepped_values = prep_query_str_variants(query_value, dashes)
         full_query_boosts = [
             {
                 "field": BusinessField.NAME_Q_EXACT,
-                "value": prep_query_str(query_value),
+                "value": prepped_values[None],
                 "boost": "3",
             },
             {
                 "field": BusinessField.NAME_SINGLE,
-                "value": prep_query_str(query_value),
+                "value": prepped_values[None],
                 "boost": "2",
             },
             {
                 "field": BusinessField.NAME_Q,
-                "value": prep_query_str(query_value),
+                "value": prepped_values[None],
                 "boost": "5",
                 "fuzzy": "5"
             },
             {
                 "field": BusinessField.NAME_STEM_AGRO,
-                "value": prep_query_str(query_value),
+                "value": prepped_values[None],
                 "boost": "3",
                 "fuzzy": "10"
             },
             {
                 "field": BusinessField.IDENTIFIER_Q_EDGE,
-                "value": prep_query_str(query_value),
+                "value": prepped_values[None],
                 "boost": "10",
             }
         ]
         # add more boost clauses if a dash is in the query
-        if "-" in query_value:
+        if has_dash:
             full_query_boosts += [
                 {
                     "field": BusinessField.NAME_Q,
-                    "value": prep_query_str(query_value, "remove"),
+                    "value": prepped_values["remove"],
                     "boost": "3",
                     "fuzzy": "5"
                 },
                 {
                     "field": BusinessField.NAME_Q,
-                    "value": prep_query_str(query_value, "pad"),
+                    "value": prepped_values["pad"],
                     "boost": "7",
                     "fuzzy": "5"
                 },
                 {
                     "field": BusinessField.NAME_Q,
-                    "value": prep_query_str(query_value, "tighten"),
+                    "value": prepped_values["tighten"],
                     "boost": "7",
                     "fuzzy": "5"
                 },
                 {
                     "field": BusinessField.NAME_Q,
-                    "value": prep_query_str(query_value, "tighten-remove"),
+                    "value": prepped_values["tighten-remove"],
                     "boost": "3",
                     "fuzzy": "5"
                 }
@@ -15,6 +15,8 @@
 """Manages solr dataclasses for search solr docs."""
 from dataclasses import dataclass
 
+from search_api.services.base_solr.utils import to_keyword
+
 from .party import PartyDoc
 
 
@@ -31,3 +33,9 @@ class BusinessDoc:
     goodStanding: bool = None
     modernized: bool = None
     parties: list[PartyDoc] | None = None
+    # normalized name for exact (bulk) matching
+    name_keyword: str | None = None
+
+    def __post_init__(self):
+        """Set the derived fields."""
+        self.name_keyword = to_keyword(self.name)
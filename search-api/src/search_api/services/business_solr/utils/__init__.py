@@ -12,5 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """This module manages util methods for the business solr service."""
+from .bulk_search import bulk_search
 from .business_search import business_search
 from .parties_search import parties_search
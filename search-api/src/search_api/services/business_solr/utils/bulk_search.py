@@ -0,0 +1,112 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Bulk business search methods."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app
+
+from search_api.services.base_solr.utils import to_keyword
+from search_api.services.business_solr import BusinessSolr
+from search_api.services.business_solr.doc_fields import BusinessField
+
+
+def bulk_search(names: list[str], identifiers: list[str], state: str | None, rows: int, solr: BusinessSolr):
+    """Return the businesses from Solr that exactly match any of the given names or identifiers.
+
+    Each doc includes the 'matchedValue' (the given name or identifier it matched) and the docs are
+    returned in the order of the given values. Large requests are split into chunks that are searched
+    concurrently and merged (with one more query for the total when a chunk has more matches than rows).
+    """
+    name_keywords = _get_keywords(names)
+    identifier_keywords = _get_keywords(identifiers, upper=True)
+    values = [(BusinessField.NAME_KEYWORD, keyword) for keyword in name_keywords] + \
+        [(BusinessField.IDENTIFIER, keyword) for keyword in identifier_keywords]
+    if not values:
+        return {"response": {"docs": [], "numFound": 0}}
+
+    chunk_size = max(current_app.config.get("BULK_SEARCH_CHUNK_SIZE", 100), 1)
+    chunks = [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+    if len(chunks) == 1:
+        chunk_results = [_search_chunk(chunks[0], state, rows, solr)]
+    else:
+        app = current_app._get_current_object()
+
+        def search_chunk(chunk: list[tuple[BusinessField, str]]):
+            with app.app_context():
+                return _search_chunk(chunk, state, rows, solr)
+
+        workers = min(max(current_app.config.get("BULK_SEARCH_WORKERS", 4), 1), len(chunks))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk-search") as executor:
+            chunk_results = list(executor.map(search_chunk, chunks))
+
+    # merge / dedupe the chunk results (a doc can match a name in one chunk and an identifier in another)
+    docs = {}
+    num_found = 0
+    capped = False
+    for results in chunk_results:
+        chunk_docs = results.get("response", {}).get("docs", [])
+        num_found += results.get("response", {}).get("numFound", 0)
+        capped = capped or results.get("response", {}).get("numFound", 0) > len(chunk_docs)
+        for doc in chunk_docs:
+            if doc.get(BusinessField.IDENTIFIER.value) in docs:
+                num_found -= 1
+                continue
+            docs[doc.get(BusinessField.IDENTIFIER.value)] = doc
+    if capped and len(chunks) > 1:
+        # duplicates beyond the returned docs of a chunk are not seen above so count the matches of every value
+        # at once (the terms filters have no clause limit and only the count is needed)
+        num_found = _search_chunk(values, state, 1, solr).get("response", {}).get("numFound", 0)
+
+    input_order = {value: index for index, value in enumerate([*name_keywords.values(),
+                                                                *identifier_keywords.values()])}
+    for doc in docs.values():
+        doc["matchedValue"] = identifier_keywords.get(doc.get(BusinessField.IDENTIFIER.value)) or \
+            name_keywords.get(to_keyword(doc.get(BusinessField.NAME.value)))
+    merged_docs = sorted(docs.values(), key=lambda doc: input_order.get(doc["matchedValue"], len(input_order)))
+    return {"response": {"docs": merged_docs[:rows], "numFound": num_found}}
+
+
+def _search_chunk(chunk: list[tuple[BusinessField, str]], state: str | None, rows: int, solr: BusinessSolr):
+    """Return the solr results for the chunk of (keyword field, keyword) values."""
+    start_time = time.perf_counter()
+    terms_queries = []
+    for field in [BusinessField.NAME_KEYWORD, BusinessField.IDENTIFIER]:
+        if keywords := [keyword for chunk_field, keyword in chunk if chunk_field == field]:
+            terms_queries.append(f"{{!terms f={field.value}}}{','.join(keywords)}")
+
+    # terms filters are constant scoring and skip the per clause query parsing
+    solr_payload = {
+        "query": "*:*",
+        "filter": [{"bool": {"should": terms_queries}}],
+        "fields": solr.business_fields
+    }
+    if state:
+        solr_payload["filter"].append(f"{BusinessField.STATE.value}:{state.upper()}")
+
+    results = solr.query(solr_payload, 0, rows)
+    current_app.logger.debug("Bulk search chunk of %s values found %s docs in %.3fs",
+                             len(chunk),
+                             results.get("response", {}).get("numFound"),
+                             time.perf_counter() - start_time)
+    return results
+
+
+def _get_keywords(values: list[str], upper=False) -> dict[str, str]:
+    """Return the keyword for each value mapped to the (first) value it came from."""
+    keywords = {}
+    for value in values:
+        if keyword := to_keyword(value):
+            keywords.setdefault(keyword.upper() if upper else keyword, value)
+    return keywords
@@ -12,47 +12,109 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Business search methods."""
+import re
+
+from flask import current_app
+
 from search_api.exceptions import SolrException
-from search_api.services.base_solr.utils import QueryParams
+from search_api.services.base_solr.utils import QueryParams, QueryProfile
 from search_api.services.business_solr import BusinessSolr
 from search_api.services.business_solr.doc_fields import BusinessField
 
 from .add_category_filters import add_category_filters
 
+# 9 digit BN or 15 character BN with the program account (i.e. 123456789BC0001)
+BN_REGEX = re.compile(r"^[0-9]{9}([a-zA-Z]{2}[0-9]{4})?$")
+# registry identifier (legal type prefix and 7 digits i.e. BC1234567, FM1234567, A1234567)
+IDENTIFIER_REGEX = re.compile(r"^(A|BC|C|CP|FM|LL|LP|MF|S|XCP|XL|XP|XS)[0-9]{7}$", re.IGNORECASE)
+
 
 def business_search(params: QueryParams, solr: BusinessSolr):
     """Return the list of businesses from Solr that match the query."""
+    # identifier / bn shaped values are resolved with a single terms filter before falling back to full text
+    if lookup_queries := _get_lookup_queries(params, solr):
+        results = solr.query(_get_solr_payload(params, solr, lookup_queries),
+                             params.start,
+                             params.rows,
+                             use_cache=True,
+                             cursor_mark=params.cursor_mark,
+                             include_facets=params.include_facets)
+        if results.get("response", {}).get("numFound"):
+            results["queryProfile"] = QueryProfile.LOOKUP.value
+            return results
+
+    # pick the query profile up front so long queries don't need a failed round trip to solr
+    profile = solr.query_builder.get_query_profile(
+        query=params.query,
+        search_profile=params.search_profile,
+        full_query_boosts=params.full_query_boosts,
+        max_clause_count=solr.max_clause_count)
+
+    solr_payload = _get_solr_payload(params, solr, _get_initial_queries(params, solr, profile))
+    try:
+        results = solr.query(solr_payload,
+                             params.start,
+                             params.rows,
+                             use_cache=True,
+                             cursor_mark=params.cursor_mark,
+                             include_facets=params.include_facets)
+    except SolrException as err:
+        if profile != QueryProfile.SIMPLE and "Query contains too many nested clauses" in err.error:
+            # the estimate was too low: retry with a simpler query
+            current_app.logger.debug(f"Clause count underestimated for profile {profile.value}. Retrying as simple.")
+            profile = QueryProfile.SIMPLE
+            retry_payload = _get_solr_payload(params, solr, _get_initial_queries(params, solr, profile))
+            results = solr.query(retry_payload,
+                                 params.start,
+                                 params.rows,
+                                 use_cache=True,
+                                 cursor_mark=params.cursor_mark,
+                                 include_facets=params.include_facets)
+        else:
+            # pass exception along
+            raise err
+
+    results["queryProfile"] = profile.value
+    return results
+
+
+def _get_lookup_queries(params: QueryParams, solr: BusinessSolr) -> dict | None:
+    """Return the base doc query / filter for an identifier or bn shaped query value (None for other values).
+
+    The terms query is constant scoring so every match gets the same synthetic score.
+    """
+    value = params.query["value"].strip()
+    if not value or len(value.split()) > 1:
+        return None
+
+    if IDENTIFIER_REGEX.match(value):
+        query = "{!terms f=" + BusinessField.IDENTIFIER.value + "}" + value.upper()
+    elif BN_REGEX.match(value):
+        # bn is not indexed, bn_q holds the lowercased ngrams (a 9 digit bn matches all its program accounts)
+        query = "{!terms f=" + BusinessField.BN_Q.value + "}" + value.lower()
+    else:
+        return None
+
+    return {"query": query, "filter": solr.query_builder.build_filter_clause(params.query)}
+
+
+def _get_initial_queries(params: QueryParams, solr: BusinessSolr, profile: QueryProfile):
+    """Return the base doc query / filter for the business search solr call."""
     # initialize payload with base doc query (init query / filter)
-    initial_queries = solr.query_builder.build_base_query(
+    initial_queries = solr.query_builder.build_profile_query(
         query=params.query,
-        fields=params.query_fields,
-        boost_fields=params.query_boost_fields,
-        fuzzy_fields=params.query_fuzzy_fields)
+        search_profile=params.search_profile,
+        use_boosts=profile.use_boosts,
+        use_fuzzy=profile.use_fuzzy)
 
     # boosts for term order result ordering
-    for info in params.full_query_boosts:
+    for info in params.full_query_boosts if profile.use_boosts else []:
         initial_queries["query"] += f' OR ({info["field"].value}:"{info["value"]}"'
         if fuzzy := info.get("fuzzy"):
             initial_queries["query"] += f'~{fuzzy}^{info["boost"]})'
         else:
             initial_queries["query"] += f'^{info["boost"]})'
-
-    solr_payload = _get_solr_payload(params, solr, initial_queries)
-    try:
-        return solr.query(solr_payload, params.start, params.rows)
-    except SolrException as err:
-        if "Query contains too many nested clauses" in err.error:
-            # retry with a simpler query
-            simplified_queries = solr.query_builder.build_base_query(
-                query=params.query,
-                fields=params.query_fields,
-                boost_fields={},
-                fuzzy_fields={}
-            )
-            retry_payload = _get_solr_payload(params, solr, simplified_queries)
-            return solr.query(retry_payload, params.start, params.rows)
-        # else pass exception along
-        raise err
+    return initial_queries
 
 
 def _get_solr_payload(params: QueryParams, solr: BusinessSolr, initial_queries: dict):
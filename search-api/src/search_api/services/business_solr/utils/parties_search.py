@@ -22,11 +22,9 @@ from .add_category_filters import add_category_filters
 def parties_search(params: QueryParams, solr: BusinessSolr):
     """Return the list of parties from Solr that match the query."""
     # initialize payload with base doc query (init query / filter)
-    initial_queries = solr.query_builder.build_base_query(
+    initial_queries = solr.query_builder.build_profile_query(
         query=params.query,
-        fields=params.query_fields,
-        boost_fields=params.query_boost_fields,
-        fuzzy_fields=params.query_fuzzy_fields)
+        search_profile=params.search_profile)
     # boosts for term order result ordering
     # TODO: use full_query_boosts to set this
     initial_queries["query"] += f' OR ({PartyField.PARTY_NAME_Q.value}:"{params.query["value"]}"~5^5)'
@@ -54,4 +52,9 @@ def parties_search(params: QueryParams, solr: BusinessSolr):
                          is_nested=False,
                          solr=solr)
 
-    return solr.query(solr_payload, params.start, params.rows)
+    return solr.query(solr_payload,
+                      params.start,
+                      params.rows,
+                      use_cache=True,
+                      cursor_mark=params.cursor_mark,
+                      include_facets=params.include_facets)
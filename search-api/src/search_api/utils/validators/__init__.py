@@ -20,7 +20,7 @@ def valid_charset(word: str) -> bool:
     return word == word.encode("ascii", "ignore").decode("utf-8")
 
 
-def validate_search_request() -> tuple[dict, list[dict]]:
+def validate_search_request() -> tuple[dict, list[dict]]:  # noqa: PLR0912
     """Validate the search request headers / payload."""
     errors = []
     request_json = request.get_json()
@@ -52,4 +52,13 @@ def validate_search_request() -> tuple[dict, list[dict]]:
     except ValueError:  # catch invalid start/row entry
         errors.append({"Invalid payload": "Expected integer for params: 'start', 'rows'"})
 
+    if (cursor_mark := request_json.get("cursorMark")) is not None:
+        if not cursor_mark or not isinstance(cursor_mark, str):
+            errors.append({"Invalid payload": "Expected a string for 'cursorMark' ('*' for the first page)."})
+        elif request_json.get("start"):
+            errors.append({"Invalid payload": "Expected 'start' to be omitted when paging with 'cursorMark'."})
+
+    if (include_facets := request_json.get("includeFacets")) is not None and not isinstance(include_facets, bool):
+        errors.append({"Invalid payload": "Expected a boolean for 'includeFacets'."})
+
     return request_json, errors
@@ -59,6 +59,42 @@ def test_import_solr_mocked(app, session, client, jwt, test_name, docs):
         assert m.request_history[0].json() == expected
 
 
+@pytest.mark.parametrize('test_name,commit_policy,expected_params', [
+    ('hard', 'hard', 'commit=true&overwrite=true&wt=json'),
+    ('within', 'within', 'overwrite=true&wt=json&commitWithin=1000'),
+    ('explicit', 'explicit', 'overwrite=true&wt=json'),
+])
+def test_import_solr_commit_policy(app, session, client, jwt, test_name, commit_policy, expected_params):
+    """Assert that the import uses the given commit policy and can be committed explicitly."""
+    solr_url = app.config.get('SOLR_SVC_BUS_LEADER_URL') + f'/business/update?{expected_params}'
+    solr_commit_url = app.config.get('SOLR_SVC_BUS_LEADER_URL') + '/business/update?wt=json'
+    with requests_mock.mock() as m:
+        m.post(solr_url)
+        m.post(solr_commit_url)
+        api_response = client.put(f'/internal/solr/import',
+                                  json={'businesses': [asdict(SOLR_TEST_DOCS[0])], 'commitPolicy': commit_policy},
+                                  headers=create_header(jwt, [SYSTEM_ROLE], **{'content-type': 'application/json'}))
+        assert api_response.status_code == HTTPStatus.CREATED
+        assert m.call_count == 1
+        assert m.request_history[0].url == solr_url
+
+        api_response = client.post(f'/internal/solr/import/commit',
+                                   json={},
+                                   headers=create_header(jwt, [SYSTEM_ROLE], **{'content-type': 'application/json'}))
+        assert api_response.status_code == HTTPStatus.OK
+        assert m.call_count == 2
+        assert m.request_history[1].url == solr_commit_url
+        assert m.request_history[1].text == '<commit/>'
+
+
+def test_import_solr_invalid_commit_policy(app, session, client, jwt):
+    """Assert that an unknown commit policy is rejected."""
+    api_response = client.put(f'/internal/solr/import',
+                              json={'businesses': [asdict(SOLR_TEST_DOCS[0])], 'commitPolicy': 'sometimes'},
+                              headers=create_header(jwt, [SYSTEM_ROLE], **{'content-type': 'application/json'}))
+    assert api_response.status_code == HTTPStatus.BAD_REQUEST
+
+
 @integration_solr
 def test_update_solr(session, client, jwt):
     """Assert that the import operation is successful."""
@@ -125,3 +161,38 @@ def test_update_solr_unauthorized(client, jwt):
                               headers=create_header(jwt, [], **{'content-type': 'application/json'}))
     # check
     assert api_response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_import_watermarks(app, session, client, jwt):
+    """Assert that the import watermarks can be set and returned."""
+    headers = create_header(jwt, [SYSTEM_ROLE], **{'content-type': 'application/json'})
+    api_response = client.put('/internal/solr/import/watermarks',
+                              json={'watermarks': {'COLIN': '2026-10-01T08:00:00+00:00',
+                                                   'LEAR': '2026-10-02T08:00:00+00:00'}},
+                              headers=headers)
+    assert api_response.status_code == HTTPStatus.OK
+    # update one of them
+    api_response = client.put('/internal/solr/import/watermarks',
+                              json={'watermarks': {'LEAR': '2026-10-03T08:00:00+00:00'}},
+                              headers=headers)
+    assert api_response.status_code == HTTPStatus.OK
+
+    api_response = client.get('/internal/solr/import/watermarks', headers=headers)
+    assert api_response.status_code == HTTPStatus.OK
+    assert api_response.json['watermarks'] == [
+        {'source': 'COLIN', 'watermark': '2026-10-01T08:00:00+00:00'},
+        {'source': 'LEAR', 'watermark': '2026-10-03T08:00:00+00:00'},
+    ]
+
+
+@pytest.mark.parametrize('test_name,payload', [
+    ('missing', {}),
+    ('not_a_dict', {'watermarks': ['COLIN']}),
+    ('invalid_date', {'watermarks': {'COLIN': 'yesterday'}}),
+])
+def test_import_watermarks_invalid(app, session, client, jwt, test_name, payload):
+    """Assert that invalid watermark payloads are rejected."""
+    api_response = client.put('/internal/solr/import/watermarks',
+                              json=payload,
+                              headers=create_header(jwt, [SYSTEM_ROLE], **{'content-type': 'application/json'}))
+    assert api_response.status_code == HTTPStatus.BAD_REQUEST
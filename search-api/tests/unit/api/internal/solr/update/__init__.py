@@ -12,10 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Test-Suite for the internal solr update API endpoints."""
+from http import HTTPStatus
+
 from search_api.enums import SolrDocEventStatus, SolrDocEventType
 from search_api.models import SolrDoc
+from search_api.services.authz import SYSTEM_ROLE
 from search_api.services.business_solr.doc_models import BusinessDoc
 
+from tests.unit.services.utils import create_header
+
 
 def check_update_recorded(identifier: str, status=SolrDocEventStatus.PENDING):
     """Assert the given identifier was recorded for an update."""
@@ -28,3 +33,10 @@ def check_update_recorded(identifier: str, status=SolrDocEventStatus.PENDING):
     assert len(doc_events) == 1
     assert doc_events[0].event_status == status
     assert doc_events[0].event_type == SolrDocEventType.UPDATE
+
+
+def get_update_stats(client, jwt) -> dict:
+    """Return the update endpoint stats of this worker process."""
+    api_response = client.get('/internal/solr/stats', headers=create_header(jwt, [SYSTEM_ROLE]))
+    assert api_response.status_code == HTTPStatus.OK
+    return api_response.json['updates']
@@ -64,7 +64,7 @@ def prep_resync(businesses: list[BusinessDoc]) -> list[tuple[BusinessDoc, SolrDo
 ])
 def test_resync_solr_mocked(app, session, client, jwt, test_name, payload: dict, businesses: list[BusinessDoc]):
     """Assert that resync operation sends correct payload to solr."""
-    solr_url = app.config.get('SOLR_SVC_BUS_LEADER_URL') + '/business/update?commit=true&overwrite=true&wt=json'
+    solr_url = app.config.get('SOLR_SVC_BUS_LEADER_URL') + '/business/update?overwrite=true&wt=json&commitWithin=1000'
     if 'identifiers' in payload:
         payload['identifiers'] = [x.id for x in businesses]
 
@@ -21,6 +21,7 @@ import pytest
 import requests_mock
 
 from search_api.enums import SolrDocEventStatus
+from search_api.models import SolrDoc
 from search_api.services import business_solr
 from search_api.services.authz import SYSTEM_ROLE
 
@@ -29,7 +30,7 @@ from tests.unit.services.utils import create_header
 from tests.unit.utils import (SOLR_UPDATE_REQUEST_TEMPLATE_CORP as CORP_TEMPLATE,
                               SOLR_UPDATE_REQUEST_TEMPLATE_FIRM as FIRM_TEMPLATE)
 
-from . import check_update_recorded
+from . import check_update_recorded, get_update_stats
 
 @pytest.mark.parametrize('test_name,request_json', [
     ('corp', CORP_TEMPLATE),
@@ -37,7 +38,7 @@ from . import check_update_recorded
 ])
 def test_update_solr_mocked(app, session, client, jwt, test_name, request_json):
     """Assert that update operation sends correct payload to solr."""
-    solr_url_update = app.config.get('SOLR_SVC_BUS_LEADER_URL') + '/business/update?commit=true&overwrite=true&wt=json'
+    solr_url_update = app.config.get('SOLR_SVC_BUS_LEADER_URL') + '/business/update?overwrite=true&wt=json&commitWithin=1000'
 
     with requests_mock.mock() as m:
         m.post(solr_url_update)
@@ -111,6 +112,153 @@ def test_update_solr_mocked(app, session, client, jwt, test_name, request_json):
             ]
 
 
+def test_update_solr_coalesced(app, session, client, jwt):
+    """Assert that sync only sends the newest doc once when a business has several pending updates."""
+    solr_url_update = app.config.get('SOLR_SVC_BUS_LEADER_URL') + '/business/update?overwrite=true&wt=json&commitWithin=1000'
+    business_identifier = CORP_TEMPLATE['business']['identifier']
+
+    with requests_mock.mock() as m:
+        m.post(solr_url_update)
+
+        for i in range(3):
+            request_json = deepcopy(CORP_TEMPLATE)
+            request_json['business']['legalName'] += f' {i}'
+            api_response = client.put(f'/internal/solr/update',
+                                      data=json.dumps(request_json),
+                                      headers=create_header(jwt, [SYSTEM_ROLE], **{'content-type': 'application/json'}))
+            assert api_response.status_code == HTTPStatus.ACCEPTED
+
+        api_response = client.get(f'/internal/solr/update/sync', headers={'content-type': 'application/json'})
+        # check success and coalescing stats
+        assert api_response.status_code == HTTPStatus.OK
+        assert api_response.json['events'] == 3
+        assert api_response.json['docsSynced'] == 1
+        assert api_response.json['eventsCoalesced'] == 2
+        assert api_response.json['coalescingRatio'] == round(2 / 3, 4)
+        # check only the newest doc was sent
+        assert m.call_count == 1
+        docs = m.request_history[0].json()
+        assert len(docs) == 1
+        assert docs[0]['name'] == CORP_TEMPLATE['business']['legalName'] + ' 2'
+        # check every event was completed (including the superseded ones)
+        solr_docs = SolrDoc.query.filter_by(identifier=business_identifier).all()
+        assert len(solr_docs) == 3
+        for solr_doc in solr_docs:
+            assert [event.event_status for event in solr_doc.solr_doc_events] == [SolrDocEventStatus.COMPLETE]
+
+
+def test_update_solr_no_changes(app, session, client, jwt):
+    """Assert that resubmitting an unchanged business does not record a new update and is counted as skipped."""
+    business_identifier = CORP_TEMPLATE['business']['identifier']
+    stats = get_update_stats(client, jwt)
+    for _ in range(2):
+        api_response = client.put(f'/internal/solr/update',
+                                  data=json.dumps(CORP_TEMPLATE),
+                                  headers=create_header(jwt, [SYSTEM_ROLE], **{'content-type': 'application/json'}))
+        assert api_response.status_code == HTTPStatus.ACCEPTED
+
+    assert 'No changes' in api_response.json['message']
+    assert SolrDoc.query.filter_by(identifier=business_identifier).count() == 1
+    check_update_recorded(business_identifier)
+    assert get_update_stats(client, jwt) == {'updates': stats['updates'] + 2,
+                                             'updatesSkipped': stats['updatesSkipped'] + 1}
+
+
+def test_update_solr_reverted_doc(app, session, client, jwt):
+    """Assert that sync writes the latest doc even when it matches an earlier applied doc."""
+    solr_url_update = app.config.get('SOLR_SVC_BUS_LEADER_URL') + '/business/update?overwrite=true&wt=json&commitWithin=1000'
+    business_identifier = CORP_TEMPLATE['business']['identifier']
+    changed_json = deepcopy(CORP_TEMPLATE)
+    changed_json['business']['legalName'] += ' changed'
+
+    with requests_mock.mock() as m:
+        m.post(solr_url_update)
+        for request_json in [CORP_TEMPLATE, changed_json, CORP_TEMPLATE]:
+            client.put(f'/internal/solr/update',
+                       data=json.dumps(request_json),
+                       headers=create_header(jwt, [SYSTEM_ROLE], **{'content-type': 'application/json'}))
+            if request_json is changed_json:
+                continue
+            api_response = client.get(f'/internal/solr/update/sync', headers={'content-type': 'application/json'})
+            assert api_response.status_code == HTTPStatus.OK
+
+        # 2nd sync coalesces the changed doc and still writes the latest doc (the changed one may be in solr already)
+        assert m.call_count == 2
+        assert api_response.json['events'] == 2
+        assert api_response.json['docsSynced'] == 1
+        assert api_response.json['eventsCoalesced'] == 1
+        assert m.request_history[1].json()[0]['name'] == CORP_TEMPLATE['business']['legalName']
+        for solr_doc in SolrDoc.query.filter_by(identifier=business_identifier).all():
+            assert [event.event_status for event in solr_doc.solr_doc_events] == [SolrDocEventStatus.COMPLETE]
+
+
+def test_update_solr_after_import(app, session, client, jwt):
+    """Assert that an update matching the last applied doc is still synced after the importer changed the doc."""
+    solr_url = app.config.get('SOLR_SVC_BUS_LEADER_URL') + '/business/update'
+    business_identifier = CORP_TEMPLATE['business']['identifier']
+    headers = create_header(jwt, [SYSTEM_ROLE], **{'content-type': 'application/json'})
+
+    stats = get_update_stats(client, jwt)
+    with requests_mock.mock() as m:
+        m.post(solr_url)
+        client.put(f'/internal/solr/update', data=json.dumps(CORP_TEMPLATE), headers=headers)
+        client.get(f'/internal/solr/update/sync', headers={'content-type': 'application/json'})
+        # the importer writes its own version of the doc (i.e. the good standing lapsed)
+        imported_doc = {**SolrDoc.find_most_recent_by_identifier(business_identifier).doc, 'goodStanding': True}
+        api_response = client.put(f'/internal/solr/import', json={'businesses': [imported_doc]}, headers=headers)
+        assert api_response.status_code == HTTPStatus.CREATED
+        # the same update comes through the queue again
+        api_response = client.put(f'/internal/solr/update', data=json.dumps(CORP_TEMPLATE), headers=headers)
+        assert api_response.status_code == HTTPStatus.ACCEPTED
+        assert 'No changes' not in api_response.json['message']
+        api_response = client.get(f'/internal/solr/update/sync', headers={'content-type': 'application/json'})
+
+    assert api_response.status_code == HTTPStatus.OK
+    assert api_response.json['docsSynced'] == 1
+    assert m.call_count == 3
+    assert m.request_history[2].json()[0]['goodStanding'] is False
+    assert SolrDoc.query.filter_by(identifier=business_identifier).count() == 2
+    # the update matched an applied doc so it was not skipped
+    assert get_update_stats(client, jwt) == {'updates': stats['updates'] + 2,
+                                             'updatesSkipped': stats['updatesSkipped']}
+
+
+@pytest.mark.parametrize('test_name,request_json,changes,expected_atomic', [
+    ('corp_parent_only', CORP_TEMPLATE, {'goodStanding': True, 'state': 'HISTORICAL'}, True),
+    ('firm_parent_only', FIRM_TEMPLATE, {'goodStanding': False}, True),
+    ('firm_copied_to_parties', FIRM_TEMPLATE, {'state': 'HISTORICAL'}, False),
+])
+def test_update_solr_atomic(app, session, client, jwt, test_name, request_json, changes, expected_atomic):
+    """Assert that sync sends atomic updates when only the parent fields changed since the last applied doc."""
+    solr_url_update = app.config.get('SOLR_SVC_BUS_LEADER_URL') + '/business/update?overwrite=true&wt=json&commitWithin=1000'
+    changed_json = deepcopy(request_json)
+    changed_json['business'].update(changes)
+
+    with requests_mock.mock() as m:
+        m.post(solr_url_update)
+        for update_json in [request_json, changed_json]:
+            client.put(f'/internal/solr/update',
+                       data=json.dumps(update_json),
+                       headers=create_header(jwt, [SYSTEM_ROLE], **{'content-type': 'application/json'}))
+            api_response = client.get(f'/internal/solr/update/sync', headers={'content-type': 'application/json'})
+            assert api_response.status_code == HTTPStatus.OK
+
+        assert m.call_count == 2
+        assert api_response.json['docsSynced'] == 1
+        if expected_atomic:
+            # every parent field is set (the party docs are left as is)
+            latest_doc = SolrDoc.find_most_recent_by_identifier(request_json['business']['identifier']).doc
+            parent_fields = {field: value for field, value in latest_doc.items() if field not in ['id', 'parties']}
+            expected = {'id': latest_doc['id'], **{field: {'set': value} for field, value in parent_fields.items()}}
+            assert api_response.json['atomicUpdates'] == 1
+            assert m.request_history[1].json() == [expected]
+            assert expected['goodStanding'] == {'set': changes['goodStanding']}
+        else:
+            # the parent status is copied onto the party docs so the whole block is replaced
+            assert api_response.json['atomicUpdates'] == 0
+            assert m.request_history[1].json()[0]['parties']['set'][0]['parentStatus'] == 'HISTORICAL'
+
+
 @integration_solr
 @pytest.mark.parametrize('test_name,request_json', [
     ('corp', CORP_TEMPLATE),
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Test-Suite to ensure that the business search endpoints/functions work as expected."""
+import re
 import time
 from http import HTTPStatus
 
@@ -64,6 +65,122 @@ def test_businesses_solr_mock(app, session, client, requests_mock, test_name, qu
     assert resp_json['searchResults']['totalResults'] == 0
 
 
+@pytest.mark.parametrize('test_name,cursor_mark', [
+    ('test_first_page', '*'),
+    ('test_next_page', 'AoIIP4AAACgwMDAwMDAwMDAw'),
+])
+def test_businesses_cursor_solr_mock(app, session, client, requests_mock, test_name, cursor_mark):
+    """Assert that the search call pages with a solr cursor when given a cursorMark."""
+    next_cursor_mark = 'AoIIP4AAACgwMDAwMDAwMDEx'
+    # setup mocks
+    mock = requests_mock.post(f"{app.config.get('SOLR_SVC_BUS_LEADER_URL')}/business/query",
+                              json={'response': {'docs': [], 'numFound': 0, 'start': 0},
+                                    'nextCursorMark': next_cursor_mark})
+    # call search
+    resp = client.post('/api/v2/search/businesses',
+                       headers={'content-type': 'application/json'},
+                       json={'query': {'value': 'test'}, 'cursorMark': cursor_mark})
+    # test
+    assert resp.status_code == HTTPStatus.OK
+    resp_json = resp.json
+    assert resp_json['searchResults']['queryInfo']['cursorMark'] == cursor_mark
+    assert resp_json['searchResults']['nextCursorMark'] == next_cursor_mark
+    solr_payload = mock.last_request.json()
+    assert solr_payload['params']['cursorMark'] == cursor_mark
+    assert solr_payload['sort'] == 'score desc, id asc'
+    assert solr_payload['offset'] == 0
+
+
+@pytest.mark.parametrize('test_name,value,expected_profile', [
+    ('test_short', 'test business', 'full'),
+    ('test_long', ' '.join(f'term{i}' for i in range(15)), 'no-fuzzy'),
+    ('test_very_long', ' '.join(f'term{i}' for i in range(300)), 'simple'),
+])
+def test_businesses_query_profile_solr_mock(app, session, client, requests_mock, test_name, value, expected_profile):
+    """Assert that the search call picks the query profile up front based on the estimated clause count."""
+    # setup mocks
+    mock = requests_mock.post(f"{app.config.get('SOLR_SVC_BUS_LEADER_URL')}/business/query",
+                              json={'response': {'docs': [], 'numFound': 0, 'start': 0}})
+    # call search
+    resp = client.post('/api/v2/search/businesses',
+                       headers={'content-type': 'application/json'},
+                       json={'query': {'value': value}})
+    # test
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.json['searchResults']['queryInfo']['queryProfile'] == expected_profile
+    assert mock.call_count == 1
+    solr_query = mock.last_request.json()['query']
+    # fuzzy term clauses (phrase slop on the full query boosts is fine)
+    assert bool(re.search(r'[^"]~\d', solr_query)) == (expected_profile == 'full')
+
+
+def test_businesses_query_profile_retry_solr_mock(app, session, client, requests_mock):
+    """Assert that the search call still falls back to the simple profile when solr rejects the query."""
+    # setup mocks
+    mock = requests_mock.post(f"{app.config.get('SOLR_SVC_BUS_LEADER_URL')}/business/query", [
+        {'json': {'error': {'msg': 'Query contains too many nested clauses; maxClauseCount is set to 1024'}},
+         'status_code': HTTPStatus.BAD_REQUEST},
+        {'json': {'response': {'docs': [], 'numFound': 0, 'start': 0}}}])
+    # call search
+    resp = client.post('/api/v2/search/businesses',
+                       headers={'content-type': 'application/json'},
+                       json={'query': {'value': 'test business'}})
+    # test
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.json['searchResults']['queryInfo']['queryProfile'] == 'simple'
+    assert mock.call_count == 2
+
+
+@pytest.mark.parametrize('test_name,value,expected_query', [
+    ('test_identifier', 'bc1234567', '{!terms f=identifier}BC1234567'),
+    ('test_identifier_xpro', 'A1234567', '{!terms f=identifier}A1234567'),
+    ('test_bn_9', '123456789', '{!terms f=bn_q}123456789'),
+    ('test_bn_15', '123456789BC0001', '{!terms f=bn_q}123456789bc0001'),
+])
+@pytest.mark.parametrize('num_found', [1, 0])
+def test_businesses_lookup_solr_mock(app, session, client, requests_mock, test_name, value, expected_query, num_found):
+    """Assert that identifier / bn shaped values are looked up first and fall back to full text on a miss."""
+    # setup mocks
+    mock = requests_mock.post(f"{app.config.get('SOLR_SVC_BUS_LEADER_URL')}/business/query",
+                              json={'response': {'docs': [], 'numFound': num_found, 'start': 0}})
+    # call search
+    resp = client.post('/api/v2/search/businesses',
+                       headers={'content-type': 'application/json'},
+                       json={'query': {'value': value}})
+    # test
+    assert resp.status_code == HTTPStatus.OK
+    assert mock.request_history[0].json()['query'] == expected_query
+    if num_found:
+        assert mock.call_count == 1
+        assert resp.json['searchResults']['queryInfo']['queryProfile'] == 'lookup'
+    else:
+        assert mock.call_count == 2
+        assert resp.json['searchResults']['queryInfo']['queryProfile'] == 'full'
+
+
+@pytest.mark.parametrize('test_name,value', [
+    ('test_letters_digits', 'abc123'),
+    ('test_short', 'a1'),
+    ('test_unknown_prefix', 'zz1234567'),
+    ('test_too_few_digits', 'bc12345'),
+    ('test_too_many_digits', 'fm123456789'),
+])
+def test_businesses_no_lookup_solr_mock(app, session, client, requests_mock, test_name, value):
+    """Assert that values that are not identifier / bn shaped go straight to the full text search."""
+    # setup mocks
+    mock = requests_mock.post(f"{app.config.get('SOLR_SVC_BUS_LEADER_URL')}/business/query",
+                              json={'response': {'docs': [], 'numFound': 0, 'start': 0}})
+    # call search
+    resp = client.post('/api/v2/search/businesses',
+                       headers={'content-type': 'application/json'},
+                       json={'query': {'value': value}})
+    # test
+    assert resp.status_code == HTTPStatus.OK
+    assert mock.call_count == 1
+    assert '{!terms' not in mock.last_request.json()['query']
+    assert resp.json['searchResults']['queryInfo']['queryProfile'] != 'lookup'
+
+
 @integration_solr
 @pytest.mark.parametrize('test_name,query,categories,expected', [
     ('test_basic_name',  # NOTE: test setup checks for 'test_basic_name' on the first run
@@ -442,6 +559,15 @@ def test_search_error(app, session, client, requests_mock):
     ('test_invalid_rows_2',
      {'query': {'value': 'test'}, 'rows': '&899'},
      [{'Invalid payload': "Expected integer for params: 'start', 'rows'"}]),
+    ('test_invalid_cursor_1',
+     {'query': {'value': 'test'}, 'cursorMark': 1},
+     [{'Invalid payload': "Expected a string for 'cursorMark' ('*' for the first page)."}]),
+    ('test_invalid_cursor_2',
+     {'query': {'value': 'test'}, 'cursorMark': '*', 'start': 10},
+     [{'Invalid payload': "Expected 'start' to be omitted when paging with 'cursorMark'."}]),
+    ('test_invalid_include_facets',
+     {'query': {'value': 'test'}, 'includeFacets': 'yes'},
+     [{'Invalid payload': "Expected a boolean for 'includeFacets'."}]),
 ])
 def test_search_bad_request(app, session, client, test_name, query, errors):
     """Assert that the business search call validates the payload."""
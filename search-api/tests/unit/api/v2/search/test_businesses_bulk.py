@@ -47,6 +47,87 @@ def test_businesses_bulk_solr_mock(app, session, client, requests_mock, test_nam
     assert resp_json['totalResults'] == 0
 
 
+def test_businesses_bulk_terms_solr_mock(app, session, client, requests_mock):
+    """Assert that the bulk search uses terms filters on the keyword fields and returns the matched values."""
+    # setup mocks
+    docs = [{'identifier': 'CP1234567', 'name': 'business one 1'},
+            {'identifier': 'BC0004567', 'name': "Bob's Bar-B-Q Ltd."}]
+    mock = requests_mock.post(f"{app.config.get('SOLR_SVC_BUS_LEADER_URL')}/business/query",
+                              json={'response': {'docs': docs, 'numFound': 2, 'start': 0}})
+    # call search
+    resp = client.post('/api/v2/search/businesses/bulk',
+                       headers={'content-type': 'application/json'},
+                       json={'names': ["BOB'S BAR-B-Q LTD", 'business two 2'], 'identifiers': ['cp1234567'], 'state': 'active'})
+    # test
+    assert resp.status_code == HTTPStatus.OK
+    solr_payload = mock.last_request.json()
+    assert solr_payload['query'] == '*:*'
+    assert solr_payload['filter'] == [
+        {'bool': {'should': ['{!terms f=name_keyword}bobbarbqltd,businesstwo2', '{!terms f=identifier}CP1234567']}},
+        'status:ACTIVE']
+    results = resp.json['results']
+    assert [result['matchedValue'] for result in results] == ["BOB'S BAR-B-Q LTD", 'cp1234567']
+
+
+@pytest.mark.parametrize('test_name,chunk_size,rows,expected_calls,expected_identifiers', [
+    ('test_single_chunk', 100, 10, 1, ['BC0000002', 'BC0000003', 'BC0000001']),
+    ('test_chunks', 1, 10, 4, ['BC0000002', 'BC0000003', 'BC0000001']),
+    ('test_chunks_rows', 2, 2, 2, ['BC0000002', 'BC0000003']),
+])
+def test_businesses_bulk_chunks_solr_mock(app, session, client, requests_mock, monkeypatch,
+                                          test_name, chunk_size, rows, expected_calls, expected_identifiers):
+    """Assert that large bulk searches are chunked and the results are merged / deduplicated."""
+    monkeypatch.setitem(app.config, 'BULK_SEARCH_CHUNK_SIZE', chunk_size)
+    # setup mocks (every chunk finds the same docs)
+    docs = [{'identifier': 'BC0000003', 'name': 'business three'},
+            {'identifier': 'BC0000001', 'name': 'business one'},
+            {'identifier': 'BC0000002', 'name': 'business two'}]
+    mock = requests_mock.post(f"{app.config.get('SOLR_SVC_BUS_LEADER_URL')}/business/query",
+                              json={'response': {'docs': docs, 'numFound': 3, 'start': 0}})
+    # call search
+    resp = client.post('/api/v2/search/businesses/bulk',
+                       headers={'content-type': 'application/json'},
+                       json={'names': ['business one', 'business two'],
+                             'identifiers': ['BC0000003', 'BC0000001'],
+                             'rows': rows})
+    # test
+    assert resp.status_code == HTTPStatus.OK
+    assert mock.call_count == expected_calls
+    assert resp.json['totalResults'] == 3
+    assert [result['identifier'] for result in resp.json['results']] == expected_identifiers
+
+
+def test_businesses_bulk_chunks_capped_solr_mock(app, session, client, requests_mock, monkeypatch):
+    """Assert that the total does not count duplicates beyond the rows returned for each chunk."""
+    monkeypatch.setitem(app.config, 'BULK_SEARCH_CHUNK_SIZE', 2)
+    business_one = {'identifier': 'BC0000001', 'name': 'business one'}
+    business_two = {'identifier': 'BC0000002', 'name': 'business two'}
+
+    def solr_results(request, context):
+        """Return the first doc of the matches (BC0000001 matches a name and an identifier)."""
+        terms_queries = request.json()['filter'][0]['bool']['should']
+        if len(terms_queries) == 2:
+            # the count of all the values
+            return {'response': {'docs': [business_one], 'numFound': 3, 'start': 0}}
+        if 'name_keyword' in terms_queries[0]:
+            return {'response': {'docs': [business_two], 'numFound': 2, 'start': 0}}
+        return {'response': {'docs': [business_one], 'numFound': 2, 'start': 0}}
+
+    mock = requests_mock.post(f"{app.config.get('SOLR_SVC_BUS_LEADER_URL')}/business/query", json=solr_results)
+    # call search
+    resp = client.post('/api/v2/search/businesses/bulk',
+                       headers={'content-type': 'application/json'},
+                       json={'names': ['business one', 'business two'],
+                             'identifiers': ['BC0000003', 'BC0000001'],
+                             'rows': 1})
+    # test
+    assert resp.status_code == HTTPStatus.OK
+    # 2 chunks + the count
+    assert mock.call_count == 3
+    assert resp.json['totalResults'] == 3
+    assert [result['identifier'] for result in resp.json['results']] == ['BC0000002']
+
+
 @integration_solr
 @pytest.mark.parametrize('test_name,names,identifiers,state,expected', [
     ('test_name',  # NOTE: test setup checks for 'test_name' on the first run
@@ -158,6 +239,7 @@ def test_businesses_bulk(app, session, client, test_name, names, identifiers, st
     results = resp_json['results']
     for result in results:
         del result['score']
+        assert result.pop('matchedValue') in names + identifiers
     assert resp_json['totalResults'] == len(expected)
     assert results == expected
 
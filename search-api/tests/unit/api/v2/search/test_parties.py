@@ -65,6 +65,27 @@ def test_parties_solr_mock(app, session, client, requests_mock, test_name, query
     assert resp_json['searchResults']['totalResults'] == 0
 
 
+def test_parties_cursor_solr_mock(app, session, client, requests_mock):
+    """Assert that the parties search call pages with a solr cursor when given a cursorMark."""
+    next_cursor_mark = 'AoIIP4AAACgwMDAwMDAwMDEx'
+    # setup mocks
+    mock = requests_mock.post(f"{app.config.get('SOLR_SVC_BUS_LEADER_URL')}/business/query",
+                              json={'response': {'docs': [], 'numFound': 0, 'start': 0},
+                                    'nextCursorMark': next_cursor_mark})
+    # call search
+    resp = client.post('/api/v2/search/parties',
+                       headers={'content-type': 'application/json'},
+                       json={'query': {'value': 'test'},
+                             'categories': {PartyField.PARTY_ROLE.value: ['partner']},
+                             'cursorMark': '*'})
+    # test
+    assert resp.status_code == HTTPStatus.OK
+    assert resp.json['searchResults']['nextCursorMark'] == next_cursor_mark
+    solr_payload = mock.last_request.json()
+    assert solr_payload['params']['cursorMark'] == '*'
+    assert solr_payload['sort'] == 'score desc, id asc'
+
+
 @integration_solr
 @pytest.mark.parametrize('test_name,query,categories,expected', [
     ('test_basic_name',  # NOTE: test setup checks for 'test_basic' on the first run
@@ -239,6 +260,9 @@ def test_search_error(app, session, client, requests_mock):
     ('test_invalid_rows_2',
      {'query': {'value': 'test'}, 'categories': {'partyRoles': ['partner']}, 'rows': '&899'},
      [{'Invalid payload': "Expected integer for params: 'start', 'rows'"}]),
+    ('test_invalid_cursor',
+     {'query': {'value': 'test'}, 'categories': {'partyRoles': ['partner']}, 'cursorMark': '*', 'start': 10},
+     [{'Invalid payload': "Expected 'start' to be omitted when paging with 'cursorMark'."}]),
 ])
 def test_search_bad_request(app, session, client, test_name, payload, errors):
     """Assert that the business search call validates the payload."""
@@ -12,12 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests to assure the SolrDoc Class."""
+import os
+import time
+
 import pytest
 from copy import deepcopy
 from dataclasses import asdict
 from datetime import datetime, timedelta
 
-from search_api.models import SolrDoc
+from sqlalchemy import text
+
+from search_api.enums import SolrDocEventStatus, SolrDocEventType
+from search_api.models import SolrDoc, SolrDocEvent, SolrDocLatest, db
 from search_api.services.business_solr.doc_models import BusinessDoc
 from search_api.utils.util import utcnow
 
@@ -54,6 +60,160 @@ def test_find_most_recent_by_identifier(session):
     assert BusinessDoc(**solr_doc.doc).name == business_doc_3.name
 
 
+def test_solr_doc_latest(session):
+    """Assert save keeps the latest doc of each identifier and rebuild_latest restores it."""
+    business_doc = deepcopy(SOLR_TEST_DOCS[0])
+    newer_doc = SolrDoc(doc=asdict(business_doc), identifier=business_doc.identifier).save()
+    # a doc with an older submission date does not replace the latest doc
+    SolrDoc(doc=asdict(business_doc), identifier=business_doc.identifier,
+            submission_date=utcnow() - timedelta(days=1)).save()
+
+    latest = SolrDocLatest.query.get(business_doc.identifier)
+    assert latest.solr_doc_id == newer_doc.id
+    assert latest.submission_date == newer_doc.submission_date
+
+    SolrDocLatest.query.filter_by(identifier=business_doc.identifier).delete()
+    assert SolrDoc.find_most_recent_by_identifier(business_doc.identifier) is None
+    SolrDoc.rebuild_latest()
+    assert SolrDoc.find_most_recent_by_identifier(business_doc.identifier).id == newer_doc.id
+
+
+def test_find_most_recent_by_identifiers(session):
+    """Assert find_most_recent_by_identifiers returns the latest doc of each identifier in one call."""
+    business_doc_1 = deepcopy(SOLR_TEST_DOCS[0])
+    business_doc_2 = deepcopy(SOLR_TEST_DOCS[0])
+    business_doc_2.name += '2'
+    business_doc_3 = deepcopy(SOLR_TEST_DOCS[1])
+
+    SolrDoc(doc=asdict(business_doc_1), identifier=business_doc_1.identifier).save()
+    solr_doc_2 = SolrDoc(doc=asdict(business_doc_2), identifier=business_doc_2.identifier).save()
+    solr_doc_3 = SolrDoc(doc=asdict(business_doc_3), identifier=business_doc_3.identifier).save()
+
+    # test method (duplicates and unknown identifiers are ignored)
+    solr_docs = SolrDoc.find_most_recent_by_identifiers(
+        [business_doc_1.identifier, business_doc_3.identifier, business_doc_1.identifier, 'UNKNOWN'])
+    assert len(solr_docs) == 2
+    assert solr_docs[business_doc_1.identifier].id == solr_doc_2.id
+    assert solr_docs[business_doc_3.identifier].id == solr_doc_3.id
+    for identifier, solr_doc in solr_docs.items():
+        assert solr_doc.id == SolrDoc.find_most_recent_by_identifier(identifier).id
+
+    assert SolrDoc.find_most_recent_by_identifiers([]) == {}
+
+
+def test_content_hash(session):
+    """Assert the content hash is set on save and ignores key / party order."""
+    business_doc = deepcopy(SOLR_TEST_DOCS[0])
+    doc = asdict(business_doc)
+    solr_doc = SolrDoc(doc=doc, identifier=business_doc.identifier).save()
+    assert solr_doc.content_hash == SolrDoc.get_content_hash(doc)
+
+    reordered = dict(reversed(list(doc.items())))
+    assert SolrDoc.get_content_hash(reordered) == solr_doc.content_hash
+    parties = [{'id': '1', 'partyName': 'a'}, {'id': '2', 'partyName': 'b'}]
+    assert SolrDoc.get_content_hash({**doc, 'parties': parties}) == \
+        SolrDoc.get_content_hash({**doc, 'parties': list(reversed(parties))})
+
+    changed = {**doc, 'status': 'HISTORICAL' if doc['status'] != 'HISTORICAL' else 'ACTIVE'}
+    assert SolrDoc.get_content_hash(changed) != solr_doc.content_hash
+
+
+def test_find_last_applied_by_identifiers(session):
+    """Assert find_last_applied_by_identifiers only returns docs with a COMPLETE event."""
+    business_doc = deepcopy(SOLR_TEST_DOCS[0])
+    applied_doc = SolrDoc(doc=asdict(business_doc), identifier=business_doc.identifier).save()
+    SolrDocEvent(event_type=SolrDocEventType.UPDATE, solr_doc_id=applied_doc.id,
+                 event_status=SolrDocEventStatus.COMPLETE).save()
+    pending_doc = SolrDoc(doc=asdict(business_doc), identifier=business_doc.identifier).save()
+    SolrDocEvent(event_type=SolrDocEventType.UPDATE, solr_doc_id=pending_doc.id).save()
+
+    applied_docs = SolrDoc.find_last_applied_by_identifiers([business_doc.identifier, 'UNKNOWN'])
+    assert list(applied_docs) == [business_doc.identifier]
+    assert applied_docs[business_doc.identifier].id == applied_doc.id
+
+
+@pytest.mark.parametrize('test_name,event_type,event_status,expected', [
+    ('pending', SolrDocEventType.UPDATE, SolrDocEventStatus.PENDING, True),
+    ('error', SolrDocEventType.UPDATE, SolrDocEventStatus.ERROR, True),
+    ('complete', SolrDocEventType.UPDATE, SolrDocEventStatus.COMPLETE, False),
+    ('resync', SolrDocEventType.RESYNC, SolrDocEventStatus.PENDING, False),
+])
+def test_is_pending(session, test_name, event_type, event_status, expected):
+    """Assert is_pending is only True while the doc has an unapplied UPDATE event."""
+    business_doc = deepcopy(SOLR_TEST_DOCS[0])
+    solr_doc = SolrDoc(doc=asdict(business_doc), identifier=business_doc.identifier).save()
+    assert not solr_doc.is_pending()
+
+    SolrDocEvent(event_type=event_type, solr_doc_id=solr_doc.id, event_status=event_status).save()
+    assert solr_doc.is_pending() == expected
+
+
+def test_get_identifiers_by_ids(session):
+    """Assert get_identifiers_by_ids maps each solr doc id to its identifier."""
+    solr_docs = [SolrDoc(doc=asdict(doc), identifier=doc.identifier).save() for doc in deepcopy(SOLR_TEST_DOCS[:3])]
+
+    identifiers = SolrDoc.get_identifiers_by_ids([solr_doc.id for solr_doc in solr_docs])
+    assert identifiers == {solr_doc.id: solr_doc.identifier for solr_doc in solr_docs}
+    assert SolrDoc.get_identifiers_by_ids([]) == {}
+
+
+def test_delete_history(session):
+    """Assert delete_history only removes old superseded docs that have no outstanding events."""
+    business_doc = deepcopy(SOLR_TEST_DOCS[0])
+    old_date = utcnow() - timedelta(days=100)
+    old_docs = [SolrDoc(doc=asdict(business_doc), identifier=business_doc.identifier,
+                        submission_date=old_date + timedelta(minutes=i)).save() for i in range(4)]
+    for old_doc in old_docs[:3]:
+        SolrDocEvent(event_type=SolrDocEventType.UPDATE, solr_doc_id=old_doc.id,
+                     event_status=SolrDocEventStatus.COMPLETE).save()
+    # still pending so must be kept
+    SolrDocEvent(event_type=SolrDocEventType.UPDATE, solr_doc_id=old_docs[3].id).save()
+    latest_doc = SolrDoc(doc=asdict(business_doc), identifier=business_doc.identifier).save()
+    # the latest doc of an identifier is kept no matter how old it is
+    other_doc = deepcopy(SOLR_TEST_DOCS[1])
+    only_doc = SolrDoc(doc=asdict(other_doc), identifier=other_doc.identifier, submission_date=old_date).save()
+    old_doc_ids = [old_doc.id for old_doc in old_docs]
+
+    assert SolrDoc.delete_history(utcnow() - timedelta(days=90), 2) == 3
+
+    assert [doc.id for doc in SolrDoc.query.filter(SolrDoc.id.in_(old_doc_ids)).all()] == [old_docs[3].id]
+    assert SolrDocEvent.query.filter(SolrDocEvent.solr_doc_id.in_(old_doc_ids[:3])).count() == 0
+    assert SolrDoc.find_most_recent_by_identifier(business_doc.identifier).id == latest_doc.id
+    assert SolrDoc.find_most_recent_by_identifier(other_doc.identifier).id == only_doc.id
+
+
+@pytest.mark.slow
+def test_find_most_recent_by_identifiers_benchmark(session):
+    """Assert the set based latest doc lookup beats the per identifier lookups on a seeded table.
+
+    Excluded by default (run with: pytest -m slow). Scale it up with the BENCHMARK_SOLR_DOC_* env vars.
+    """
+    num_rows = int(os.getenv('BENCHMARK_SOLR_DOC_ROWS', '20000'))
+    num_identifiers = int(os.getenv('BENCHMARK_SOLR_DOC_IDENTIFIERS', '5000'))
+    batch_size = int(os.getenv('BENCHMARK_SOLR_DOC_BATCH', '500'))
+    # seed several docs per identifier with increasing submission dates
+    db.session.execute(text("""
+        INSERT INTO solr_docs (doc, identifier, submission_date)
+        SELECT '{}'::jsonb, 'BM' || lpad((i % :num_identifiers)::text, 7, '0'), now() - (i || ' seconds')::interval
+        FROM generate_series(1, :num_rows) AS i
+    """), {'num_identifiers': num_identifiers, 'num_rows': num_rows})
+    SolrDoc.rebuild_latest()
+    db.session.execute(text('ANALYZE solr_docs'))
+    db.session.execute(text('ANALYZE solr_doc_latest'))
+    identifiers = [f'BM{i:07}' for i in range(0, num_identifiers, max(1, num_identifiers // batch_size))][:batch_size]
+
+    start = time.perf_counter()
+    looped = {identifier: SolrDoc.find_most_recent_by_identifier(identifier).id for identifier in identifiers}
+    looped_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = {identifier: doc.id for identifier, doc in SolrDoc.find_most_recent_by_identifiers(identifiers).items()}
+    batched_time = time.perf_counter() - start
+
+    assert batched == looped
+    assert batched_time < looped_time
+
+
 def test_get_updated_identifiers_after_date(session):
     """Assert get_updated_identifiers_after_date works as expected."""
     business_doc_1 = deepcopy(SOLR_TEST_DOCS[0])
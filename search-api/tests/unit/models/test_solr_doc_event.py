@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Tests to assure the SolrDoc Class."""
+from datetime import UTC, datetime, timedelta
+
 import pytest
+from sqlalchemy import text
 
 from search_api.enums import SolrDocEventStatus, SolrDocEventType
-from search_api.models import SolrDocEvent
+from search_api.models import SolrDoc, SolrDocEvent, db
+from search_api.utils.util import utcnow
 
 
 def test_solr_doc_event(session):
@@ -30,3 +34,86 @@ def test_solr_doc_event(session):
     assert event_resync.event_date is not None
     assert event_update.event_status == SolrDocEventStatus.PENDING
     assert event_resync.event_status == SolrDocEventStatus.PENDING
+
+
+@pytest.mark.parametrize('test_name,num_events,chunk_size', [
+    ('single_chunk', 3, None),
+    ('multiple_chunks', 5, 2),
+    ('no_events', 0, 2),
+])
+def test_bulk_create_and_update_status(session, test_name, num_events, chunk_size):
+    """Assert that events can be inserted and have their status updated in bulk."""
+    solr_docs = [SolrDoc(doc={}, identifier=f'BC000000{i}').save() for i in range(num_events)]
+
+    event_ids = SolrDocEvent.bulk_create(SolrDocEventType.RESYNC, [doc.id for doc in solr_docs], chunk_size)
+    assert len(event_ids) == num_events
+    for solr_doc, event_id in zip(solr_docs, event_ids):
+        doc_event = SolrDocEvent.query.filter_by(id=event_id).one()
+        assert doc_event.solr_doc_id == solr_doc.id
+        assert doc_event.event_type == SolrDocEventType.RESYNC
+        assert doc_event.event_status == SolrDocEventStatus.PENDING
+
+    SolrDocEvent.update_status_by_ids(SolrDocEventStatus.COMPLETE, event_ids, chunk_size)
+    for event_id in event_ids:
+        doc_event = SolrDocEvent.query.filter_by(id=event_id).one()
+        assert doc_event.event_status == SolrDocEventStatus.COMPLETE
+        assert doc_event.event_last_update >= doc_event.event_date
+
+
+def test_update_events_status(session):
+    """Assert that update_events_status updates the given events (including the loaded objects)."""
+    doc_events = [SolrDocEvent(event_type=SolrDocEventType.UPDATE).save() for _ in range(3)]
+    other_event = SolrDocEvent(event_type=SolrDocEventType.UPDATE).save()
+
+    SolrDocEvent.update_events_status(SolrDocEventStatus.ERROR, doc_events, 2)
+    for doc_event in doc_events:
+        assert doc_event.event_status == SolrDocEventStatus.ERROR
+    assert other_event.event_status == SolrDocEventStatus.PENDING
+
+
+def test_delete_superseded(session):
+    """Assert delete_superseded removes old COMPLETE events except the latest one of each doc."""
+    solr_doc = SolrDoc(doc={}, identifier='BC0000001').save()
+    old_date = utcnow() - timedelta(days=100)
+    old_events = [SolrDocEvent(event_type=SolrDocEventType.UPDATE, solr_doc_id=solr_doc.id,
+                               event_status=SolrDocEventStatus.COMPLETE,
+                               event_date=old_date + timedelta(minutes=i)).save() for i in range(3)]
+    error_event = SolrDocEvent(event_type=SolrDocEventType.UPDATE, solr_doc_id=solr_doc.id,
+                               event_status=SolrDocEventStatus.ERROR, event_date=old_date).save()
+    other_doc = SolrDoc(doc={}, identifier='BC0000002').save()
+    only_event = SolrDocEvent(event_type=SolrDocEventType.UPDATE, solr_doc_id=other_doc.id,
+                              event_status=SolrDocEventStatus.COMPLETE, event_date=old_date).save()
+
+    assert SolrDocEvent.delete_superseded(utcnow() - timedelta(days=90), 1) == 2
+
+    remaining = SolrDocEvent.query.filter(SolrDocEvent.solr_doc_id.in_([solr_doc.id, other_doc.id])).all()
+    assert sorted(doc_event.id for doc_event in remaining) == sorted([old_events[2].id, error_event.id, only_event.id])
+
+
+def test_create_partitions_unpartitioned(session):
+    """Assert create_partitions is a no-op when the table is not partitioned."""
+    assert SolrDocEvent.create_partitions(utcnow(), 3) == []
+
+
+def test_create_partitions(session):
+    """Assert the partitions are created and the rows already in the default partition are moved into them."""
+    # partition the table like the migration does (rolled back with the test session)
+    db.session.execute(text('ALTER TABLE solr_doc_events RENAME TO solr_doc_events_unpartitioned'))
+    db.session.execute(text('CREATE TABLE solr_doc_events (LIKE solr_doc_events_unpartitioned INCLUDING DEFAULTS) '
+                            'PARTITION BY RANGE (event_date)'))
+    db.session.execute(text('CREATE TABLE solr_doc_events_default PARTITION OF solr_doc_events DEFAULT'))
+    # written before its month has a partition
+    doc_event = SolrDocEvent(event_type=SolrDocEventType.UPDATE, event_date=datetime(2030, 2, 15, tzinfo=UTC)).save()
+
+    partitions = SolrDocEvent.create_partitions(datetime(2030, 1, 20, tzinfo=UTC), 2)
+    assert partitions == ['solr_doc_events_y2030m01', 'solr_doc_events_y2030m02']
+    assert db.session.execute(text('SELECT count(*) FROM solr_doc_events_default')).scalar() == 0
+    assert db.session.execute(text('SELECT id FROM solr_doc_events_y2030m02')).scalars().all() == [doc_event.id]
+    assert SolrDocEvent.query.filter_by(id=doc_event.id).one().event_type == SolrDocEventType.UPDATE
+
+    # existing partitions are kept and new events go straight into their partition
+    partitions = SolrDocEvent.create_partitions(datetime(2030, 2, 1, tzinfo=UTC), 2)
+    assert partitions == ['solr_doc_events_y2030m02', 'solr_doc_events_y2030m03']
+    SolrDocEvent(event_type=SolrDocEventType.RESYNC, event_date=datetime(2030, 3, 15, tzinfo=UTC)).save()
+    assert db.session.execute(text('SELECT count(*) FROM solr_doc_events_y2030m03')).scalar() == 1
+    assert db.session.execute(text('SELECT count(*) FROM solr_doc_events_default')).scalar() == 0
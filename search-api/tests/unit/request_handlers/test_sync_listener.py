@@ -0,0 +1,90 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to verify the LISTEN/NOTIFY solr sync works as expected (requires the local test postgres)."""
+import threading
+import time
+from copy import deepcopy
+from dataclasses import asdict
+
+import requests_mock
+from sqlalchemy import text
+
+from search_api.enums import SolrDocEventStatus, SolrDocEventType
+from search_api.models import SolrDoc, SolrDocEvent, db
+from search_api.request_handlers import AdaptiveBatchSize, listen, run_sync_listener, wait_for_notifications
+
+from tests.unit.utils import SOLR_TEST_DOCS
+
+CHANNEL = 'solr_doc_events_test'
+
+
+def _notify(num: int, engine=None):
+    """Send the notifications from a separate (committed) connection."""
+    with (engine or db.engine).connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+        for i in range(num):
+            connection.execute(text('SELECT pg_notify(:channel, :payload)'), {'channel': CHANNEL, 'payload': str(i)})
+
+
+def test_wait_for_notifications(app):
+    """Assert the listening connection receives the notifications."""
+    connection = listen(CHANNEL)
+    try:
+        assert wait_for_notifications(connection, 0) == 0
+        _notify(3)
+        start = time.perf_counter()
+        assert wait_for_notifications(connection, 5) + wait_for_notifications(connection, 0.2) == 3
+        assert time.perf_counter() - start < 5
+        assert wait_for_notifications(connection, 0.1) == 0
+    finally:
+        connection.invalidate()
+
+
+def test_wait_for_notifications_while_waiting(app):
+    """Assert notifications sent during the wait are picked up before the timeout over a real connection."""
+    connection = listen(CHANNEL)
+    notifier = threading.Timer(0.3, _notify, (2, db.engine))
+    try:
+        start = time.perf_counter()
+        assert wait_for_notifications(connection, 0.2, 0.05) == 0
+        assert time.perf_counter() - start >= 0.2
+
+        notifier.start()
+        assert wait_for_notifications(connection, 5, 0.05) + wait_for_notifications(connection, 0.2, 0.05) == 2
+        assert time.perf_counter() - start < 5
+    finally:
+        notifier.join()
+        connection.invalidate()
+
+
+def test_save_notify(session):
+    """Assert that an event can be saved with a notification."""
+    doc_event = SolrDocEvent(event_type=SolrDocEventType.UPDATE).save(CHANNEL)
+    assert doc_event.id is not None
+    assert doc_event.event_status == SolrDocEventStatus.PENDING
+
+
+def test_run_sync_listener_poll_fallback(app, session):
+    """Assert the listener still syncs pending events (written without a NOTIFY) after the poll interval."""
+    solr_url_update = app.config.get('SOLR_SVC_BUS_LEADER_URL') + '/business/update?overwrite=true&wt=json&commitWithin=1000'
+    business_doc = deepcopy(SOLR_TEST_DOCS[0])
+    solr_doc = SolrDoc(doc=asdict(business_doc), identifier=business_doc.identifier).save()
+    doc_event = SolrDocEvent(event_type=SolrDocEventType.UPDATE, solr_doc_id=solr_doc.id).save()
+
+    with requests_mock.mock() as m:
+        m.post(solr_url_update)
+        run_sync_listener(AdaptiveBatchSize(initial=10, minimum=1, maximum=10, target_latency=2), 1,
+                          channel=CHANNEL, batch_window=0.2, poll_interval=0.5, max_runs=1)
+
+    assert m.call_count == 1
+    assert SolrDocEvent.query.filter_by(id=doc_event.id).one().event_status == SolrDocEventStatus.COMPLETE
@@ -0,0 +1,109 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to verify the solr sync worker works as expected."""
+from copy import deepcopy
+from dataclasses import asdict
+from http import HTTPStatus
+
+import pytest
+import requests_mock
+
+from search_api.enums import SolrDocEventStatus, SolrDocEventType
+from search_api.exceptions import SolrException
+from search_api.models import SolrDoc, SolrDocEvent
+from search_api.request_handlers import AdaptiveBatchSize, run_sync_worker
+
+from tests.unit.utils import SOLR_TEST_DOCS
+
+
+def _create_update_events(num_docs: int) -> list[SolrDocEvent]:
+    """Return a pending update event for each new solr doc."""
+    doc_events = []
+    for business_doc in deepcopy(SOLR_TEST_DOCS[:num_docs]):
+        solr_doc = SolrDoc(doc=asdict(business_doc), identifier=business_doc.identifier).save()
+        doc_events.append(SolrDocEvent(event_type=SolrDocEventType.UPDATE, solr_doc_id=solr_doc.id).save())
+    return doc_events
+
+
+@pytest.mark.parametrize('test_name,initial,batch_size,latency,expected', [
+    ('grow', 100, 100, 1, 200),
+    ('grow_capped_2x', 100, 100, 0.1, 200),
+    ('grow_capped_max', 400, 400, 0.5, 500),
+    ('shrink', 100, 100, 4, 50),
+    ('shrink_capped_min', 20, 20, 10, 10),
+    ('steady', 100, 100, 2, 100),
+    ('partial_batch', 100, 30, 0.1, 100),
+    ('no_latency', 100, 100, 0, 200),
+])
+def test_adaptive_batch_size(test_name, initial, batch_size, latency, expected):
+    """Assert the batch size adapts to the batch latency within its bounds."""
+    adaptive_batch_size = AdaptiveBatchSize(initial=initial, minimum=10, maximum=500, target_latency=2)
+    adaptive_batch_size.record(batch_size, latency)
+    assert adaptive_batch_size.size == expected
+
+    adaptive_batch_size.failed()
+    assert adaptive_batch_size.size == max(10, expected // 2)
+
+
+def test_run_sync_worker(app, session):
+    """Assert the worker syncs batches until there are no pending events left."""
+    solr_url_update = app.config.get('SOLR_SVC_BUS_LEADER_URL') + '/business/update?overwrite=true&wt=json&commitWithin=1000'
+    doc_events = _create_update_events(5)
+
+    with requests_mock.mock() as m:
+        m.post(solr_url_update)
+        totals = run_sync_worker(AdaptiveBatchSize(initial=2, minimum=2, maximum=2, target_latency=2), 3)
+
+    assert totals == {'batches': 3, 'events': 5, 'docsSynced': 5, 'atomicUpdates': 0, 'eventsCoalesced': 0}
+    assert m.call_count == 3
+    assert sum(len(request.json()) for request in m.request_history) == 5
+    for doc_event in doc_events:
+        assert SolrDocEvent.query.filter_by(id=doc_event.id).one().event_status == SolrDocEventStatus.COMPLETE
+
+
+def test_run_sync_worker_failure(app, session, monkeypatch):
+    """Assert the worker stops after the max consecutive failed batches and leaves the events in ERROR."""
+    monkeypatch.setitem(app.config, 'SYNC_ERROR_RETRY_DELAY', 0)
+    solr_url_update = app.config.get('SOLR_SVC_BUS_LEADER_URL') + '/business/update?overwrite=true&wt=json&commitWithin=1000'
+    doc_events = _create_update_events(2)
+
+    with requests_mock.mock() as m:
+        m.post(solr_url_update, status_code=HTTPStatus.INTERNAL_SERVER_ERROR)
+        with pytest.raises(SolrException):
+            run_sync_worker(AdaptiveBatchSize(initial=8, minimum=1, maximum=8, target_latency=2), 2)
+
+    assert m.call_count == 2
+    for doc_event in doc_events:
+        assert SolrDocEvent.query.filter_by(id=doc_event.id).one().event_status == SolrDocEventStatus.ERROR
+
+
+def test_run_sync_worker_failing_event(app, session):
+    """Assert a failing event is left in ERROR (and not retried right away) while the events after it are synced."""
+    solr_url_update = app.config.get('SOLR_SVC_BUS_LEADER_URL') + '/business/update?overwrite=true&wt=json&commitWithin=1000'
+    doc_events = _create_update_events(3)
+    failing_identifier = SOLR_TEST_DOCS[0].identifier
+
+    with requests_mock.mock() as m:
+        m.post(solr_url_update)
+        m.post(solr_url_update,
+               status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
+               additional_matcher=lambda request: request.json()[0]['identifier'] == failing_identifier)
+        totals = run_sync_worker(AdaptiveBatchSize(initial=1, minimum=1, maximum=1, target_latency=2), 2)
+
+    assert totals['batches'] == 2
+    assert totals['docsSynced'] == 2
+    assert m.call_count == 3
+    assert SolrDocEvent.query.filter_by(id=doc_events[0].id).one().event_status == SolrDocEventStatus.ERROR
+    for doc_event in doc_events[1:]:
+        assert SolrDocEvent.query.filter_by(id=doc_event.id).one().event_status == SolrDocEventStatus.COMPLETE
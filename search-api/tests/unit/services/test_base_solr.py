@@ -0,0 +1,161 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to verify the base solr service is working as expected."""
+import os
+
+import pytest
+
+from search_api.services import business_solr
+from search_api.services.base_solr import CommitPolicy
+from search_api.services.base_solr.query_cache import QueryCache
+
+
+def test_solr_session_reused(app, requests_mock):
+    """Assert that the solr calls share one pooled session per node."""
+    requests_mock.post(f"{app.config.get('SOLR_SVC_BUS_FOLLOWER_URL')}/business/query",
+                       json={'response': {'docs': [], 'numFound': 0, 'start': 0}})
+    business_solr.close_sessions()
+
+    business_solr.query({'query': 'id:BC1234567'})
+    session = business_solr._get_session(business_solr.follower_url)
+    business_solr.query({'query': 'id:BC1234567'})
+
+    assert requests_mock.call_count == 2
+    assert business_solr._get_session(business_solr.follower_url) is session
+    assert business_solr.follower_url in business_solr.pool_stats()
+
+
+def test_solr_session_reset_after_fork(app):
+    """Assert that a forked worker process does not reuse the parent's pooled sessions."""
+    business_solr.close_sessions()
+    session = business_solr._get_session(business_solr.leader_url)
+    # simulate being in a forked worker
+    business_solr._sessions_pid = os.getpid() + 1
+
+    assert business_solr._get_session(business_solr.leader_url) is not session
+    assert business_solr._sessions_pid == os.getpid()
+
+
+def test_solr_facets_include_facets(app, requests_mock):
+    """Assert that facets are computed for every page without cached facets unless explicitly excluded."""
+    facets = {'count': 12, 'status': {'buckets': [{'val': 'ACTIVE', 'count': 12}]}}
+    mock = requests_mock.post(f"{app.config.get('SOLR_SVC_BUS_FOLLOWER_URL')}/business/query",
+                              json={'response': {'docs': [], 'numFound': 12, 'start': 0}, 'facets': facets})
+    facet = {'status': {'type': 'terms', 'field': 'status'}}
+
+    business_solr.query({'query': 'name:test', 'facet': facet}, 0, 10)
+    assert mock.last_request.json()['facet'] == facet
+    business_solr.query({'query': 'name:test', 'facet': facet}, 10, 10, include_facets=True)
+    assert mock.last_request.json()['facet'] == facet
+    business_solr.query({'query': 'name:test', 'facet': facet}, 0, 10, include_facets=False)
+    assert 'facet' not in mock.last_request.json()
+
+
+@pytest.mark.parametrize('test_name,cache_size', [
+    ('cache_disabled', 0),
+    ('cache_miss', 10),
+])
+def test_solr_facets_later_page_not_cached(app, requests_mock, test_name, cache_size):
+    """Assert that a later page still gets the facets when they are not cached (i.e. another worker's 1st page)."""
+    requests_mock.get(f"{app.config.get('SOLR_SVC_BUS_FOLLOWER_URL')}/business/replication",
+                      json={'details': {'generation': 1}})
+    facets = {'count': 12, 'status': {'buckets': [{'val': 'ACTIVE', 'count': 12}]}}
+    mock = requests_mock.post(f"{app.config.get('SOLR_SVC_BUS_FOLLOWER_URL')}/business/query",
+                              json={'response': {'docs': [], 'numFound': 12, 'start': 10}, 'facets': facets})
+    facet = {'status': {'type': 'terms', 'field': 'status'}}
+    query_cache = business_solr.query_cache
+    business_solr.query_cache = QueryCache(max_size=cache_size, ttl=60)
+    business_solr._generation_checked_at = None
+    try:
+        for start in [10, 20]:
+            results = business_solr.query({'query': 'name:test', 'facet': facet}, start, 10, use_cache=True)
+            assert results['facets'] == facets
+        assert mock.call_count == 2
+        # the first call computed the facets and the next one reuses them if they were cached
+        assert mock.request_history[0].json()['facet'] == facet
+        assert ('facet' in mock.last_request.json()) == (not cache_size)
+    finally:
+        business_solr.query_cache = query_cache
+        business_solr._generation_checked_at = None
+
+
+def test_solr_facets_cached_for_later_pages(app, requests_mock):
+    """Assert that later pages of the same query reuse the facets from the first page."""
+    requests_mock.get(f"{app.config.get('SOLR_SVC_BUS_FOLLOWER_URL')}/business/replication",
+                      json={'details': {'generation': 1}})
+    facets = {'count': 12, 'status': {'buckets': [{'val': 'ACTIVE', 'count': 12}]}}
+    mock = requests_mock.post(f"{app.config.get('SOLR_SVC_BUS_FOLLOWER_URL')}/business/query",
+                              json={'response': {'docs': [], 'numFound': 12, 'start': 0}, 'facets': facets})
+    facet = {'status': {'type': 'terms', 'field': 'status'}}
+    query_cache = business_solr.query_cache
+    business_solr.query_cache = QueryCache(max_size=10, ttl=60)
+    business_solr._generation_checked_at = None
+    try:
+        first_page = business_solr.query({'query': 'name:test', 'facet': facet}, 0, 10, use_cache=True)
+        assert mock.last_request.json()['facet'] == facet
+        second_page = business_solr.query({'query': 'name:test', 'facet': facet}, 10, 10, use_cache=True)
+        assert 'facet' not in mock.last_request.json()
+        assert first_page['facets'] == second_page['facets'] == facets
+        assert mock.call_count == 2
+    finally:
+        business_solr.query_cache = query_cache
+        business_solr._generation_checked_at = None
+
+
+@pytest.mark.parametrize('test_name,commit_policy,expected_params', [
+    ('hard', CommitPolicy.HARD, 'commit=true&overwrite=true&wt=json'),
+    ('soft', CommitPolicy.SOFT, 'softCommit=true&overwrite=true&wt=json'),
+    ('within', CommitPolicy.WITHIN, 'overwrite=true&wt=json&commitWithin=1000'),
+    ('explicit', CommitPolicy.EXPLICIT, 'overwrite=true&wt=json'),
+])
+def test_solr_commit_policy(app, requests_mock, test_name, commit_policy, expected_params):
+    """Assert that updates and deletes use the given commit policy."""
+    url = f"{app.config.get('SOLR_SVC_BUS_LEADER_URL')}/business/update?{expected_params}"
+    mock = requests_mock.post(url)
+
+    business_solr.create_or_replace_docs(raw_docs=[{'id': 'BC1234567'}], commit_policy=commit_policy)
+    business_solr.delete_docs(['BC1234567'], commit_policy=commit_policy)
+
+    assert mock.call_count == 2
+    for request in mock.request_history:
+        assert request.url == url
+
+
+@pytest.mark.parametrize('test_name,num_docs,expected_params', [
+    ('small_batch', 1, 'commit=true&overwrite=true&wt=json'),
+    ('bulk_batch', 1000, 'overwrite=true&wt=json'),
+])
+def test_solr_default_commit_policy(app, requests_mock, test_name, num_docs, expected_params):
+    """Assert that without a commit policy only small batches are committed."""
+    url = f"{app.config.get('SOLR_SVC_BUS_LEADER_URL')}/business/update?{expected_params}"
+    mock = requests_mock.post(url)
+
+    business_solr.create_or_replace_docs(raw_docs=[{'id': f'BC{i:07}'} for i in range(num_docs)])
+
+    assert mock.call_count == 1
+    assert mock.last_request.url == url
+
+
+@pytest.mark.parametrize('test_name,soft,expected_payload', [
+    ('hard', False, '<commit/>'),
+    ('soft', True, '<commit softCommit="true"/>'),
+])
+def test_solr_commit(app, requests_mock, test_name, soft, expected_payload):
+    """Assert that an explicit commit is sent to the leader."""
+    mock = requests_mock.post(f"{app.config.get('SOLR_SVC_BUS_LEADER_URL')}/business/update?wt=json")
+
+    business_solr.commit(soft=soft)
+
+    assert mock.call_count == 1
+    assert mock.last_request.text == expected_payload
@@ -0,0 +1,126 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to verify the solr formatting helpers are working as expected."""
+import random
+import re
+import timeit
+
+import pytest
+
+from search_api.services.base_solr.utils import DASH_OPTIONS, prep_query_str, prep_query_str_variants
+
+
+# names taken from the public BC registries / well known BC businesses (plus some awkward user input)
+BUSINESS_NAMES = [
+    'LULULEMON ATHLETICA INC.', 'A&W FOOD SERVICES OF CANADA INC.', 'TELUS COMMUNICATIONS INC.',
+    'LONDON DRUGS LIMITED', 'WHITE SPOT LIMITED', 'MOUNTAIN EQUIPMENT CO-OPERATIVE', 'VANCITY SAVINGS CREDIT UNION',
+    'BC HYDRO AND POWER AUTHORITY', 'B.C. FERRY SERVICES INC.', 'PACIFIC BLUE CROSS', 'JIM PATTISON GROUP INC.',
+    'SAVE-ON-FOODS LIMITED PARTNERSHIP', 'OVERWAITEA FOOD GROUP LIMITED PARTNERSHIP', 'EARLS RESTAURANTS LTD.',
+    'CACTUS CLUB CAFE (BURRARD) LTD.', "NATURE'S FARE MARKETS LTD.", 'BLENZ THE CANADIAN COFFEE COMPANY LTD.',
+    'PURDYS CHOCOLATIER (P.C.) LTD.', 'ELECTRONIC ARTS (CANADA), INC.', 'HOOTSUITE MEDIA INC.',
+    'STEMCELL TECHNOLOGIES CANADA INC.', 'WEST FRASER MILLS LTD.', 'CANFOR PULP LTD.', 'TECK RESOURCES LIMITED',
+    'FIRST NATIONS HEALTH AUTHORITY', 'RE/MAX CROWN REALTY (1988) LTD.', 'SUTTON GROUP - WEST COAST REALTY',
+    'CO-OP REFINERY', 'HARBOUR AIR LTD.', 'PACIFIC COASTAL AIRLINES LIMITED', 'SPUD.CA', '0996237 B.C. LTD.',
+    'BC1234567', 'FM0123456', 'CP0001234', '123456789BC0001', 'NORTH SHORE - SEA TO SKY', 'ABC -- DEF',
+    'LA BOULANGERIE ÉTÉ', 'MÜNCHEN IMPORTS', 'ŁÓDŹ TRADING', 'İSTANBUL GRILL', 'A + B CONSULTING', 'A++B',
+    'Q&&A SERVICES', 'C&+&D', '+PLUS INC', '-MINUS', '/SLASH CO', '!BANG LTD', 'TEST: COLON', 'WHAT? LTD',
+    '"QUOTED" NAME', '[BRACKET] CO', '<ANGLE> INC', 'TILDE~CO', 'CARET^CO', '{CURLY} CO', 'PIPE|CO', 'BACK\\SLASH',
+    'STAR*CO', '  DOUBLE  SPACE  ', 'TRIPLE   SPACE', 'TAB\tSEPARATED', 'A - B - C', 'A- B -C', 'A -B- C',
+    'X--Y', '- - -', '(-)', 'a - (b) - c', 'a &(&) b', '&', '-', ' ', '',
+]
+
+_NAME_PARTS = ['pacific', 'coast', 'north', 'west', 'island', 'okanagan', 'kootenay', 'fraser', 'valley', 'holdings',
+               'ventures', 'consulting', 'construction', 'enterprises', 'trading', 'services', 'ltd.', 'inc.',
+               'corp.', 'l.p.', 'co-op', 'bc', 'b.c.', '&', '+', '-', ' - ', '(1998)', '[ab]', 'café', 'o\'neil',
+               'smith & sons', 'a/b', '!', '?', ':', '"', '~', '<', '>', '^', '{', '}', '|', '\\', '--', '++', '&&']
+
+
+def _prep_query_str_reference(query: str, dash: str | None = None, replace_and=True) -> str:
+    """Return the query string prepped by the original (uncompiled, multi-pass) implementation."""
+    if not query:
+        return ''
+
+    rmv_doubles = r'([&+]){2,}'
+    rmv_all = r'([()^{}|\\])'
+    esc_begin = r'(^|\s)([+\-/!])'
+    esc_all = r'([:~<>?\"\[\]])'
+    special_and = r'([&+])'
+    rmv_dash = r'(-)'
+    pad_dash = r'(\S)(-)(\S)'
+    tighten_dash = r'(\s+)(-)(\s+)'
+
+    query = re.sub(rmv_doubles, r'\1', query.lower())
+    query = re.sub(rmv_all, '', query)
+    if replace_and:
+        query = re.sub(special_and, r' and ', query)
+    if dash:
+        if dash == 'replace':
+            query = re.sub(rmv_dash, r' ', query)
+        if dash == 'remove':
+            query = re.sub(rmv_dash, r'', query)
+        if dash == 'pad':
+            query = re.sub(pad_dash, r'\1 \2 \3', query)
+        if dash == 'tighten':
+            query = re.sub(tighten_dash, r'\2', query)
+        if dash == 'tighten-remove':
+            query = re.sub(tighten_dash, r'', query)
+
+    query = re.sub(esc_begin, r'\1\\\2', query)
+    query = re.sub(esc_all, r'\\\1', query)
+    return query.lower().replace('  ', ' ').strip()
+
+
+def _get_corpus(size: int = 20000) -> list[str]:
+    """Return the business names plus generated name combinations (seeded so failures are reproducible)."""
+    rand = random.Random(28850)
+    generated = []
+    for _ in range(size):
+        parts = rand.choices(_NAME_PARTS + [name.lower() for name in BUSINESS_NAMES], k=rand.randint(1, 6))
+        generated.append(rand.choice(['', ' ', '-']).join(parts).upper() if rand.random() < 0.5 else ' '.join(parts))
+    return BUSINESS_NAMES + generated
+
+
+@pytest.mark.parametrize('replace_and', [True, False])
+def test_prep_query_str_equivalence(replace_and):
+    """Assert that the compiled prep_query_str matches the original implementation for every dash option."""
+    dashes = (None, *DASH_OPTIONS)
+    for name in _get_corpus():
+        variants = prep_query_str_variants(name, dashes, replace_and)
+        for dash in dashes:
+            expected = _prep_query_str_reference(name, dash, replace_and)
+            assert variants[dash] == expected, f'{name!r} ({dash})'
+            assert prep_query_str(name, dash, replace_and) == expected, f'{name!r} ({dash})'
+
+
+@pytest.mark.slow
+def test_prep_query_str_benchmark():
+    """Assert that preparing all dash variants in one call is faster than the original per variant calls.
+
+    Wall clock comparison so it is excluded by default (run with: pytest -m slow).
+    """
+    corpus = _get_corpus(2000)
+    dashes = (None, *DASH_OPTIONS)
+
+    def original():
+        for name in corpus:
+            for dash in dashes:
+                _prep_query_str_reference(name, dash)
+
+    def compiled():
+        for name in corpus:
+            prep_query_str_variants(name, dashes)
+
+    original_time = min(timeit.repeat(original, number=1, repeat=3))
+    compiled_time = min(timeit.repeat(compiled, number=1, repeat=3))
+    assert compiled_time < original_time
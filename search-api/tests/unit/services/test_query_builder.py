@@ -0,0 +1,70 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to verify the solr query builder / search profiles are working as expected."""
+import pytest
+
+from search_api.services import business_solr
+from search_api.services.base_solr.utils import QueryProfile
+from search_api.services.business_solr import BUSINESS_DEFAULT_PROFILE, BUSINESS_V1_PROFILE, PARTY_DEFAULT_PROFILE
+from search_api.services.business_solr.doc_fields import BusinessField
+
+
+@pytest.mark.parametrize('test_name,profile_name,value,expected', [
+    ('test_business_default', BUSINESS_DEFAULT_PROFILE, 'test',
+     '(name_q:test^2 OR name_q:test~1 OR name_stem_agro:test^2 OR name_stem_agro:test~1 OR '
+     'name_single_term:test^2 OR name_single_term:test~1 OR name_xtra_q:test OR name_q_exact:test OR '
+     'bn_q:test OR identifier_q:test)'),
+    ('test_business_v1', BUSINESS_V1_PROFILE, 'test',
+     '(name_q:test^2 OR name_q:test~1 OR name_stem_agro:test^2 OR name_stem_agro:test~1 OR '
+     'name_single_term:test^2 OR name_single_term:test~1 OR name_xtra_q:test OR bn_q:test OR identifier_q:test)'),
+    ('test_business_identifier', BUSINESS_DEFAULT_PROFILE, 'bc1234567',
+     '(name_q:bc1234567^2 OR name_q:bc1234567~2 OR name_stem_agro:bc1234567^2 OR name_stem_agro:bc1234567~2 OR '
+     'name_single_term:bc1234567^2 OR name_single_term:bc1234567~2 OR name_xtra_q:bc1234567 OR '
+     'name_q_exact:bc1234567 OR bn_q:bc1234567 OR (identifier_q:"1234567" AND identifier_q:"BC"))'),
+    ('test_party_default', PARTY_DEFAULT_PROFILE, 'a b',
+     '(partyName_q:a^2 OR partyName_stem_agro:a^2 OR partyName_single_term:a^2 OR partyName_xtra_q:a) AND '
+     '(partyName_q:b^2 OR partyName_stem_agro:b^2 OR partyName_single_term:b^2 OR partyName_xtra_q:b)'),
+    ('test_empty', BUSINESS_DEFAULT_PROFILE, '', '""'),
+])
+def test_build_profile_query(test_name, profile_name, value, expected):
+    """Assert that binding terms to a compiled search profile gives the expected query."""
+    search_profile = business_solr.search_profiles[profile_name]
+    query = business_solr.query_builder.build_profile_query({'value': value}, search_profile)
+    assert query == {'query': expected, 'filter': []}
+
+
+def test_search_profile_immutable():
+    """Assert that a registered search profile cannot be changed or registered twice."""
+    search_profile = business_solr.search_profiles[BUSINESS_DEFAULT_PROFILE]
+    with pytest.raises(TypeError):
+        search_profile.boost_fields[BusinessField.NAME_Q] = 10
+    with pytest.raises(ValueError):
+        business_solr.register_search_profile(search_profile)
+
+
+@pytest.mark.parametrize('test_name,value,max_clause_count,expected', [
+    ('test_full', 'test business', 1024, QueryProfile.FULL),
+    ('test_no_fuzzy', 'test business', 50, QueryProfile.NO_FUZZY),
+    ('test_simple', 'test business', 10, QueryProfile.SIMPLE),
+    ('test_no_fuzzy_terms', 'abc de fg', 30, QueryProfile.FULL),
+    ('test_long_name', 'the british columbia wilderness adventure tourism association', 1024, QueryProfile.FULL),
+])
+def test_get_query_profile(test_name, value, max_clause_count, expected):
+    """Assert that the query profile is picked based on the estimated clause count."""
+    search_profile = business_solr.search_profiles[BUSINESS_DEFAULT_PROFILE]
+    profile = business_solr.query_builder.get_query_profile({'value': value},
+                                                            search_profile,
+                                                            [],
+                                                            max_clause_count=max_clause_count)
+    assert profile == expected
@@ -0,0 +1,83 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests to verify the solr query cache is working as expected."""
+import time
+
+from search_api.services.base_solr.query_cache import QueryCache
+
+
+def test_query_cache_hit_miss():
+    """Assert that the cache returns stored responses keyed on the payload and paging."""
+    cache = QueryCache(max_size=10, ttl=60)
+    key = QueryCache.get_key({'query': 'name:test', 'filter': []}, 0, 10)
+
+    assert cache.get(key) is None
+    cache.set(key, {'response': {'docs': [{'id': 'BC1234567'}]}})
+    assert cache.get(key) == {'response': {'docs': [{'id': 'BC1234567'}]}}
+    # different paging is a different entry
+    assert key != QueryCache.get_key({'query': 'name:test', 'filter': []}, 10, 10)
+    # key is independent of payload key order
+    assert key == QueryCache.get_key({'filter': [], 'query': 'name:test'}, 0, 10)
+
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['size'] == 1
+
+
+def test_query_cache_copies():
+    """Assert that mutating a returned response does not alter the cached entry."""
+    cache = QueryCache(max_size=10, ttl=60)
+    cache.set('key', {'response': {'docs': []}})
+    cache.get('key')['response']['docs'].append({'id': 'changed'})
+
+    assert cache.get('key') == {'response': {'docs': []}}
+
+
+def test_query_cache_lru_eviction():
+    """Assert that the least recently used entry is evicted when the cache is full."""
+    cache = QueryCache(max_size=2, ttl=60)
+    cache.set('a', {'a': 1})
+    cache.set('b', {'b': 1})
+    cache.get('a')
+    cache.set('c', {'c': 1})
+
+    assert cache.get('b') is None
+    assert cache.get('a') == {'a': 1}
+    assert cache.get('c') == {'c': 1}
+    assert cache.stats()['evictions'] == 1
+
+
+def test_query_cache_ttl():
+    """Assert that expired entries are not returned."""
+    cache = QueryCache(max_size=2, ttl=0.01)
+    cache.set('a', {'a': 1})
+    time.sleep(0.02)
+
+    assert cache.get('a') is None
+    assert cache.stats()['expirations'] == 1
+
+
+def test_query_cache_generation_invalidation():
+    """Assert that the cache is cleared when the index generation changes."""
+    cache = QueryCache(max_size=2, ttl=60)
+    cache.set_generation(1)
+    cache.set('a', {'a': 1})
+    cache.set_generation(1)
+    assert cache.get('a') == {'a': 1}
+
+    cache.set_generation(2)
+    assert cache.get('a') is None
+    assert cache.stats()['invalidations'] == 1
+    assert cache.stats()['generation'] == 2
@@ -12,28 +12,106 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """The Search solr data import service."""
-import gc
 import sys
+import time
+from datetime import UTC, datetime, timedelta
 
 from flask import current_app
 
 from search_api.exceptions import SolrException
 from search_solr_importer import create_app, get_run_version
 from search_solr_importer.utils import (
+    ImportPipeline,
+    ImportSource,
+    chunk_rows,
     collect_btr_data,
     collect_colin_data,
     collect_lear_businesses_requiring_transition,
     collect_lear_data,
+    commit,
+    get_watermarks,
     prep_data,
     prep_data_btr,
     reindex_post,
     reindex_prep,
     reindex_recovery,
     resync,
-    update_solr,
+    set_watermarks,
+    stream_rows,
 )
 
 
+def new_pipeline() -> ImportPipeline:
+    """Return an import pipeline configured for the app."""
+    return ImportPipeline(current_app._get_current_object(),  # pylint: disable=protected-access
+                          queue_size=current_app.config.get("IMPORT_QUEUE_SIZE"),
+                          mappers=current_app.config.get("IMPORT_MAPPERS"),
+                          uploaders=current_app.config.get("IMPORT_UPLOADERS"))
+
+
+def colin_source(since: datetime | None = None) -> ImportSource:
+    """Return the COLIN import source (only the businesses changed since the given date if set)."""
+    def read():
+        colin_data_cur = collect_colin_data(since)
+        colin_data_descs = [desc[0].lower() for desc in colin_data_cur.description]
+        try:
+            # NB: rows are chunked by corp num so each business is mapped with all of its rows
+            for rows in chunk_rows(stream_rows(colin_data_cur), colin_data_descs, batch_size):
+                yield rows, colin_data_descs, "COLIN", []
+        finally:
+            colin_data_cur.close()
+
+    batch_size = current_app.config.get("BATCH_SIZE_SOLR")
+    return ImportSource("COLIN", read, prep_data)
+
+
+def lear_source(since: datetime | None = None) -> ImportSource:
+    """Return the LEAR import source (only the businesses changed since the given date if set)."""
+    def read():
+        lear_requires_transition_cur = collect_lear_businesses_requiring_transition()
+        lear_requires_transition = lear_requires_transition_cur.fetchall()
+        requires_transition_identifiers: list[str] = [x[0] for x in lear_requires_transition]
+        current_app.logger.debug(f"Identifiers requiring a transition filing: {requires_transition_identifiers}")
+        lear_data_cur = collect_lear_data(since)
+        lear_data_descs = list(lear_data_cur.keys())
+        try:
+            for rows in chunk_rows(stream_rows(lear_data_cur), lear_data_descs, batch_size):
+                yield rows, lear_data_descs, "LEAR", requires_transition_identifiers
+        finally:
+            lear_data_cur.close()
+
+    batch_size = current_app.config.get("BATCH_SIZE_SOLR")
+    return ImportSource("LEAR", read, prep_data)
+
+
+def btr_source() -> ImportSource:
+    """Return the BTR import source."""
+    def read():
+        last_person_id = None
+        while True:
+            start = time.perf_counter()
+            btr_data_cur = collect_btr_data(batch_limit, last_person_id)
+            btr_data_descs = list(btr_data_cur.keys())
+            person_id_index = btr_data_descs.index("person_id")
+            person_ids = set()
+            try:
+                while btr_data := btr_data_cur.fetchmany(fetch_size):
+                    person_ids.update(row[person_id_index] for row in btr_data)
+                    yield btr_data, btr_data_descs
+            finally:
+                btr_data_cur.close()
+            current_app.logger.debug(f"BTR batch collected: {len(person_ids)} persons after person id "
+                                     f"{last_person_id} in {time.perf_counter() - start:.2f}s.")
+            if not batch_limit or len(person_ids) < batch_limit:
+                # last page
+                break
+            last_person_id = max(person_ids)
+
+    batch_limit = current_app.config.get("BTR_BATCH_LIMIT")
+    fetch_size = current_app.config.get("DB_FETCH_SIZE")
+    return ImportSource("BTR", read, prep_data_btr, partial=True)
+
+
 def load_search_core():  # noqa: PLR0915, PLR0912
     """Load data from LEAR and COLIN into the search core."""
     # TODO: update to remove noqa
@@ -43,101 +121,47 @@ def load_search_core():  # noqa: PLR0915, PLR0912
         include_btr_load = current_app.config.get("INCLUDE_BTR_LOAD")
         include_colin_load = current_app.config.get("INCLUDE_COLIN_LOAD")
         include_lear_load = current_app.config.get("INCLUDE_LEAR_LOAD")
-        final_record = None
 
         if is_reindex and current_app.config.get("IS_PARTIAL_IMPORT"):
             current_app.logger.error("Attempted reindex on partial data set.")
             current_app.logger.debug("Setting reindex to False to prevent potential data loss.")
             is_reindex = False
 
+        # NB: reindexes always load everything
+        is_delta = current_app.config.get("DELTA_IMPORT") and not is_reindex
+
         if is_reindex:
             current_app.logger.debug("---------- Pre Reindex Actions ----------")
             reindex_prep(is_preload)
 
+        sources: list[ImportSource] = []
+        import_start = datetime.now(UTC)
         try:
-            colin_count = 0
+            since: dict[str, datetime] = {}
+            if is_delta:
+                # businesses changed since the last import (reaching back a bit for late commits in the sources)
+                overlap = timedelta(minutes=current_app.config.get("DELTA_IMPORT_OVERLAP"))
+                since = {source: watermark - overlap for source, watermark in get_watermarks().items()}
+                current_app.logger.debug(f"Delta import since: {since} (full import for any source without one)")
             if include_colin_load:
-                current_app.logger.debug("---------- Collecting/Importing COLIN Entities ----------")
-                colin_data_cur = collect_colin_data()
-                current_app.logger.debug("Fetching corp batch rows...")
-                colin_data = colin_data_cur.fetchall()
-                colin_data_descs = [desc[0].lower() for desc in colin_data_cur.description]
-                colin_data_cur.close()
-                # NB: need full data set under each corp num to collapse parties properly
-                current_app.logger.debug("********** Mapping COLIN Entities **********")
-                prepped_colin_data = prep_data(colin_data,
-                                               colin_data_descs,
-                                               "COLIN",
-                                               [])
-                current_app.logger.debug(f"COLIN businesses ready for import: {len(prepped_colin_data)}")
-                # execute update to solr in batches
-                current_app.logger.debug("********** Importing COLIN Entities **********")
-                colin_count = update_solr(prepped_colin_data, "COLIN")
-                # free up memory
-                final_record = [prepped_colin_data[-1]], "COLIN", False
-                del colin_data, prepped_colin_data
-                gc.collect()
-                current_app.logger.debug(f"COLIN import completed. Total COLIN businesses imported: {colin_count}.")
-
-            lear_count = 0
+                sources.append(colin_source(since.get("COLIN")))
             if include_lear_load:
-                current_app.logger.debug("---------- Collecting LEAR Entities ----------")
-                lear_data_cur = collect_lear_data()
-                lear_data = lear_data_cur.fetchall()
-                lear_requires_transition_cur = collect_lear_businesses_requiring_transition()
-                lear_requires_transition = lear_requires_transition_cur.fetchall()
-                requires_transition_identifiers: list[str] = [x[0] for x in lear_requires_transition]
-                current_app.logger.debug(f"Identifiers requiring a transition filing: {requires_transition_identifiers}")
-                current_app.logger.debug("---------- Mapping LEAR data ----------")
-                prepped_lear_data = prep_data(
-                    data=lear_data,
-                    data_descs=lear_data_cur.keys(),
-                    source="LEAR",
-                    requires_transition=requires_transition_identifiers
-                )
-                current_app.logger.debug(f"{len(prepped_lear_data)} LEAR records ready for import.")
-
-                # execute update to solr in batches
-                current_app.logger.debug("---------- Importing LEAR entities ----------")
-                lear_count = update_solr(prepped_lear_data, "LEAR")
-                # free up memory
-                final_record = [prepped_lear_data[-1]], "LEAR", False
-                del lear_data, prepped_lear_data
-                gc.collect()
-                current_app.logger.debug(f"LEAR import completed. Total LEAR businesses imported: {lear_count}")
-
-            current_app.logger.debug(f"Total businesses imported: {colin_count + lear_count}")
-
-            total_btr_count = 0
-            if include_btr_load:
-                current_app.logger.debug("---------- Collecting/Importing BTR Data ----------")
-                btr_fetch_count = 0
-                batch_limit = current_app.config.get("BTR_BATCH_LIMIT")
-                loop_count = 0
-
-                while loop_count < 100:  # noqa: PLR2004
-                    # NOTE: should never get to this condition
-                    loop_count += 1
-                    current_app.logger.debug("********** Collecting BTR data **********")
-                    btr_data_cur = collect_btr_data(batch_limit, btr_fetch_count)
-                    btr_data = btr_data_cur.fetchall()
-                    btr_fetch_count += len(btr_data)
-                    btr_data_cur.close()
-                    if not btr_data:
-                        break
-
-                    current_app.logger.debug("********** Mapping BTR data **********")
-                    prepped_btr_data = prep_data_btr(btr_data, btr_data_cur.keys())
-                    current_app.logger.debug(f"{len(prepped_btr_data)} BTR records ready for import.")
-
-                    current_app.logger.debug("********** Importing BTR entities **********")
-                    total_btr_count += update_solr(prepped_btr_data, "BTR", True)
-                    current_app.logger.debug(f"BTR batch import completed. Records imported: {total_btr_count}.")
-                    # free up memory
-                    final_record = [prepped_btr_data[-1]], "BTR", True
-                    del btr_data, prepped_btr_data
-                    gc.collect()
+                sources.append(lear_source(since.get("LEAR")))
+            if sources:
+                current_app.logger.debug("---------- Collecting/Mapping/Importing COLIN and LEAR Entities ----------")
+                counts = {}
+                for source in sources:
+                    # NB: one source at a time so LEAR is imported last and wins for any business in both sources
+                    #     (i.e. businesses migrated to LEAR that are still in COLIN)
+                    counts |= new_pipeline().run([source])
+                    current_app.logger.debug(f"{source.name} import completed. "
+                                             f"Total {source.name} businesses imported: {counts[source.name]}.")
+                current_app.logger.debug(f"Total businesses imported: {sum(counts.values())}")
 
+            if include_btr_load:
+                # NB: after the business docs are loaded as the BTR docs are partial updates to them
+                current_app.logger.debug("---------- Collecting/Mapping/Importing BTR Data ----------")
+                total_btr_count = new_pipeline().run([btr_source()])["BTR"]
                 current_app.logger.debug(f"BTR import completed. Total BTR partial records imported: {total_btr_count}")
 
         except Exception as err:
@@ -152,15 +176,27 @@ def load_search_core():  # noqa: PLR0915, PLR0912
             current_app.logger.debug(error.with_traceback(None))
             current_app.logger.error("Resync failed.")
 
+        committed = False
         try:
             current_app.logger.debug("---------- Final Commit ----------")
             current_app.logger.debug("Triggering final commit on leader to make changes visible to search...")
-            update_solr(final_record[0], final_record[1], final_record[2])
+            commit()
+            committed = True
             current_app.logger.debug("Final commit complete.")
 
         except Exception as error:
             current_app.logger.debug(error.with_traceback(None))
-            current_app.logger.error("Final commit failed. (This will only effect DEV).")
+            current_app.logger.error("Final commit failed. Imported changes will not be visible until the next commit.")
+
+        if committed and sources:
+            try:
+                current_app.logger.debug("---------- Import Watermarks ----------")
+                set_watermarks({source.name: import_start for source in sources})
+                current_app.logger.debug(f"Import watermarks set to {import_start.isoformat()}.")
+            except Exception as error:
+                current_app.logger.debug(error.with_traceback(None))
+                current_app.logger.error("Failed to set the import watermarks. "
+                                         "The next delta import will redo this one.")
 
         if is_reindex and not is_preload:
             current_app.logger.debug("---------- Post Reindex Actions ----------")
@@ -49,21 +49,34 @@ class Config:
     SOLR_RETRY_BACKOFF_FACTOR = int(os.getenv("SOLR_RETRY_BACKOFF_FACTOR", "5"))
 
     SEARCH_API_URL = os.getenv("SEARCH_API_INTERNAL_URL", "http://")
+    # write the import batches straight to the leader core instead of through the search api
+    IMPORT_DIRECT_TO_SOLR = os.getenv("IMPORT_DIRECT_TO_SOLR", "False") == "True"
 
     BATCH_SIZE = int(os.getenv("SOLR_BATCH_UPDATE_SIZE", "1000"))
     REINDEX_CORE = os.getenv("REINDEX_CORE", "False") == "True"
+    # only import the COLIN / LEAR businesses changed since the last import (ignored for reindexes)
+    DELTA_IMPORT = os.getenv("DELTA_IMPORT", "False") == "True"
+    # minutes the delta import window reaches back before the last watermark (i.e. for long running transactions)
+    DELTA_IMPORT_OVERLAP = int(os.getenv("DELTA_IMPORT_OVERLAP", "60"))
     PRELOADER_JOB = os.getenv("PRELOADER_JOB", "False") == "True"
 
     MODERNIZED_LEGAL_TYPES = os.getenv("MODERNIZED_LEGAL_TYPES", "BEN,CBEN,CP,GP,SP").upper().split(",")
 
     BATCH_SIZE_SOLR = int(os.getenv("SOLR_BATCH_UPDATE_SIZE", "1000"))
     BATCH_SIZE_SOLR_SI = int(os.getenv("SOLR_BATCH_UPDATE_SIZE_SI", "1000"))
+    # rows fetched from the COLIN / LEAR cursors at a time
+    DB_FETCH_SIZE = int(os.getenv("DB_FETCH_SIZE", "5000"))
+    # import pipeline (db readers -> mappers -> uploaders) stage workers and queue size (chunks between stages)
+    IMPORT_QUEUE_SIZE = int(os.getenv("IMPORT_QUEUE_SIZE", "4"))
+    IMPORT_MAPPERS = int(os.getenv("IMPORT_MAPPERS", "2"))
+    IMPORT_UPLOADERS = int(os.getenv("IMPORT_UPLOADERS", "2"))
 
     INCLUDE_BTR_LOAD = os.getenv("INCLUDE_BTR_LOAD", "False") == "True"
     INCLUDE_COLIN_LOAD = os.getenv("INCLUDE_COLIN_LOAD", "True") == "True"
     INCLUDE_LEAR_LOAD = os.getenv("INCLUDE_LEAR_LOAD", "True") == "True"
     RESYNC_OFFSET = os.getenv("RESYNC_OFFSET", "130")
 
+    # persons per BTR page (pages are read with keyset pagination on the person id)
     BTR_BATCH_LIMIT = int(os.getenv("BTR_BATCH_LIMIT", "100000"))
 
     # TODO: or not include btr
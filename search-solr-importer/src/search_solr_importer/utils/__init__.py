@@ -17,7 +17,9 @@ from .data_collection import (
     collect_colin_data,
     collect_lear_businesses_requiring_transition,
     collect_lear_data,
+    stream_rows,
 )
-from .data_parsing import prep_data, prep_data_btr
+from .data_parsing import chunk_rows, prep_data, prep_data_btr
+from .pipeline import ImportPipeline, ImportSource
 from .reindex import reindex_post, reindex_prep, reindex_recovery
-from .update_solr import resync, update_solr
+from .update_solr import commit, get_import_headers, get_watermarks, resync, set_watermarks, update_solr
@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Data collection functions."""
+from collections.abc import Iterator
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
 from flask import current_app
 from sqlalchemy import CursorResult, text
 
@@ -26,11 +30,34 @@ def _get_stringified_list_for_sql(config_value: str) -> str:
     return ""
 
 
-def collect_colin_data():
-    """Collect data from COLIN."""
+def stream_rows(cursor, size: int | None = None) -> Iterator[tuple]:
+    """Yield the rows of the cursor, fetching them in chunks of the given size."""
+    size = size or current_app.config.get("DB_FETCH_SIZE")
+    while rows := cursor.fetchmany(size):
+        yield from rows
+
+
+def collect_colin_data(since: datetime | None = None):
+    """Collect data from COLIN (only the corps with an event after since if given)."""
     current_app.logger.debug("Connecting to Oracle instance...")
     cursor = oracle_db.connection.cursor()
+    # rows are read with fetchmany (see stream_rows)
+    cursor.arraysize = current_app.config.get("DB_FETCH_SIZE")
+    cursor.prefetchrows = cursor.arraysize + 1
     current_app.logger.debug("Collecting COLIN data...")
+    params = {}
+    since_filter = ""
+    if since:
+        # NB: also includes the corps whose good standing lapsed since then (based on the last AR date or, for
+        #     restored corps that still need a transition filing, a year after the restoration)
+        since_filter = """and (c.corp_num in (select corp_num from event where event_timestmp > :since)
+                 or add_months(nvl(c.last_ar_filed_dt, c.recognition_dts), 14) + 1 between :since and sysdate
+                 or (c.transition_dt is null and c.recognition_dts < date '2004-03-29'
+                     and c.corp_num in (select e.corp_num from event e join filing rf on rf.event_id = e.event_id
+                                        where rf.filing_typ_cd in ('RESTF','RESXF')
+                                            and add_months(rf.effective_dt, 12) between :since and sysdate)))"""
+        # the oracle session dates are local (see OracleDB init_session)
+        params["since"] = since.astimezone(ZoneInfo("America/Vancouver")).replace(tzinfo=None)
     cursor.execute(f"""
         SELECT c.corp_num as identifier, c.corp_typ_cd as legal_type, c.bn_15 as tax_id,
             c.last_ar_filed_dt as last_ar_date, c.recognition_dts as founding_date, c.transition_dt,
@@ -58,15 +85,28 @@ def collect_colin_data():
             and cs.end_event_id is null
             and cn.end_event_id is null
             and cn.corp_name_typ_cd in ('CO', 'NB')
-        """)
+            {since_filter}
+        ORDER BY c.corp_num, f.effective_dt DESC NULLS LAST
+        """, params)
     return cursor
 
 
-def collect_lear_data() -> CursorResult:
-    """Collect data from LEAR."""
+def collect_lear_data(since: datetime | None = None) -> CursorResult:
+    """Collect data from LEAR (only the businesses modified or with a filing completed after since if given)."""
     current_app.logger.debug("Connecting to LEAR Postgres instance...")
-    conn = lear_db.db.engine.connect()
+    # server side cursor so the rows can be streamed (see stream_rows)
+    conn = lear_db.db.engine.connect().execution_options(stream_results=True,
+                                                         max_row_buffer=current_app.config.get("DB_FETCH_SIZE"))
     current_app.logger.debug("Collecting LEAR data...")
+    params = {}
+    since_filter = ""
+    if since:
+        # NB: also includes the businesses whose good standing (based on the last AR date) lapsed since then
+        since_filter = """AND (b.last_modified > :since
+                 OR b.id in (SELECT business_id FROM filings WHERE completion_date > :since)
+                 OR COALESCE(b.last_ar_date, b.founding_date) + interval '1 year 2 months 1 day'
+                    BETWEEN :since AND now())"""
+        params["since"] = since
     return conn.execute(text(f"""
         SELECT b.identifier,b.legal_name,b.legal_type,b.tax_id,b.last_ar_date,
             b.founding_date,b.restoration_expiry_date,b.state,pr.role,
@@ -76,8 +116,10 @@ def collect_lear_data() -> CursorResult:
                        AND role in ('partner', 'proprietor')) as pr on pr.business_id = b.id
             LEFT JOIN parties p on p.id = pr.party_id
         WHERE b.identifier not in ({_get_stringified_list_for_sql('BUSINESSES_MANAGED_BY_COLIN')})
+            {since_filter}
+        ORDER BY b.identifier
         """
-    ))
+    ), params)
 
 
 def collect_lear_businesses_requiring_transition() -> CursorResult:
@@ -108,26 +150,36 @@ def collect_lear_businesses_requiring_transition() -> CursorResult:
     ))
 
 
-def collect_btr_data(limit: int | None = None, offset: int | None = None) -> CursorResult:
-    """Collect data from BTR."""
+def collect_btr_data(limit: int | None = None, last_person_id: int | None = None) -> CursorResult:
+    """Collect data from BTR.
+
+    With a limit, returns the page of (up to) limit persons after the last person id (keyset pagination on p.id).
+    All the rows of a person are in the same page.
+    """
+    params = {}
+    person_filter = "TRUE"
+    if last_person_id is not None:
+        person_filter = "p.id > :last_person_id"
+        params["last_person_id"] = last_person_id
     limit_clause = ""
     if limit:
-        limit_clause = f"LIMIT {limit}"
-    if offset:
-        limit_clause += f" OFFSET {offset}"
-    if limit_clause:
-        # NOTE: needed in order to make sure we get every record when doing batch loads
-        limit_clause = f"ORDER BY p.id {limit_clause}"
+        limit_clause = "ORDER BY p.id LIMIT :limit"
+        params["limit"] = limit
 
     current_app.logger.debug("Connecting to BTR Postgres instance...")
-    conn = btr_db.db.engine.connect()
+    conn = btr_db.db.engine.connect().execution_options(stream_results=True,
+                                                        max_row_buffer=current_app.config.get("DB_FETCH_SIZE"))
     current_app.logger.debug("Collecting BTR data...")
     return conn.execute(text(
         f"""
-        SELECT s.business_identifier, p.person_json
-        FROM submission s
-        JOIN ownership o on s.id = o.submission_id
-        JOIN person p on p.id = o.person_id
-        {limit_clause}
+        SELECT s.business_identifier, p.person_json, p.id as person_id
+        FROM (
+            SELECT p.id, p.person_json FROM person p
+            WHERE {person_filter}
+                AND EXISTS (SELECT 1 FROM ownership o WHERE o.person_id = p.id)
+            {limit_clause}
+        ) p
+        JOIN ownership o on p.id = o.person_id
+        JOIN submission s on s.id = o.submission_id
         """
-    ))
+    ), params)
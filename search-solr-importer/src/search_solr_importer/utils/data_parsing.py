@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Data parsing functions."""
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
+from itertools import batched, chain, groupby
 
 from datedelta import datedelta
 from flask import current_app
 
-from search_api.services.business_solr.doc_fields import PartyField
+from search_api.services.base_solr.utils import to_keyword
+from search_api.services.business_solr.doc_fields import BusinessField, PartyField
 from search_solr_importer.enums import ColinPartyTypeCode
 
 
@@ -161,7 +164,8 @@ def prep_data(data: list, data_descs: list[str], source: str, requires_transitio
                 "name": _get_business_name(item_dict),
                 "status": item_dict["state"],
                 "bn": item_dict["tax_id"],
-                "modernized": source != "COLIN"
+                "modernized": source != "COLIN",
+                BusinessField.NAME_KEYWORD.value: to_keyword(_get_business_name(item_dict))
             }
             if party_id:
                 # add party doc to base doc
@@ -192,6 +196,18 @@ def prep_data(data: list, data_descs: list[str], source: str, requires_transitio
     return solr_docs
 
 
+def chunk_rows(rows: Iterable, data_descs: list[str], size: int) -> Iterator[list]:
+    """Yield the raw db rows in chunks of (up to) size businesses.
+
+    The rows must be ordered by identifier so each business's rows are consecutive. A business is never split
+    across chunks so each chunk can be mapped with prep_data on its own.
+    """
+    identifier_index = list(data_descs).index("identifier")
+    businesses = groupby(rows, key=lambda row: row[identifier_index])
+    for chunk in batched((list(business_rows) for _, business_rows in businesses), size, strict=False):
+        yield list(chain.from_iterable(chunk))
+
+
 def prep_data_btr(data: list[dict], data_descs: list[str]) -> list[dict]:
     """Return the list of partial business docs containing the SI party information."""
     prepped_data: list[dict] = []
@@ -0,0 +1,141 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Import pipeline running the db readers, mappers and solr uploaders as stages connected by bounded queues."""
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from queue import Empty, Full, Queue
+
+from flask import Flask, current_app
+
+from .update_solr import get_import_headers, update_solr
+
+_DONE = object()  # sentinel telling a stage worker that there is no more work
+
+
+@dataclass
+class ImportSource:
+    """A data source of the import pipeline."""
+
+    name: str
+    # yields the chunks of raw data (the args for prep)
+    read: Callable[[], Iterator[tuple]]
+    # returns the docs to import for a chunk of raw data
+    prep: Callable[..., list[dict]]
+    partial: bool = False
+
+
+class ImportPipeline:
+    """Runs the sources through reader -> mapper -> uploader stages connected by bounded queues.
+
+    Each source gets its own reader thread (all sources given to run are read concurrently) and the mapper /
+    uploader threads are shared. A full queue blocks the stage feeding it, so at most queue_size chunks wait
+    between each stage. The first error stops every stage and is raised by run.
+    """
+
+    def __init__(self, app: Flask, queue_size: int, mappers: int, uploaders: int):
+        """Initialize the pipeline."""
+        self.app = app
+        self.mappers = mappers
+        self.uploaders = uploaders
+        self.prep_queue = Queue(maxsize=queue_size)
+        self.upload_queue = Queue(maxsize=queue_size)
+        self.stopped = threading.Event()
+        self.errors: list[Exception] = []
+        self.counts: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def run(self, sources: list[ImportSource]) -> dict[str, int]:
+        """Import the sources and return the number of docs imported for each source."""
+        self.counts = {source.name: 0 for source in sources}
+        readers = [self._start(self._read, source) for source in sources]
+        mappers = [self._start(self._prep) for _ in range(self.mappers)]
+        uploaders = [self._start(self._upload) for _ in range(self.uploaders)]
+        # each stage is finished once the stage before it is done and its queue is drained
+        self._finish(readers, self.prep_queue, len(mappers))
+        self._finish(mappers, self.upload_queue, len(uploaders))
+        self._finish(uploaders)
+        if self.errors:
+            raise self.errors[0]
+        return self.counts
+
+    def _start(self, stage: Callable, *args) -> threading.Thread:
+        """Start a worker thread for the stage."""
+        worker = threading.Thread(target=self._run_stage, args=(stage, *args), daemon=True)
+        worker.start()
+        return worker
+
+    def _run_stage(self, stage: Callable, *args):
+        """Run the stage in the app context (stopping the pipeline on failure)."""
+        with self.app.app_context():
+            try:
+                stage(*args)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                current_app.logger.error(f"Import pipeline stage {stage.__name__} failed: {err}")
+                with self._lock:
+                    self.errors.append(err)
+                self.stopped.set()
+
+    def _finish(self, workers: list[threading.Thread], queue: Queue | None = None, consumers: int = 0):
+        """Wait for the workers and then tell the consumers of their queue that they are done."""
+        for worker in workers:
+            worker.join()
+        for _ in range(consumers):
+            self._put(queue, _DONE)
+
+    def _put(self, queue: Queue, item) -> bool:
+        """Put the item on the queue, waiting while it is full. Returns False if the pipeline was stopped."""
+        while not self.stopped.is_set():
+            try:
+                queue.put(item, timeout=1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _get(self, queue: Queue):
+        """Return the next item on the queue (_DONE if the pipeline was stopped)."""
+        while not self.stopped.is_set():
+            try:
+                return queue.get(timeout=1)
+            except Empty:
+                continue
+        return _DONE
+
+    def _read(self, source: ImportSource):
+        """Read the chunks of the source onto the prep queue."""
+        start = time.perf_counter()
+        for chunk in source.read():
+            if not self._put(self.prep_queue, (source, chunk)):
+                break
+        current_app.logger.debug(f"{source.name} read completed in {time.perf_counter() - start:.2f}s.")
+
+    def _prep(self):
+        """Map the chunks on the prep queue to docs for the upload queue."""
+        while (item := self._get(self.prep_queue)) is not _DONE:
+            source, chunk = item
+            docs = source.prep(*chunk)
+            if docs and not self._put(self.upload_queue, (source, docs)):
+                return
+
+    def _upload(self):
+        """Import the docs on the upload queue into solr."""
+        headers = None if current_app.config.get("IMPORT_DIRECT_TO_SOLR") else get_import_headers()
+        while (item := self._get(self.upload_queue)) is not _DONE:
+            source, docs = item
+            count = update_solr(docs, source.name, source.partial, headers)
+            with self._lock:
+                self.counts[source.name] += count
+                current_app.logger.debug(f"Total {source.name} docs imported: {self.counts[source.name]}")
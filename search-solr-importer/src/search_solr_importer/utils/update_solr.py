@@ -11,19 +11,33 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Manages util methods for updating business solr via the reg search api."""
+"""Manages util methods for updating business solr via the reg search api (or directly)."""
+import functools
 import time
+from collections.abc import Callable, Iterable
+from datetime import datetime
 from http import HTTPStatus
+from itertools import batched
 
 import requests
 from flask import current_app
 
 from search_api.exceptions import SolrException
+from search_api.services import business_solr
 from search_api.services.authz import get_bearer_token
+from search_api.services.base_solr import CommitPolicy
+from search_api.services.business_solr.doc_fields import BusinessField
 
 
 def _get_wait_interval(err: Exception):
     """Return the base wait interval for the exception."""
+    if isinstance(err, requests.Timeout) or isinstance(err.__cause__, requests.Timeout):
+        # increased base wait time for a timed out request (the solr service raises it as the SolrException cause)
+        return 60
+    if isinstance(err, SolrException) and err.error.endswith(f", {HTTPStatus.REQUEST_TIMEOUT.value}"):
+        # increased base wait time for solr 408 error (direct import)
+        # NB: SolrException only keeps the status code of the solr response in the error
+        return 60
     if (isinstance(err.args, tuple | list) and
         err.args and
         isinstance(err.args[0], dict) and
@@ -34,41 +48,55 @@ def _get_wait_interval(err: Exception):
     return 20
 
 
-def update_solr(docs: list[dict], data_name: str, partial=False) -> int:
-    """Import data into solr."""
-    current_app.logger.debug("Getting token for Import...")
-    token = get_bearer_token()
-    headers = {"Authorization": "Bearer " + token}
-    current_app.logger.debug("Token set.")
+def _renew_token(headers: dict):
+    """Set a new bearer token in the headers."""
+    current_app.logger.debug("Getting new token for Import...")
+    headers["Authorization"] = "Bearer " + get_bearer_token()
+    current_app.logger.debug("New Token set.")
+
+
+def _api_import(docs: list[dict], partial: bool, headers: dict):
+    """Import the docs via the search api import endpoint."""
     api_url = current_app.config.get("SEARCH_API_URL")
+    import_resp = requests.put(url=f"{api_url}/internal/solr/import",
+                               headers=headers,
+                               json={"businesses": docs,
+                                     "timeout": "60",
+                                     "type": "partial" if partial else "full",
+                                     # committed once at the end of the import (see commit)
+                                     "commitPolicy": "explicit"},
+                               timeout=90)
+
+    if import_resp.status_code != HTTPStatus.CREATED:
+        if import_resp.status_code == HTTPStatus.UNAUTHORIZED:
+            # renew token for next try
+            _renew_token(headers)
+        # try again
+        raise Exception({"error": import_resp.json(), "status_code": import_resp.status_code})  # noqa: E501; pylint: disable=broad-exception-raised
+
+
+def _solr_import(docs: list[dict], partial: bool):
+    """Import the docs directly into the leader core."""
+    if not partial:
+        # replace the child party docs (same as BusinessSolr.create_or_replace_docs with additive=False)
+        docs = [{**doc, BusinessField.PARTIES.value: {"set": parties}}
+                if (parties := doc.get(BusinessField.PARTIES.value)) else doc for doc in docs]
+    # committed once at the end of the import (see commit)
+    business_solr.create_or_replace_docs(raw_docs=docs, timeout=60, commit_policy=CommitPolicy.EXPLICIT)
+
+
+def _import_batch(docs: list[dict], import_docs: Callable[[list[dict]], None], renew: Callable | None = None) -> int:
+    """Import the batch of docs (retrying with smaller pieces of the batch on failure)."""
     count = 0
     offset = 0
-    rows = current_app.config.get("BATCH_SIZE_SOLR", 1000)
-    if data_name == "BTR":
-        rows = current_app.config.get("BATCH_SIZE_SOLR_SI", 1000)
     retry_count = 0
-    while count < len(docs) and rows > 0 and len(docs) - offset > 0:
-        batch_amount = int(min(rows, len(docs) - offset) / (retry_count + 1))
+    while count < len(docs) and len(docs) - offset > 0:
+        batch_amount = int((len(docs) - offset) / (retry_count + 1))
         count += batch_amount
-        # call api import endpoint
+        # call the import (api endpoint or solr)
         try:
             current_app.logger.debug("Importing batch...")
-            import_resp = requests.put(url=f"{api_url}/internal/solr/import",
-                                       headers=headers,
-                                       json={"businesses": docs[offset:count],
-                                             "timeout": "60",
-                                             "type": "partial" if partial else "full"},
-                                       timeout=90)
-
-            if import_resp.status_code != HTTPStatus.CREATED:
-                if import_resp.status_code == HTTPStatus.UNAUTHORIZED:
-                    # renew token for next try
-                    current_app.logger.debug("Getting new token for Import...")
-                    token = get_bearer_token()
-                    headers = {"Authorization": "Bearer " + token}
-                    current_app.logger.debug("New Token set.")
-                # try again
-                raise Exception({"error": import_resp.json(), "status_code": import_resp.status_code})  # noqa: E501; pylint: disable=broad-exception-raised
+            import_docs(docs[offset:count])
             retry_count = 0
         except Exception as err:
             current_app.logger.debug(err)
@@ -88,11 +116,9 @@ def update_solr(docs: list[dict], data_name: str, partial=False) -> int:
                 current_app.logger.debug(
                     "Max retries for batch exceeded. Awaiting 2 mins before trying one more time...")
                 time.sleep(120)
-                # renew token for next try
-                current_app.logger.debug("Getting new token for Import...")
-                token = get_bearer_token()
-                headers = {"Authorization": "Bearer " + token}
-                current_app.logger.debug("New Token set.")
+                if renew:
+                    # renew token for next try
+                    renew()
                 # try again
                 retry_count += 1
                 count -= batch_amount
@@ -101,10 +127,78 @@ def update_solr(docs: list[dict], data_name: str, partial=False) -> int:
             current_app.logger.error("Retry count exceeded for batch.")
             raise SolrException("Retry count exceeded for updating SOLR. Aborting import.") from err
         offset = count
+    return count
+
+
+def get_import_headers() -> dict:
+    """Return the headers for the import requests."""
+    current_app.logger.debug("Getting token for Import...")
+    headers = {"Authorization": "Bearer " + get_bearer_token()}
+    current_app.logger.debug("Token set.")
+    return headers
+
+
+def update_solr(docs: Iterable[dict], data_name: str, partial=False, headers: dict | None = None) -> int:
+    """Import data into solr.
+
+    The docs can be a generator as only one batch of docs is held at a time. The headers (with a renewed token
+    after an auth failure) can be reused across calls. With IMPORT_DIRECT_TO_SOLR the docs are written straight
+    to the leader core (same retries) instead of through the search api.
+    """
+    if current_app.config.get("IMPORT_DIRECT_TO_SOLR"):
+        import_docs, renew = functools.partial(_solr_import, partial=partial), None
+    else:
+        headers = headers if headers is not None else get_import_headers()
+        import_docs = functools.partial(_api_import, partial=partial, headers=headers)
+        renew = functools.partial(_renew_token, headers)
+    count = 0
+    rows = current_app.config.get("BATCH_SIZE_SOLR", 1000)
+    if data_name == "BTR":
+        rows = current_app.config.get("BATCH_SIZE_SOLR_SI", 1000)
+    for batch in batched(docs, rows, strict=False):
+        count += _import_batch(list(batch), import_docs, renew)
         current_app.logger.debug(f"Total batch {data_name} doc records imported: {count}")
     return count
 
 
+def commit():
+    """Commit the imported docs on the leader to make them visible to search."""
+    if current_app.config.get("IMPORT_DIRECT_TO_SOLR"):
+        business_solr.commit()
+        return
+
+    current_app.logger.debug("Getting token for Commit...")
+    token = get_bearer_token()
+    headers = {"Authorization": "Bearer " + token}
+
+    api_url = current_app.config.get("SEARCH_API_URL")
+    commit_resp = requests.post(url=f"{api_url}/internal/solr/import/commit", headers=headers, json={}, timeout=200)
+    if commit_resp.status_code != HTTPStatus.OK:
+        raise SolrException(f"Commit failed: {commit_resp.status_code}, {commit_resp.json()}")
+
+
+def get_watermarks() -> dict[str, datetime]:
+    """Return the import watermark of each source (where the last delta import left off)."""
+    api_url = current_app.config.get("SEARCH_API_URL")
+    resp = requests.get(url=f"{api_url}/internal/solr/import/watermarks", headers=get_import_headers(), timeout=30)
+    if resp.status_code != HTTPStatus.OK:
+        raise SolrException(f"Failed to get the import watermarks: {resp.status_code}, {resp.json()}")
+    return {watermark["source"]: datetime.fromisoformat(watermark["watermark"])
+            for watermark in resp.json()["watermarks"]}
+
+
+def set_watermarks(watermarks: dict[str, datetime]):
+    """Set the import watermarks of the given sources."""
+    api_url = current_app.config.get("SEARCH_API_URL")
+    resp = requests.put(url=f"{api_url}/internal/solr/import/watermarks",
+                        headers=get_import_headers(),
+                        json={"watermarks": {source: watermark.isoformat()
+                                             for source, watermark in watermarks.items()}},
+                        timeout=30)
+    if resp.status_code != HTTPStatus.OK:
+        raise SolrException(f"Failed to set the import watermarks: {resp.status_code}, {resp.json()}")
+
+
 def resync():
     """Resync to catch any records that had an update during the import."""
     current_app.logger.debug("Getting token for Resync...")
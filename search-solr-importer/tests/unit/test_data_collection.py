@@ -0,0 +1,123 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the data collection queries are built as expected."""
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+
+from search_solr_importer.utils import data_collection
+
+
+class FakeConnection:
+    """Records the queries executed on a db connection / cursor."""
+
+    def __init__(self):
+        """Initialize the connection."""
+        self.executed = []
+
+    def cursor(self):
+        """Return the connection as the (oracle) cursor."""
+        return self
+
+    def execution_options(self, **_):
+        """Return the connection."""
+        return self
+
+    def execute(self, query, params):
+        """Record the query and its params."""
+        self.executed.append((str(query), params))
+        return self
+
+
+@pytest.fixture
+def colin_conn(monkeypatch):
+    """Return the fake COLIN (oracle) connection used by the data collection functions."""
+    conn = FakeConnection()
+    monkeypatch.setattr(data_collection, 'oracle_db', SimpleNamespace(connection=conn))
+    return conn
+
+
+@pytest.fixture
+def lear_conn(monkeypatch):
+    """Return the fake LEAR connection used by the data collection functions."""
+    conn = FakeConnection()
+    monkeypatch.setattr(data_collection, 'lear_db', SimpleNamespace(db=SimpleNamespace(
+        engine=SimpleNamespace(connect=lambda: conn))))
+    return conn
+
+
+@pytest.mark.parametrize('test_name,since,expected_params', [
+    ('full', None, {}),
+    # the oracle session dates are local
+    ('delta_pst', datetime(2025, 1, 15, 20, 30, tzinfo=UTC), {'since': datetime(2025, 1, 15, 12, 30)}),
+    ('delta_pdt', datetime(2025, 7, 15, 20, 30, tzinfo=UTC), {'since': datetime(2025, 7, 15, 13, 30)}),
+])
+def test_collect_colin_data(app, colin_conn, test_name, since, expected_params):
+    """Assert the COLIN query only filters on the since date for a delta import."""
+    data_collection.collect_colin_data(since)
+
+    assert len(colin_conn.executed) == 1
+    query, params = colin_conn.executed[0]
+    assert params == expected_params
+    if since:
+        assert 'event_timestmp > :since' in query
+        # the corps whose good standing lapsed since then
+        assert 'add_months(nvl(c.last_ar_filed_dt, c.recognition_dts), 14) + 1 between :since and sysdate' in query
+        # the restored corps whose transition deadline passed since then
+        assert "c.transition_dt is null and c.recognition_dts < date '2004-03-29'" in query
+        assert 'add_months(rf.effective_dt, 12) between :since and sysdate' in query
+    else:
+        assert ':since' not in query
+
+
+@pytest.mark.parametrize('test_name,since', [
+    ('full', None),
+    ('delta', datetime(2025, 1, 15, 20, 30, tzinfo=UTC)),
+])
+def test_collect_lear_data(app, lear_conn, test_name, since):
+    """Assert the LEAR query only filters on the since date for a delta import."""
+    data_collection.collect_lear_data(since)
+
+    assert len(lear_conn.executed) == 1
+    query, params = lear_conn.executed[0]
+    if since:
+        assert params == {'since': since}
+        assert 'b.last_modified > :since' in query
+        assert 'completion_date > :since' in query
+        # the businesses whose good standing lapsed since then
+        assert "+ interval '1 year 2 months 1 day'" in query
+    else:
+        assert params == {}
+        assert ':since' not in query
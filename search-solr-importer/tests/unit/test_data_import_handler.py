@@ -32,8 +32,200 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 """Test Suite to ensure reindexing works as expected."""
+import time
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+import data_import_handler
+from search_solr_importer.utils import ImportPipeline, ImportSource
+from search_solr_importer.utils import pipeline as pipeline_module
+
+
+class FakeCursor:
+    """Cursor over a page of rows (as returned by the db collection functions)."""
+
+    def __init__(self, descs: list[str], rows: list[tuple]):
+        """Initialize the cursor."""
+        self.descs = descs
+        self.rows = rows
+        self.closed = False
+
+    def keys(self):
+        """Return the column names."""
+        return self.descs
+
+    def fetchmany(self, size: int):
+        """Return the next size rows."""
+        rows, self.rows = self.rows[:size], self.rows[size:]
+        return rows
+
+    def close(self):
+        """Close the cursor."""
+        self.closed = True
+
 
 def test_data_import_handler(app):
     """Secure the data import functionality."""
     # TODO: mock data / solr etc. and run
-    assert True
\ No newline at end of file
+    assert True
+
+
+@pytest.mark.parametrize('test_name,batch_limit,person_ids,expected_calls', [
+    ('no_limit', None, [1, 2, 3, 4, 5], [(None, None)]),
+    ('partial_last_page', 2, [1, 2, 3, 4, 5], [(2, None), (2, 2), (2, 4)]),
+    ('empty_last_page', 2, [1, 2, 3, 4], [(2, None), (2, 2), (2, 4)]),
+    ('one_page', 10, [1, 2, 3], [(10, None)]),
+    ('no_persons', 2, [], [(2, None)]),
+])
+def test_btr_source(app, monkeypatch, test_name, batch_limit, person_ids, expected_calls):
+    """Assert the BTR source pages through the persons by person id until a page is not full."""
+    descs = ['person_id', 'identifier']
+    # 2 rows per person (a person can be a significant individual of multiple businesses)
+    rows = [(person_id, f'BC{person_id}{i}') for person_id in person_ids for i in range(2)]
+    calls = []
+    cursors = []
+
+    def collect_btr_data(limit, last_person_id):
+        calls.append((limit, last_person_id))
+        page_ids = [person_id for person_id in person_ids if last_person_id is None or person_id > last_person_id]
+        page_ids = page_ids[:limit] if limit else page_ids
+        cursors.append(FakeCursor(descs, [row for row in rows if row[0] in page_ids]))
+        return cursors[-1]
+
+    monkeypatch.setattr(data_import_handler, 'collect_btr_data', collect_btr_data)
+    monkeypatch.setitem(app.config, 'BTR_BATCH_LIMIT', batch_limit)
+    monkeypatch.setitem(app.config, 'DB_FETCH_SIZE', 3)
+
+    source = data_import_handler.btr_source()
+    chunks = list(source.read())
+
+    assert calls == expected_calls
+    assert [row for btr_data, _ in chunks for row in btr_data] == rows
+    assert all(chunk_descs == descs for _, chunk_descs in chunks)
+    assert all(cursor.closed for cursor in cursors)
+    assert source.partial
+
+
+@pytest.fixture
+def import_calls(app, monkeypatch):
+    """Mock the import steps of load_search_core and return the calls made to them (in order)."""
+    calls = []
+
+    def source(name):
+        def new_source(since=None):
+            calls.append((f'{name}_source', since))
+            return ImportSource(name, list, list)
+        return new_source
+
+    def run(sources):
+        calls.append(('run', [source.name for source in sources]))
+        return {source.name: 1 for source in sources}
+
+    monkeypatch.setattr(data_import_handler, 'get_watermarks', dict)
+    monkeypatch.setattr(data_import_handler, 'colin_source', source('COLIN'))
+    monkeypatch.setattr(data_import_handler, 'lear_source', source('LEAR'))
+    monkeypatch.setattr(data_import_handler, 'new_pipeline', lambda: SimpleNamespace(run=run))
+    monkeypatch.setattr(data_import_handler, 'resync', lambda: calls.append(('resync', None)))
+    monkeypatch.setattr(data_import_handler, 'commit', lambda: calls.append(('commit', None)))
+    monkeypatch.setattr(data_import_handler, 'set_watermarks', lambda marks: calls.append(('set_watermarks', marks)))
+    for key, value in [('REINDEX_CORE', False), ('INCLUDE_BTR_LOAD', False), ('INCLUDE_COLIN_LOAD', True),
+                       ('INCLUDE_LEAR_LOAD', True), ('DELTA_IMPORT_OVERLAP', 60)]:
+        monkeypatch.setitem(app.config, key, value)
+    return calls
+
+
+WATERMARK = datetime(2025, 1, 15, 20, 30, tzinfo=UTC)
+
+
+@pytest.mark.parametrize('test_name,delta,watermarks,expected_since', [
+    ('full', False, {'COLIN': WATERMARK, 'LEAR': WATERMARK}, {'COLIN': None, 'LEAR': None}),
+    ('delta', True, {'COLIN': WATERMARK, 'LEAR': WATERMARK + timedelta(hours=1)},
+     {'COLIN': WATERMARK - timedelta(minutes=60), 'LEAR': WATERMARK}),
+    ('delta_first_import', True, {}, {'COLIN': None, 'LEAR': None}),
+    ('delta_new_source', True, {'COLIN': WATERMARK}, {'COLIN': WATERMARK - timedelta(minutes=60), 'LEAR': None}),
+])
+def test_load_search_core(app, monkeypatch, import_calls, test_name, delta, watermarks, expected_since):
+    """Assert the sources are imported since their watermark (less the overlap) and then the watermarks are set."""
+    monkeypatch.setitem(app.config, 'DELTA_IMPORT', delta)
+    monkeypatch.setattr(data_import_handler, 'get_watermarks', lambda: watermarks)
+    start = datetime.now(UTC)
+
+    data_import_handler.load_search_core()
+
+    assert import_calls[:-1] == [('COLIN_source', expected_since['COLIN']),
+                                 ('LEAR_source', expected_since['LEAR']),
+                                 ('run', ['COLIN']),
+                                 ('run', ['LEAR']),
+                                 ('resync', None),
+                                 ('commit', None)]
+    name, marks = import_calls[-1]
+    assert name == 'set_watermarks'
+    assert list(marks) == ['COLIN', 'LEAR']
+    # the watermarks are the time the import started (so changes made during the import are picked up next time)
+    assert all(start <= mark <= datetime.now(UTC) for mark in marks.values())
+    assert marks['COLIN'] == marks['LEAR']
+
+
+def test_load_search_core_commit_failed(app, monkeypatch, import_calls):
+    """Assert the watermarks are not set when the final commit fails."""
+    monkeypatch.setitem(app.config, 'DELTA_IMPORT', True)
+
+    def commit():
+        import_calls.append(('commit', None))
+        raise ValueError('commit failed')
+
+    monkeypatch.setattr(data_import_handler, 'commit', commit)
+
+    data_import_handler.load_search_core()
+
+    assert import_calls[-1] == ('commit', None)
+    assert 'set_watermarks' not in [name for name, _ in import_calls]
+
+
+def test_load_search_core_import_failed(app, monkeypatch, import_calls):
+    """Assert nothing is committed and the watermarks are not set when the import fails."""
+    monkeypatch.setitem(app.config, 'DELTA_IMPORT', True)
+
+    def run(sources):
+        import_calls.append(('run', [source.name for source in sources]))
+        raise ValueError('import failed')
+
+    monkeypatch.setattr(data_import_handler, 'new_pipeline', lambda: SimpleNamespace(run=run))
+
+    with pytest.raises(ValueError, match='import failed'):
+        data_import_handler.load_search_core()
+
+    assert import_calls[-1] == ('run', ['COLIN'])
+
+
+def test_load_search_core_lear_last(app, monkeypatch, import_calls):
+    """Assert a business in both COLIN and LEAR (i.e. migrated) ends up with the LEAR doc."""
+    solr_docs = {}
+
+    def update_solr(docs, data_name, partial, headers):
+        solr_docs.update({doc['id']: doc for doc in docs})
+        return len(docs)
+
+    def colin_prep(ids):
+        # slower than LEAR so its docs would be uploaded last if the sources were imported together
+        time.sleep(0.2)
+        return [{'id': doc_id, 'source': 'COLIN'} for doc_id in ids]
+
+    def source(name, ids, prep):
+        return lambda since=None: ImportSource(name, lambda: iter([(ids,)]), prep)
+
+    monkeypatch.setattr(pipeline_module, 'update_solr', update_solr)
+    monkeypatch.setattr(pipeline_module, 'get_import_headers', dict)
+    monkeypatch.setattr(data_import_handler, 'new_pipeline',
+                        lambda: ImportPipeline(app, queue_size=2, mappers=2, uploaders=2))
+    monkeypatch.setattr(data_import_handler, 'colin_source', source('COLIN', ['BC1', 'BC2'], colin_prep))
+    monkeypatch.setattr(data_import_handler, 'lear_source', source(
+        'LEAR', ['BC2', 'BC3'], lambda ids: [{'id': doc_id, 'source': 'LEAR'} for doc_id in ids]))
+
+    data_import_handler.load_search_core()
+
+    assert solr_docs == {'BC1': {'id': 'BC1', 'source': 'COLIN'},
+                         'BC2': {'id': 'BC2', 'source': 'LEAR'},
+                         'BC3': {'id': 'BC3', 'source': 'LEAR'}}
@@ -0,0 +1,57 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the raw data is parsed as expected."""
+import pytest
+
+from search_solr_importer.utils import chunk_rows
+
+ROWS = [('BC0000001', 1), ('BC0000001', 2), ('BC0000002', 3), ('FM0000003', 4), ('FM0000003', 5), ('FM0000003', 6)]
+
+
+@pytest.mark.parametrize('test_name,size,expected', [
+    ('one_business', 1, [['BC0000001', 'BC0000001'], ['BC0000002'], ['FM0000003', 'FM0000003', 'FM0000003']]),
+    ('two_businesses', 2, [['BC0000001', 'BC0000001', 'BC0000002'], ['FM0000003', 'FM0000003', 'FM0000003']]),
+    ('all_businesses', 10, [[row[0] for row in ROWS]]),
+])
+def test_chunk_rows(test_name, size, expected):
+    """Assert the rows are chunked by business and a business is never split across chunks."""
+    chunks = list(chunk_rows(iter(ROWS), ['identifier', 'party_id'], size))
+    assert [[row[0] for row in chunk] for chunk in chunks] == expected
+    # every row is kept (in order)
+    assert [row for chunk in chunks for row in chunk] == ROWS
+
+
+def test_chunk_rows_empty():
+    """Assert no chunks are returned when there are no rows."""
+    assert list(chunk_rows(iter([]), ['identifier', 'party_id'], 10)) == []
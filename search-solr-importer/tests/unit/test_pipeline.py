@@ -0,0 +1,144 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the import pipeline works as expected."""
+import threading
+from itertools import count
+
+import pytest
+
+from search_solr_importer.utils import ImportPipeline, ImportSource
+from search_solr_importer.utils import pipeline as pipeline_module
+
+
+@pytest.fixture
+def uploads(monkeypatch):
+    """Return the (docs, data_name, partial) of each mocked update_solr call."""
+    calls = []
+    lock = threading.Lock()
+
+    def update_solr(docs, data_name, partial, headers):
+        with lock:
+            calls.append((docs, data_name, partial))
+        return len(docs)
+
+    monkeypatch.setattr(pipeline_module, 'update_solr', update_solr)
+    monkeypatch.setattr(pipeline_module, 'get_import_headers', lambda: {})
+    return calls
+
+
+def _source(name: str, chunks, partial=False, prep=None) -> ImportSource:
+    """Return a source reading the given chunks of ids (mapped to a doc per id by default)."""
+    return ImportSource(name,
+                        lambda: ([chunk] for chunk in chunks),
+                        prep or (lambda ids: [{'id': doc_id} for doc_id in ids]),
+                        partial)
+
+
+def _run(pipeline: ImportPipeline, sources: list[ImportSource]):
+    """Run the pipeline in a thread and return the counts or the error raised (fails if the pipeline hangs)."""
+    result = {}
+
+    def run():
+        try:
+            result['counts'] = pipeline.run(sources)
+        except Exception as err:
+            result['error'] = err
+
+    runner = threading.Thread(target=run, daemon=True)
+    runner.start()
+    runner.join(timeout=30)
+    assert not runner.is_alive(), 'pipeline did not stop'
+    return result
+
+
+@pytest.mark.parametrize('test_name,queue_size,mappers,uploaders', [
+    ('single_workers', 1, 1, 1),
+    ('multiple_workers', 2, 3, 2),
+])
+def test_pipeline_counts(app, uploads, test_name, queue_size, mappers, uploaders):
+    """Assert every chunk of every source is imported and counted per source."""
+    colin_chunks = [[f'BC{i}{j}' for j in range(3)] for i in range(5)]
+    sources = [_source('COLIN', colin_chunks),
+               _source('LEAR', [['CP1', 'CP2']]),
+               _source('BTR', [['FM1']], partial=True),
+               _source('EMPTY', [[]])]
+
+    result = _run(ImportPipeline(app, queue_size, mappers, uploaders), sources)
+
+    assert result == {'counts': {'COLIN': 15, 'LEAR': 2, 'BTR': 1, 'EMPTY': 0}}
+    colin_ids = sorted(doc['id'] for docs, name, _ in uploads if name == 'COLIN' for doc in docs)
+    assert colin_ids == sorted(doc_id for chunk in colin_chunks for doc_id in chunk)
+    # chunks with no docs are not uploaded and the partial flag is passed along
+    assert sorted((name, partial) for _, name, partial in uploads if name != 'COLIN') == [('BTR', True),
+                                                                                          ('LEAR', False)]
+
+
+@pytest.mark.parametrize('test_name,failing_stage', [
+    ('read', 'read'),
+    ('prep', 'prep'),
+    ('upload', 'upload'),
+])
+def test_pipeline_error(app, monkeypatch, test_name, failing_stage):
+    """Assert a failing stage stops every stage (even with an endless source) and the error is raised."""
+    error = ValueError(f'{failing_stage} failed')
+
+    def read():
+        for i in count():
+            if failing_stage == 'read' and i == 3:
+                raise error
+            yield ([f'BC{i}'],)
+
+    def prep(ids):
+        if failing_stage == 'prep':
+            raise error
+        return [{'id': doc_id} for doc_id in ids]
+
+    def update_solr(docs, data_name, partial, headers):
+        if failing_stage == 'upload':
+            raise error
+        return len(docs)
+
+    monkeypatch.setattr(pipeline_module, 'update_solr', update_solr)
+    monkeypatch.setattr(pipeline_module, 'get_import_headers', lambda: {})
+    pipeline = ImportPipeline(app, queue_size=1, mappers=2, uploaders=2)
+    if failing_stage == 'read':
+        # a second (endless) source is still stopped
+        sources = [ImportSource('COLIN', read, prep), _source('LEAR', iter(lambda: ['CP1'], None))]
+    else:
+        sources = [ImportSource('COLIN', read, prep)]
+
+    result = _run(pipeline, sources)
+
+    assert result == {'error': error}
+    assert pipeline.stopped.is_set()
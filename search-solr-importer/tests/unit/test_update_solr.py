@@ -0,0 +1,174 @@
+# Copyright © 2025 Province of British Columbia
+#
+# Licensed under the BSD 3 Clause License, (the "License");
+# you may not use this file except in compliance with the License.
+# The template for the license can be found here
+#    https://opensource.org/license/bsd-3-clause/
+#
+# Redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the
+# following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS “AS IS”
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""Test Suite to ensure the solr updates (via the search api or directly) work as expected."""
+import importlib
+from http import HTTPStatus
+
+import pytest
+import requests
+
+from search_api.exceptions import SolrException
+from search_api.services.base_solr import CommitPolicy
+from search_solr_importer.utils import commit, update_solr
+
+
+# NB: the utils package exports the update_solr function under the module name
+update_solr_module = importlib.import_module('search_solr_importer.utils.update_solr')
+
+
+class FakeSolr:
+    """Records the calls made to the business solr service."""
+
+    def __init__(self, errors: list[Exception] | None = None):
+        """Initialize the fake (raising the given errors on the first update calls)."""
+        self.errors = errors or []
+        self.updates = []
+        self.commits = 0
+
+    def create_or_replace_docs(self, raw_docs: list[dict], timeout: int, commit_policy: CommitPolicy):
+        """Record the update."""
+        if self.errors:
+            raise self.errors.pop(0)
+        self.updates.append((raw_docs, timeout, commit_policy))
+
+    def commit(self):
+        """Record the commit."""
+        self.commits += 1
+
+
+def _solr_timeout() -> SolrException:
+    """Return the error raised by the solr service when the request times out."""
+    err = SolrException(error='Error handling Solr request.', status_code=HTTPStatus.INTERNAL_SERVER_ERROR)
+    err.__cause__ = requests.ReadTimeout('Read timed out.')
+    return err
+
+
+@pytest.fixture
+def solr(app, monkeypatch):
+    """Return the fake solr service used for the direct imports (the search api must not be called)."""
+    def no_api(*args, **kwargs):
+        raise AssertionError('the search api was called')
+
+    fake_solr = FakeSolr()
+    monkeypatch.setattr(update_solr_module, 'business_solr', fake_solr)
+    monkeypatch.setattr(update_solr_module, 'get_bearer_token', no_api)
+    monkeypatch.setattr(update_solr_module.requests, 'put', no_api)
+    monkeypatch.setattr(update_solr_module.requests, 'post', no_api)
+    monkeypatch.setitem(app.config, 'IMPORT_DIRECT_TO_SOLR', True)
+    return fake_solr
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Return the seconds of each (mocked) wait between retries."""
+    waits = []
+    monkeypatch.setattr(update_solr_module.time, 'sleep', waits.append)
+    return waits
+
+
+@pytest.mark.parametrize('test_name,partial,docs,expected', [
+    ('full', False,
+     [{'id': 'FM1', 'parties': [{'id': '1'}]}, {'id': 'BC1'}],
+     [{'id': 'FM1', 'parties': {'set': [{'id': '1'}]}}, {'id': 'BC1'}]),
+    ('full_no_parties', False, [{'id': 'BC1', 'parties': []}], [{'id': 'BC1', 'parties': []}]),
+    ('partial', True,
+     [{'id': 'BC1', 'parties': {'add': [{'id': '1'}]}}],
+     [{'id': 'BC1', 'parties': {'add': [{'id': '1'}]}}]),
+])
+def test_solr_import(app, solr, test_name, partial, docs, expected):
+    """Assert full docs replace their parties and the docs are committed with the final commit."""
+    update_solr_module._solr_import(docs, partial)
+
+    assert solr.updates == [(expected, 60, CommitPolicy.EXPLICIT)]
+
+
+def test_update_solr_direct(app, monkeypatch, solr, sleeps):
+    """Assert the docs are imported straight into solr in batches."""
+    monkeypatch.setitem(app.config, 'BATCH_SIZE_SOLR', 2)
+    docs = [{'id': f'BC{i}'} for i in range(5)]
+
+    count = update_solr((doc for doc in docs), 'COLIN')
+
+    assert count == 5
+    assert [raw_docs for raw_docs, _, _ in solr.updates] == [docs[:2], docs[2:4], docs[4:]]
+    assert not sleeps
+
+
+@pytest.mark.parametrize('test_name,error,expected_wait', [
+    ('timeout', _solr_timeout(), 60),
+    ('solr_408', SolrException(error='Timeout', status_code=HTTPStatus.REQUEST_TIMEOUT), 60),
+    ('solr_error', SolrException(error='Error handling Solr request.', status_code=HTTPStatus.BAD_REQUEST), 20),
+])
+def test_update_solr_direct_retry(app, solr, sleeps, test_name, error, expected_wait):
+    """Assert a failed direct import is retried with a smaller batch after waiting (longer for timeouts)."""
+    solr.errors = [error, error]
+    docs = [{'id': f'BC{i}'} for i in range(4)]
+
+    count = update_solr(docs, 'COLIN')
+
+    assert count == 4
+    assert sleeps == [expected_wait, expected_wait * 2]
+    # retried with a third of the batch and then the rest of it
+    assert [len(raw_docs) for raw_docs, _, _ in solr.updates] == [1, 3]
+
+
+def test_update_solr_direct_retries_exceeded(app, solr, sleeps):
+    """Assert the import is aborted once the retries for a batch are used up."""
+    solr.errors = [_solr_timeout() for _ in range(7)]
+
+    with pytest.raises(SolrException):
+        update_solr([{'id': f'BC{i}'} for i in range(10)], 'COLIN')
+
+    assert sleeps == [60, 120, 180, 240, 300, 120]
+    assert not solr.updates
+
+
+def test_commit_direct(app, solr):
+    """Assert the final commit is sent straight to solr."""
+    commit()
+
+    assert solr.commits == 1
+
+
+@pytest.mark.parametrize('test_name,error,expected_wait', [
+    ('request_timeout', requests.ReadTimeout('Read timed out.'), 60),
+    ('solr_timeout', _solr_timeout(), 60),
+    ('solr_408', SolrException(error='Timeout', status_code=HTTPStatus.REQUEST_TIMEOUT), 60),
+    ('api_408', Exception({'error': {'detail': 'Solr error, 408'}, 'status_code': 500}), 60),
+    ('solr_error', SolrException(error='Error', status_code=HTTPStatus.BAD_REQUEST), 20),
+    ('api_error', Exception({'error': {'message': 'error'}, 'status_code': 500}), 20),
+])
+def test_get_wait_interval(test_name, error, expected_wait):
+    """Assert timeouts wait longer before retrying."""
+    assert update_solr_module._get_wait_interval(error) == expected_wait